@@ -6,6 +6,7 @@ from datetime import date, datetime, timedelta
 
 from app.models.analytics import (
     AnomalyResponse,
+    StoreAnomalyResponse,
     CorrelationResponse,
     PatternResponse,
     AnalyticsFilterParams
@@ -33,7 +34,7 @@ async def detect_anomalies(
     - **days**: 조회할 최근 일수 (start_date가 지정되지 않은 경우에만 사용)
     - **store_name**: 매장 이름 필터 (여러 매장 지정 가능)
     - **metric**: 분석할 지표 (total_sales, transactions, avg_transaction)
-    - **method**: 이상치 감지 방법 (zscore, iqr)
+    - **method**: 이상치 감지 방법 (zscore, iqr, seasonal=요일별 median/MAD 기준선)
     - **threshold**: 이상치 감지 임계값
     """
     # 날짜 범위 결정
@@ -52,6 +53,56 @@ async def detect_anomalies(
         threshold
     )
 
+@router.get("/anomalies/stores", response_model=StoreAnomalyResponse)
+async def detect_store_anomalies(
+    start_date: Optional[date] = Query(None, description="조회 시작 날짜"),
+    end_date: Optional[date] = Query(None, description="조회 종료 날짜"),
+    days: Optional[int] = Query(30, description="최근 일수 (start_date가 None인 경우)"),
+    store_name: Optional[List[str]] = Query(None, description="매장 이름 필터"),
+    metrics: Optional[List[str]] = Query(None, description="분석할 지표 리스트"),
+    threshold: float = Query(3.5, description="robust z-score 임계값"),
+    anomalies_only: bool = Query(False, description="이상치만 반환")
+):
+    """
+    모든 매장과 지표의 이상치를 요일별 기준선(median/MAD)으로 일괄 감지합니다.
+    
+    - **start_date**: 조회 시작 날짜 (지정하지 않으면 최근 days일 기준)
+    - **end_date**: 조회 종료 날짜 (지정하지 않으면 오늘)
+    - **days**: 조회할 최근 일수 (start_date가 지정되지 않은 경우에만 사용)
+    - **store_name**: 매장 이름 필터 (지정하지 않으면 모든 매장 및 전체 합계)
+    - **metrics**: 분석할 지표 (total_sales, actual_sales, transactions, avg_transaction)
+    - **threshold**: robust z-score 임계값 (기본값: 3.5)
+    - **anomalies_only**: 이상치로 판정된 포인트만 반환
+    """
+    # 날짜 범위 결정
+    if not end_date:
+        end_date = date.today()
+        
+    if not start_date:
+        start_date, _ = get_recent_periods(end_date=end_date, days=days)
+    
+    return await analytics_service.detect_store_anomalies(
+        start_date,
+        end_date,
+        store_name,
+        metrics,
+        threshold,
+        anomalies_only
+    )
+
+@router.get("/anomalies/latest", response_model=StoreAnomalyResponse)
+async def get_latest_anomalies(
+    anomalies_only: bool = Query(False, description="이상치만 반환")
+):
+    """
+    가장 최근 적재일의 매장/지표별 이상치를 조회합니다.
+    
+    과거 이력은 다시 계산하지 않고 새로 적재된 날짜만 증분 처리합니다.
+    
+    - **anomalies_only**: 이상치로 판정된 포인트만 반환
+    """
+    return await analytics_service.get_latest_anomalies(anomalies_only)
+
 @router.get("/correlations", response_model=CorrelationResponse)
 async def analyze_correlations(
     start_date: Optional[date] = Query(None, description="조회 시작 날짜"),
@@ -0,0 +1,42 @@
+## dashboard.py
+
+from fastapi import APIRouter, Query
+from typing import List, Optional
+from datetime import date
+
+from app.models.dashboard import DashboardBundle
+from app.services.dashboard_service import dashboard_service
+from app.core.responses import model_response
+from app.utils.date_utils import get_recent_periods
+
+router = APIRouter()
+
+@router.get("/bundle", response_model=DashboardBundle)
+async def get_dashboard_bundle(
+    start_date: Optional[date] = Query(None, description="조회 시작 날짜"),
+    end_date: Optional[date] = Query(None, description="조회 종료 날짜"),
+    days: Optional[int] = Query(7, description="최근 일수 (start_date가 None인 경우)"),
+    store_name: Optional[List[str]] = Query(None, description="매장 이름 필터"),
+    limit: int = Query(20, description="제품별 매출 상위 제품 수 제한")
+):
+    """
+    대시보드 첫 화면 위젯(KPI 요약, 일별·시간대별·제품별·결제 유형별 매출)을 한 번에 조회합니다.
+    
+    각 항목은 /kpi/summary, /sales/daily, /sales/hourly, /sales/products, /sales/payment_types
+    응답과 같으며, 테이블마다 한 번의 집계 쿼리로 계산합니다.
+    
+    - **start_date**: 조회 시작 날짜 (지정하지 않으면 최근 days일 기준)
+    - **end_date**: 조회 종료 날짜 (지정하지 않으면 오늘)
+    - **days**: 조회할 최근 일수 (start_date가 지정되지 않은 경우에만 사용)
+    - **store_name**: 매장 이름 필터 (여러 매장 지정 가능)
+    - **limit**: 제품별 매출 상위 제품 수 제한 (기본값: 20)
+    """
+    # 날짜 범위 결정
+    if not end_date:
+        end_date = date.today()
+        
+    if not start_date:
+        start_date, _ = get_recent_periods(end_date=end_date, days=days)
+    
+    bundle = await dashboard_service.get_bundle(start_date, end_date, store_name, limit)
+    return model_response(bundle, DashboardBundle)
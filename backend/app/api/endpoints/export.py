@@ -0,0 +1,62 @@
+## export.py
+
+from fastapi import APIRouter, Path, Query, HTTPException
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+from datetime import date
+
+from app.services.export_service import ARROW_FORMATS, EXPORT_MEDIA_TYPES, ExportFormat, export_service
+from app.utils.date_utils import get_recent_periods
+
+router = APIRouter()
+
+@router.get("/", response_model=List[dict])
+@router.get("", response_model=List[dict])
+async def list_exports():
+    """
+    내보낼 수 있는 원천·집계 테이블과 컬럼 목록을 조회합니다.
+    """
+    return export_service.list_sources()
+
+@router.get("/{table}")
+async def export_table(
+    table: str = Path(..., description="내보낼 테이블 (receipt_sales_detail, daily_sales_summary, daily_store_sales 등)"),
+    start_date: Optional[date] = Query(None, description="조회 시작 날짜"),
+    end_date: Optional[date] = Query(None, description="조회 종료 날짜"),
+    days: Optional[int] = Query(30, description="최근 일수 (start_date가 None인 경우)"),
+    store_name: Optional[List[str]] = Query(None, description="매장 이름 필터"),
+    file_format: ExportFormat = Query(ExportFormat.ARROW, alias="format", description="내보내기 형식 (arrow, parquet, ndjson, csv)")
+):
+    """
+    테이블 데이터를 Arrow IPC 스트림, Parquet, NDJSON 또는 CSV로 내보냅니다.
+
+    DB 커서에서 배치 단위로 읽어 클라이언트가 받는 속도에 맞춰 전송하므로
+    긴 기간도 메모리 사용량이 일정합니다.
+
+    - **table**: 내보낼 테이블 (목록은 GET /export 참고)
+    - **start_date**: 조회 시작 날짜 (지정하지 않으면 최근 days일 기준)
+    - **end_date**: 조회 종료 날짜 (지정하지 않으면 오늘)
+    - **days**: 조회할 최근 일수 (start_date가 지정되지 않은 경우에만 사용)
+    - **store_name**: 매장 이름 필터 (여러 매장 지정 가능)
+    - **format**: 내보내기 형식 (arrow: Arrow IPC 스트림, parquet: Parquet, ndjson: 줄 단위 JSON, csv: CSV)
+    """
+    source = export_service.get_source(table)
+    if source is None or not export_service.source_ready(source):
+        raise HTTPException(status_code=404, detail=f"내보낼 수 없는 테이블입니다: {table}")
+    if file_format in ARROW_FORMATS and not export_service.arrow_available():
+        raise HTTPException(status_code=501, detail=f"{file_format.value} 내보내기에는 pyarrow 패키지가 필요합니다.")
+
+    # 날짜 범위 결정
+    if not end_date:
+        end_date = date.today()
+
+    if not start_date:
+        start_date, _ = get_recent_periods(end_date=end_date, days=days)
+
+    media_type, extension = EXPORT_MEDIA_TYPES[file_format]
+    filename = f"{table}_{start_date.isoformat()}_{end_date.isoformat()}.{extension}"
+    return StreamingResponse(
+        export_service.stream(source, start_date, end_date, store_name, file_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -12,6 +12,7 @@ from app.models.kpi import (
     KPIFilterParams
 )
 from app.services.kpi_service import kpi_service
+from app.core.responses import ResponseFormat, chart_response
 from app.utils.date_utils import get_recent_periods
 
 router = APIRouter()
@@ -46,7 +47,8 @@ async def get_kpi_trends(
     end_date: Optional[date] = Query(None, description="조회 종료 날짜"),
     days: Optional[int] = Query(30, description="최근 일수 (start_date가 None인 경우)"),
     store_name: Optional[List[str]] = Query(None, description="매장 이름 필터"),
-    metric: str = Query("total_sales", description="조회할 지표")
+    metric: str = Query("total_sales", description="조회할 지표"),
+    response_format: ResponseFormat = Query(ResponseFormat.ROWS, alias="format", description="응답 형식 (rows, columnar)")
 ):
     """
     일별 KPI 트렌드를 조회합니다.
@@ -56,6 +58,7 @@ async def get_kpi_trends(
     - **days**: 조회할 최근 일수 (start_date가 지정되지 않은 경우에만 사용)
     - **store_name**: 매장 이름 필터 (여러 매장 지정 가능)
     - **metric**: 조회할 지표 (total_sales, transactions, avg_transaction 등)
+    - **format**: 응답 형식 (rows: 객체 배열, columnar: 필드별 배열)
     """
     # 날짜 범위 결정
     if not end_date:
@@ -64,7 +67,8 @@ async def get_kpi_trends(
     if not start_date:
         start_date, _ = get_recent_periods(end_date=end_date, days=days)
     
-    return await kpi_service.get_kpi_trends(start_date, end_date, store_name, metric)
+    result = await kpi_service.get_kpi_trends(start_date, end_date, store_name, metric)
+    return chart_response(result, KPITrend, response_format)
 
 @router.get("/products", response_model=List[ProductKPI])
 async def get_product_kpi(
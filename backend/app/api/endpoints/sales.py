@@ -2,9 +2,11 @@
 
 from fastapi import APIRouter, Query, Depends
 from typing import List, Optional
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
+import logging
 
 from app.models.sales import (
+    ComparePeriod,
     DailySalesResponse, 
     HourlySalesResponse,
     ProductSalesResponse,
@@ -13,8 +15,12 @@ from app.models.sales import (
     HourlyProductSalesResponse
 )
 from app.services.sales_service import sales_service
+from app.services.dashboard_service import dashboard_service
+from app.core.responses import ORJSONResponse, ResponseFormat, chart_response, model_response
 from app.utils.date_utils import get_recent_periods
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 @router.get("/daily", response_model=List[DailySalesResponse])
@@ -22,7 +28,8 @@ async def get_daily_sales(
     start_date: Optional[date] = Query(None, description="조회 시작 날짜"),
     end_date: Optional[date] = Query(None, description="조회 종료 날짜"),
     days: Optional[int] = Query(7, description="최근 일수 (start_date가 None인 경우)"),
-    store_name: Optional[List[str]] = Query(None, description="매장 이름 필터")
+    store_name: Optional[List[str]] = Query(None, description="매장 이름 필터"),
+    response_format: ResponseFormat = Query(ResponseFormat.ROWS, alias="format", description="응답 형식 (rows, columnar)")
 ):
     """
     일별 매출 데이터를 조회합니다.
@@ -31,28 +38,23 @@ async def get_daily_sales(
     - **end_date**: 조회 종료 날짜 (지정하지 않으면 오늘)
     - **days**: 조회할 최근 일수 (start_date가 지정되지 않은 경우에만 사용)
     - **store_name**: 매장 이름 필터 (여러 매장 지정 가능)
+    - **format**: 응답 형식 (rows: 객체 배열, columnar: 필드별 배열)
     """
-    import logging
-    logger = logging.getLogger("sales_api")
-    logger.setLevel(logging.INFO)
-    
-    # 요청 파라미터 로깅
-    logger.info(f"일별 매출 API 요청: start_date={start_date}, end_date={end_date}, days={days}, store_name={store_name}")
-    
     # 날짜 범위 결정
     if not end_date:
         end_date = date.today()
-        logger.info(f"종료일 미지정, 기본값 사용: {end_date}")
         
     if not start_date:
         start_date, _ = get_recent_periods(end_date=end_date, days=days)
-        logger.info(f"시작일 미지정, {days}일 전으로 계산: {start_date}")
+    
+    logger.debug("일별 매출 API 요청: start_date=%s, end_date=%s, store_name=%s", start_date, end_date, store_name)
     
     try:
         results = await sales_service.get_daily_sales(start_date, end_date, store_name)
-        logger.info(f"API 응답 데이터 개수: {len(results)}")
-        logger.info(f"API 응답 샘플: {[r.dict() for r in results[:2]] if results else '데이터 없음'}")
-        return results
+        # 응답 샘플은 DEBUG에서만 직렬화
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("API 응답 데이터 개수: %d, 샘플: %s", len(results), [r.model_dump() for r in results[:2]])
+        return chart_response(results, List[DailySalesResponse], response_format)
     except Exception as e:
         logger.error(f"API 처리 중 오류 발생: {str(e)}")
         logger.exception(e)
@@ -63,7 +65,8 @@ async def get_hourly_sales(
     start_date: Optional[date] = Query(None, description="조회 시작 날짜"),
     end_date: Optional[date] = Query(None, description="조회 종료 날짜"),
     days: Optional[int] = Query(7, description="최근 일수 (start_date가 None인 경우)"),
-    store_name: Optional[List[str]] = Query(None, description="매장 이름 필터")
+    store_name: Optional[List[str]] = Query(None, description="매장 이름 필터"),
+    response_format: ResponseFormat = Query(ResponseFormat.ROWS, alias="format", description="응답 형식 (rows, columnar)")
 ):
     """
     시간대별 매출 데이터를 조회합니다.
@@ -72,6 +75,7 @@ async def get_hourly_sales(
     - **end_date**: 조회 종료 날짜 (지정하지 않으면 오늘)
     - **days**: 조회할 최근 일수 (start_date가 지정되지 않은 경우에만 사용)
     - **store_name**: 매장 이름 필터 (여러 매장 지정 가능)
+    - **format**: 응답 형식 (rows: 객체 배열, columnar: 필드별 배열)
     """
     # 날짜 범위 결정
     if not end_date:
@@ -80,7 +84,8 @@ async def get_hourly_sales(
     if not start_date:
         start_date, _ = get_recent_periods(end_date=end_date, days=days)
     
-    return await sales_service.get_hourly_sales(start_date, end_date, store_name)
+    result = await sales_service.get_hourly_sales(start_date, end_date, store_name)
+    return chart_response(result, List[HourlySalesResponse], response_format)
 
 @router.get("/products", response_model=List[ProductSalesResponse])
 async def get_product_sales(
@@ -138,7 +143,8 @@ async def get_sales_comparison(
     end_date: Optional[date] = Query(None, description="조회 종료 날짜"),
     days: Optional[int] = Query(7, description="최근 일수 (start_date가 None인 경우)"),
     store_name: Optional[List[str]] = Query(None, description="매장 이름 필터"),
-    compare_with: Optional[str] = Query("previous_period", description="비교 기준 (previous_period, previous_year)")
+    compare_with: Optional[str] = Query("previous_period", description="비교 기준 (previous_period, previous_year, two_years_ago)"),
+    periods: Optional[List[ComparePeriod]] = Query(None, description="여러 비교 기준 (지정 시 comparison_periods에 기준별 결과 포함)")
 ):
     """
     매출 비교 데이터를 조회합니다.
@@ -147,14 +153,15 @@ async def get_sales_comparison(
     - **end_date**: 조회 종료 날짜 (지정하지 않으면 오늘)
     - **days**: 조회할 최근 일수 (start_date가 지정되지 않은 경우에만 사용)
     - **store_name**: 매장 이름 필터 (여러 매장 지정 가능)
-    - **compare_with**: 비교 기준 (previous_period: 이전 기간, previous_year: 전년 동기)
+    - **compare_with**: 비교 기준 (previous_period: 이전 기간, previous_year: 전년 동기, two_years_ago: 2년 전 동기)
+    - **periods**: 여러 비교 기준 (예: periods=previous_period&periods=previous_year&periods=two_years_ago).
+      지정하면 모든 기간을 동시에 조회하고 comparison_periods에 기준별 합계와 변화량을 반환하며,
+      comparison_period와 changes는 첫 번째 기준의 결과입니다.
     """
-    import logging
-    logger = logging.getLogger("sales_api")
-    logger.setLevel(logging.INFO)
-    
-    # 로깅
-    logger.info(f"매출 비교 API 요청: start_date={start_date}, end_date={end_date}, days={days}, store_name={store_name}, compare_with={compare_with}")
+    logger.debug(
+        "매출 비교 API 요청: start_date=%s, end_date=%s, days=%s, store_name=%s, compare_with=%s, periods=%s",
+        start_date, end_date, days, store_name, compare_with, periods
+    )
     
     # 날짜 범위 결정
     if not end_date:
@@ -163,70 +170,37 @@ async def get_sales_comparison(
     if not start_date:
         start_date, _ = get_recent_periods(end_date=end_date, days=days)
     
-    # 현재 기간 매출 데이터 조회
-    current_period_data = await sales_service.get_daily_sales(start_date, end_date, store_name)
-    
-    # 비교 기간 계산
-    period_length = (end_date - start_date).days + 1
-    
-    if compare_with == "previous_year":
-        # 전년 동기 계산
-        prev_start_date = date(start_date.year - 1, start_date.month, start_date.day)
-        prev_end_date = date(end_date.year - 1, end_date.month, end_date.day)
-    else:  # "previous_period"
-        # 이전 기간 계산
-        prev_end_date = start_date - timedelta(days=1)
-        prev_start_date = prev_end_date - timedelta(days=period_length - 1)
-    
-    # 비교 기간 매출 데이터 조회
-    comparison_period_data = await sales_service.get_daily_sales(prev_start_date, prev_end_date, store_name)
+    # 비교 기준 결정 (알 수 없는 compare_with는 이전 기간)
+    if not periods:
+        try:
+            compare_periods = [ComparePeriod(compare_with)]
+        except ValueError:
+            compare_periods = [ComparePeriod.PREVIOUS_PERIOD]
+    else:
+        compare_periods = list(dict.fromkeys(periods))
     
-    # 현재 기간 합계 계산
-    current_total_sales = sum(item.total_sales for item in current_period_data)
-    current_actual_sales = sum(item.actual_sales for item in current_period_data)
-    current_discount = sum(item.total_discount for item in current_period_data)
-    current_transactions = sum(item.transaction_count for item in current_period_data)
+    # 현재 기간과 비교 기간을 동시에 조회
+    comparison = await sales_service.get_sales_comparison(start_date, end_date, store_name, compare_periods)
+    current_period = comparison["current_period"]
+    first_period = comparison["comparison_periods"][0]
     
-    # 비교 기간 합계 계산
-    comparison_total_sales = sum(item.total_sales for item in comparison_period_data)
-    comparison_actual_sales = sum(item.actual_sales for item in comparison_period_data)
-    comparison_discount = sum(item.total_discount for item in comparison_period_data)
-    comparison_transactions = sum(item.transaction_count for item in comparison_period_data)
-    
-    # 변화율 계산
-    sales_change_pct = ((current_actual_sales - comparison_actual_sales) / comparison_actual_sales * 100) if comparison_actual_sales else 0
-    transaction_change_pct = ((current_transactions - comparison_transactions) / comparison_transactions * 100) if comparison_transactions else 0
-    
-    # 결과 반환
+    # 결과 반환 (comparison_period, changes는 첫 번째 비교 기준)
     result = {
-        "current_period": {
-            "start_date": start_date,
-            "end_date": end_date,
-            "total_sales": current_total_sales,
-            "actual_sales": current_actual_sales,
-            "total_discount": current_discount,
-            "transaction_count": current_transactions,
-            "daily_data": current_period_data
-        },
+        "current_period": current_period,
         "comparison_period": {
-            "start_date": prev_start_date,
-            "end_date": prev_end_date,
-            "total_sales": comparison_total_sales,
-            "actual_sales": comparison_actual_sales,
-            "total_discount": comparison_discount,
-            "transaction_count": comparison_transactions,
-            "daily_data": comparison_period_data
+            key: value for key, value in first_period.items()
+            if key not in ("compare_with", "changes")
         },
-        "changes": {
-            "sales_change": current_actual_sales - comparison_actual_sales,
-            "sales_change_percentage": round(sales_change_pct, 2),
-            "transaction_change": current_transactions - comparison_transactions,
-            "transaction_change_percentage": round(transaction_change_pct, 2)
-        }
+        "changes": first_period["changes"]
     }
+    if periods:
+        result["comparison_periods"] = comparison["comparison_periods"]
     
-    logger.info(f"매출 비교 API 응답: 현재기간 매출={current_actual_sales}, 비교기간 매출={comparison_actual_sales}, 변화율={sales_change_pct}%")
-    return result
+    logger.debug(
+        "매출 비교 API 응답: 현재기간 매출=%s, 비교기간 매출=%s, 변화율=%s%%",
+        current_period["actual_sales"], first_period["actual_sales"], first_period["changes"]["sales_change_percentage"]
+    )
+    return ORJSONResponse(result)
 
 @router.post("/filter", response_model=dict)
 async def filter_sales_data(filter_params: SalesFilterParams):
@@ -240,30 +214,19 @@ async def filter_sales_data(filter_params: SalesFilterParams):
     - **payment_type**: 결제 유형 필터 (옵션)
     - **product_code**: 제품 코드 필터 (옵션)
     """
-    daily_sales = await sales_service.get_daily_sales(
-        filter_params.start_date, 
-        filter_params.end_date, 
-        filter_params.store_name
-    )
-    
-    product_sales = await sales_service.get_product_sales(
+    # 일별·제품별·결제 유형별 매출을 테이블별 한 번의 조회로 계산 (대시보드 묶음 조회 공유)
+    bundle = await dashboard_service.get_bundle(
         filter_params.start_date, 
         filter_params.end_date, 
         filter_params.store_name, 
-        limit=10  # 상위 10개만
-    )
-    
-    payment_type_sales = await sales_service.get_payment_type_sales(
-        filter_params.start_date, 
-        filter_params.end_date, 
-        filter_params.store_name
+        product_limit=10  # 상위 10개만
     )
     
     # 응답 데이터 구성
     return {
-        "daily_sales": daily_sales,
-        "product_sales": product_sales,
-        "payment_type_sales": payment_type_sales
+        "daily_sales": bundle.daily_sales,
+        "product_sales": bundle.product_sales,
+        "payment_type_sales": bundle.payment_type_sales
     }
 
 @router.get("/test-connection", response_model=dict)
@@ -271,12 +234,8 @@ async def test_database_connection():
     """
     데이터베이스 연결 테스트 및 데이터 확인을 위한 테스트 엔드포인트
     """
-    import logging
     from app.core.database import get_table, Tables
     
-    logger = logging.getLogger("db_test")
-    logger.setLevel(logging.INFO)
-    
     results = {}
     
     try:
@@ -330,4 +289,5 @@ async def get_hourly_product_sales(
         end_date = date.today()
     if not start_date:
         start_date, _ = get_recent_periods(end_date=end_date, days=days)
-    return await sales_service.get_hourly_product_sales(start_date, end_date, store_name)
\ No newline at end of file
+    result = await sales_service.get_hourly_product_sales(start_date, end_date, store_name)
+    return model_response(result, List[HourlyProductSalesResponse])
\ No newline at end of file
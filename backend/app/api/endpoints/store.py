@@ -20,15 +20,12 @@ async def get_stores():
         List[StoreListResponse]: 매장 목록
     """
     try:
-        logger.info("매장 목록 조회 API 요청")
         stores = await store_service.get_stores()
-        logger.info(f"매장 목록 조회 성공: {len(stores)}개 매장 반환")
         
-        # 중복된 매장 정보 확인 및 로깅
-        store_names = [store.name for store in stores]
-        unique_store_names = list(set(store_names))
-        logger.info(f"조회된 매장 이름: {store_names}")
-        logger.info(f"고유한 매장 이름: {unique_store_names}")
+        # 중복된 매장 정보 확인 및 로깅 (DEBUG에서만)
+        if logger.isEnabledFor(logging.DEBUG):
+            store_names = [store.name for store in stores]
+            logger.debug("매장 목록 조회 성공: %d개 매장, 이름: %s, 고유 이름: %s", len(stores), store_names, sorted(set(store_names)))
         
         # 정상 반환
         return stores
@@ -50,9 +47,8 @@ async def get_store_by_name(
         StoreDetailResponse: 매장 상세 정보
     """
     try:
-        logger.info(f"매장 '{store_name}' 상세 정보 조회 API 요청")
         store = await store_service.get_store_by_name(store_name)
-        logger.info(f"매장 '{store_name}' 상세 정보 조회 성공")
+        logger.debug("매장 '%s' 상세 정보 조회 성공", store_name)
         return store
     except HTTPException:
         raise
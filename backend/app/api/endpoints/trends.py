@@ -8,9 +8,12 @@ from app.models.trends import (
     TimeSeriesResponse,
     ForecastResponse,
     SeasonalityResponse,
+    DecompositionResponse,
     TrendFilterParams
 )
 from app.services.trends_service import trends_service
+from app.core.responses import ResponseFormat, chart_response
+from app.services.seasonal_decomposition import seasonal_decomposition_service
 from app.utils.date_utils import get_recent_periods
 
 router = APIRouter()
@@ -21,7 +24,8 @@ async def get_time_series(
     end_date: Optional[date] = Query(None, description="조회 종료 날짜"),
     days: Optional[int] = Query(90, description="최근 일수 (start_date가 None인 경우)"),
     store_name: Optional[List[str]] = Query(None, description="매장 이름 필터"),
-    metric: str = Query("total_sales", description="분석할 지표")
+    metric: str = Query("total_sales", description="분석할 지표"),
+    response_format: ResponseFormat = Query(ResponseFormat.ROWS, alias="format", description="응답 형식 (rows, columnar)")
 ):
     """
     시계열 데이터를 조회하고 트렌드를 분석합니다.
@@ -31,6 +35,7 @@ async def get_time_series(
     - **days**: 조회할 최근 일수 (start_date가 지정되지 않은 경우에만 사용)
     - **store_name**: 매장 이름 필터 (여러 매장 지정 가능)
     - **metric**: 분석할 지표 (total_sales, transactions, avg_transaction 등)
+    - **format**: 응답 형식 (rows: 객체 배열, columnar: 필드별 배열)
     """
     # 날짜 범위 결정
     if not end_date:
@@ -39,12 +44,13 @@ async def get_time_series(
     if not start_date:
         start_date, _ = get_recent_periods(end_date=end_date, days=days)
     
-    return await trends_service.get_time_series(
+    result = await trends_service.get_time_series(
         start_date, 
         end_date, 
         store_name, 
         metric
     )
+    return chart_response(result, TimeSeriesResponse, response_format)
 
 @router.get("/forecast", response_model=ForecastResponse)
 async def get_forecast(
@@ -53,7 +59,9 @@ async def get_forecast(
     days: Optional[int] = Query(90, description="최근 일수 (start_date가 None인 경우)"),
     forecast_days: int = Query(30, description="예측할 미래 일수"),
     store_name: Optional[List[str]] = Query(None, description="매장 이름 필터"),
-    metric: str = Query("total_sales", description="예측할 지표")
+    metric: str = Query("total_sales", description="예측할 지표"),
+    method: Optional[str] = Query(None, description="예측 방법"),
+    response_format: ResponseFormat = Query(ResponseFormat.ROWS, alias="format", description="응답 형식 (rows, columnar)")
 ):
     """
     시계열 데이터 예측을 수행합니다.
@@ -64,6 +72,8 @@ async def get_forecast(
     - **forecast_days**: 예측할 미래 일수 (기본값: 30)
     - **store_name**: 매장 이름 필터 (여러 매장 지정 가능)
     - **metric**: 예측할 지표 (total_sales, transactions, avg_transaction 등)
+    - **method**: 예측 방법 (holt_winters, linear_weekday, seasonal_naive, arima / 기본값: holt_winters)
+    - **format**: 응답 형식 (rows: 객체 배열, columnar: 필드별 배열)
     """
     # 날짜 범위 결정
     if not end_date:
@@ -72,13 +82,15 @@ async def get_forecast(
     if not start_date:
         start_date, _ = get_recent_periods(end_date=end_date, days=days)
     
-    return await trends_service.get_forecast(
+    result = await trends_service.get_forecast(
         start_date, 
         end_date, 
         forecast_days,
         store_name, 
-        metric
+        metric,
+        method
     )
+    return chart_response(result, ForecastResponse, response_format)
 
 @router.get("/seasonality", response_model=SeasonalityResponse)
 async def get_seasonality(
@@ -114,6 +126,37 @@ async def get_seasonality(
         metric
     )
 
+@router.get("/decomposition", response_model=DecompositionResponse)
+async def get_decomposition(
+    start_date: Optional[date] = Query(None, description="조회 시작 날짜"),
+    end_date: Optional[date] = Query(None, description="조회 종료 날짜"),
+    days: Optional[int] = Query(365, description="최근 일수 (start_date가 None인 경우)"),
+    store_name: Optional[List[str]] = Query(None, description="매장 이름 필터"),
+    metric: str = Query("total_sales", description="분해할 지표")
+):
+    """
+    시계열을 추세·주간·연간·잔차 성분으로 분해한 결과를 조회합니다.
+    
+    - **start_date**: 조회 시작 날짜 (지정하지 않으면 최근 days일 기준)
+    - **end_date**: 조회 종료 날짜 (지정하지 않으면 오늘)
+    - **days**: 조회할 최근 일수 (start_date가 지정되지 않은 경우에만 사용)
+    - **store_name**: 매장 이름 필터 (단일 매장·전체 매장은 미리 계산된 결과 사용)
+    - **metric**: 분해할 지표 (total_sales, actual_sales, transactions, avg_transaction)
+    """
+    # 날짜 범위 결정
+    if not end_date:
+        end_date = date.today()
+        
+    if not start_date:
+        start_date, _ = get_recent_periods(end_date=end_date, days=days)
+    
+    return await seasonal_decomposition_service.get_decomposition(
+        start_date,
+        end_date,
+        store_name,
+        metric
+    )
+
 @router.post("/filter", response_model=dict)
 async def filter_trends_data(filter_params: TrendFilterParams):
     """
@@ -1,7 +1,7 @@
 ## router.py
 
 from fastapi import APIRouter
-from app.api.endpoints import sales, kpi, analytics, compare, trends, notice, store, ai, summary
+from app.api.endpoints import sales, kpi, analytics, compare, trends, notice, store, ai, summary, export, dashboard
 
 # 메인 API 라우터
 api_router = APIRouter()
@@ -16,3 +16,5 @@ api_router.include_router(notice.router, prefix="/notice", tags=["notice"])
 api_router.include_router(store.router, prefix="/stores", tags=["stores"])
 api_router.include_router(ai.router, prefix="/ai", tags=["ai"])
 api_router.include_router(summary.router, prefix="/summary", tags=["summary"])
+api_router.include_router(export.router, prefix="/export", tags=["export"])
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
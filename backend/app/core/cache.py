@@ -0,0 +1,365 @@
+## cache.py
+
+"""
+서비스 공용 결과 캐시
+
+집계·분석 서비스 메서드의 결과를 요청 파라미터 기준으로 저장합니다.
+- LRU + 항목별 TTL, 항목 수와 바이트(pickle 크기) 상한
+- 캐시 키: 네임스페이스 + 정규화된 호출 인자
+- 항목마다 의존 범위(테이블, 날짜 구간, 매장)를 함께 저장하고, 데이터 변경 알림
+  (app.core.data_version)을 받으면 변경 범위와 겹치는 항목만 제거합니다.
+- 캐시에 없는 같은 키의 호출이 동시에 들어오면 하나만 계산하고 나머지는 그 결과를
+  함께 기다립니다. (app.core.single_flight)
+- SHARED_CACHE_ENABLED이면 프로세스 캐시에 없을 때 다른 워커 프로세스가 계산한 결과를
+  공유 캐시에서 찾고, 새로 계산한 결과도 공유 캐시에 저장합니다. (app.core.shared_cache)
+
+캐시된 객체는 호출자 간에 공유되므로 반환값을 수정하지 않아야 합니다.
+"""
+
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Optional, Sequence, Tuple
+import functools
+import inspect
+import logging
+import pickle
+import sys
+import threading
+import time
+
+from pydantic import BaseModel
+
+from app.core import log_policy
+from app.core.config import settings
+from app.core.data_version import DataChange, data_version_bus
+from app.core.shared_cache import shared_cache
+from app.core.single_flight import single_flight
+
+logger = logging.getLogger(__name__)
+
+
+class DataScope:
+    """캐시 항목이 의존하는 데이터 범위 (None은 해당 축 전체)"""
+
+    __slots__ = ("tables", "start_date", "end_date", "store_names")
+
+    def __init__(
+        self,
+        tables: Optional[Sequence[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        store_names: Optional[FrozenSet[str]] = None
+    ):
+        self.tables = tables
+        self.start_date = start_date
+        self.end_date = end_date
+        self.store_names = store_names
+
+    def affected_by(self, change: DataChange) -> bool:
+        return change.affects(self.tables, self.start_date, self.end_date, self.store_names)
+
+
+class _CacheEntry:
+    __slots__ = ("value", "size", "expires_at", "scope")
+
+    def __init__(self, value: Any, size: int, expires_at: float, scope: Optional[DataScope]):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.scope = scope
+
+
+class ResultCache:
+    """크기·TTL 제한이 있는 LRU 결과 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries: int, max_bytes: int, default_ttl: float):
+        """
+        Args:
+            max_entries: 최대 항목 수
+            max_bytes: 저장 값의 pickle 크기 합계 상한
+            default_ttl: 기본 만료 시간(초)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "oversized": 0, "invalidations": 0}
+        self._namespace_stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        try:
+            return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return sys.getsizeof(value)
+
+    def _count(self, namespace: Optional[str], field: str):
+        self.stats[field] += 1
+        if namespace is not None:
+            counters = self._namespace_stats.setdefault(namespace, {"hits": 0, "misses": 0})
+            counters[field] = counters.get(field, 0) + 1
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def get(self, key: Hashable, namespace: Optional[str] = None) -> Tuple[bool, Any]:
+        """
+        캐시 조회
+
+        Returns:
+            (적중 여부, 값)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.stats["expirations"] += 1
+                entry = None
+            if entry is None:
+                self._count(namespace, "misses")
+                return False, None
+            self._entries.move_to_end(key)
+            self._count(namespace, "hits")
+            return True, entry.value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        scope: Optional[DataScope] = None
+    ) -> None:
+        """
+        캐시 저장 (상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거)
+
+        Args:
+            scope: 의존 데이터 범위 (None이면 모든 데이터 변경 시 제거)
+        """
+        size = self._sizeof(value)
+        with self._lock:
+            if size > self.max_bytes:
+                self.stats["oversized"] += 1
+                return
+            if key in self._entries:
+                self._remove(key)
+            ttl = self.default_ttl if ttl is None else ttl
+            self._entries[key] = _CacheEntry(value, size, time.monotonic() + ttl, scope)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.stats["evictions"] += 1
+
+    def invalidate(self, namespace: Optional[str] = None) -> int:
+        """
+        캐시 무효화
+
+        Args:
+            namespace: 무효화할 네임스페이스 (None이면 전체)
+
+        Returns:
+            제거된 항목 수
+        """
+        with self._lock:
+            if namespace is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return removed
+            keys = [key for key in self._entries if key[0] == namespace]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def evict_expired(self) -> int:
+        """
+        만료된 항목 제거 (조회 시 제거되지 않고 남아 있는 항목, 스케줄러 작업)
+
+        Returns:
+            제거된 항목 수
+        """
+        now = time.monotonic()
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+            for key in keys:
+                self._remove(key)
+            self.stats["expirations"] += len(keys)
+        return len(keys)
+
+    def on_data_change(self, change: DataChange) -> int:
+        """
+        데이터 변경 구독자 - 변경 범위와 겹치는 항목만 제거
+
+        Returns:
+            제거된 항목 수
+        """
+        with self._lock:
+            keys = [
+                key for key, entry in self._entries.items()
+                if entry.scope is None or entry.scope.affected_by(change)
+            ]
+            for key in keys:
+                self._remove(key)
+            self.stats["invalidations"] += len(keys)
+        if keys:
+            logger.info(f"데이터 변경으로 결과 캐시 {len(keys)}건 무효화 (버전 {change.version})")
+        return len(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 상태 및 적중률"""
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "default_ttl": self.default_ttl,
+                **self.stats,
+                "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+                "namespaces": {name: dict(counters) for name, counters in self._namespace_stats.items()},
+                "data_version": data_version_bus.current,
+            }
+
+
+def _normalize(value: Any) -> Hashable:
+    """캐시 키용 인자 정규화 (날짜는 ISO 문자열, 목록은 튜플, Enum은 값)"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, BaseModel):
+        return _normalize(value.model_dump())
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _normalize(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((_normalize(v) for v in value), key=repr))
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(v) for v in value)
+    return repr(value)
+
+
+def _normalize_store_name(value: Any) -> Hashable:
+    """매장 필터는 순서·중복과 무관하게 같은 키 (빈 목록은 전체 매장과 동일)"""
+    if not value:
+        return None
+    if isinstance(value, str):
+        return (value,)
+    return tuple(sorted(set(value)))
+
+
+# 서비스 공용 캐시 인스턴스
+result_cache = ResultCache(
+    max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RESULT_CACHE_MAX_BYTES,
+    default_ttl=settings.RESULT_CACHE_TTL
+)
+data_version_bus.subscribe(result_cache.on_data_change)
+
+
+def _scope_date(value: Any) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
+
+def cached(
+    namespace: str,
+    ttl: Optional[float] = None,
+    tables: Optional[Sequence[str]] = None,
+    stores_param: Optional[str] = "store_name",
+    lookback_days: int = 0
+) -> Callable:
+    """
+    비동기 서비스 메서드 결과 캐시 데코레이터
+
+    @staticmethod 아래에 적용합니다.
+
+        @staticmethod
+        @cached("sales.get_daily_sales", tables=(Tables.DAILY_SALES_SUMMARY,))
+        async def get_daily_sales(...): ...
+
+    의존 범위는 start_date/end_date 인자와 매장 인자로 정하며, 날짜 인자가 없으면
+    모든 데이터 변경 시 무효화됩니다. 캐시를 끄더라도(RESULT_CACHE_ENABLED=false)
+    SINGLE_FLIGHT_ENABLED이면 동시에 진행 중인 같은 호출은 합칩니다.
+
+    Args:
+        namespace: 캐시 네임스페이스 (무효화 단위)
+        ttl: 만료 시간(초), None이면 RESULT_CACHE_TTL
+        tables: 조회하는 테이블 (None이면 모든 매출 테이블)
+        stores_param: 매장 필터 인자 이름 (None이면 항상 전체 매장에 의존, 예: 매장 간 비교)
+        lookback_days: start_date 이전에 추가로 조회하는 일수 (기준선 계산 등)
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cache_enabled = settings.RESULT_CACHE_ENABLED
+            if not cache_enabled and not settings.SINGLE_FLIGHT_ENABLED:
+                return await func(*args, **kwargs)
+
+            # 새 데이터 변경이 있으면 먼저 구독자(무효화)를 실행
+            version = data_version_bus.poll()
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            params = tuple(
+                (name, _normalize_store_name(value) if name == stores_param else _normalize(value))
+                for name, value in arguments.items()
+            )
+            key = (namespace, params)
+
+            if cache_enabled:
+                found, value = result_cache.get(key, namespace)
+                if found:
+                    log_policy.count("cache_hits")
+                    return value
+
+            start_date = _scope_date(arguments.get("start_date"))
+            end_date = _scope_date(arguments.get("end_date"))
+            scope = None
+            if start_date is not None and end_date is not None:
+                stores = _normalize_store_name(arguments.get(stores_param)) if stores_param else None
+                scope = DataScope(
+                    tables=tables,
+                    start_date=start_date - timedelta(days=lookback_days),
+                    end_date=end_date,
+                    store_names=frozenset(stores) if stores else None
+                )
+            use_shared = cache_enabled and settings.SHARED_CACHE_ENABLED
+
+            async def compute() -> Any:
+                # 다른 워커 프로세스가 계산한 결과
+                if use_shared:
+                    found, value = shared_cache.get(key, version)
+                    if found:
+                        result_cache.set(key, value, ttl, scope)
+                        return value
+
+                value = await func(*args, **kwargs)
+
+                # 계산 도중 데이터가 바뀌었으면 저장하지 않음
+                if cache_enabled and data_version_bus.current == version:
+                    result_cache.set(key, value, ttl, scope)
+                    if use_shared:
+                        shared_cache.set(key, value, version, settings.RESULT_CACHE_TTL if ttl is None else ttl, scope)
+                return value
+
+            # 같은 데이터 버전에서 진행 중인 같은 호출이 있으면 그 결과를 기다림
+            if settings.SINGLE_FLIGHT_ENABLED:
+                return await single_flight.do((key, version), compute, namespace)
+            return await compute()
+
+        wrapper.cache_namespace = namespace
+        return wrapper
+
+    return decorator
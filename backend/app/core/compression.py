@@ -0,0 +1,255 @@
+## compression.py
+
+"""
+응답 압축 (gzip, brotli)
+
+시간대별·제품별 응답은 같은 키가 반복되는 수백 KB의 JSON이라 압축률이 높습니다.
+ResponseCompressionMiddleware는 Accept-Encoding에 따라 brotli(설치된 경우) 또는 gzip으로
+응답 본문을 압축합니다.
+
+- COMPRESSION_MIN_SIZE 바이트 미만, 이미 인코딩된 응답, JSON·텍스트가 아닌 응답은 그대로 전송
+- 스트리밍 응답(여러 본문 메시지)은 배치 단위 전송을 유지하도록 압축하지 않음
+- UNCOMPRESSED_PATHS 경로는 압축하지 않음 (경로별 제외)
+- 압축 대상 경로의 JSON·텍스트 응답과 304 응답에는 실제 압축 여부와 관계없이(최소 크기 미만,
+  Accept-Encoding 없음 포함) Vary: Accept-Encoding을 붙여 중간 캐시가 인코딩별로 구분하도록 함
+- ETag가 붙은 응답(데이터 버전이 같으면 본문이 같은 조회 응답)은 압축 결과를 본문 해시로
+  캐시해 결과 캐시 적중 등으로 같은 본문을 다시 보낼 때 압축을 생략
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import gzip
+import hashlib
+import threading
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+# 압축하지 않는 경로 (API_PREFIX 이후 경로 접두사)
+UNCOMPRESSED_PATHS = (
+    # 파일 다운로드 - Parquet은 자체 압축, 나머지는 스트리밍 전송
+    "/export",
+)
+
+# 압축 대상 Content-Type 접두사
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+# 선호 순서 (같은 q 값이면 앞쪽 우선)
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# 압축 응답 수, 압축 전후 바이트
+_stats = {"compressed": 0, "bytes_in": 0, "bytes_out": 0}
+
+
+def is_excluded(path: str) -> bool:
+    """압축하지 않는 경로인지 확인"""
+    prefix = settings.API_PREFIX
+    if prefix and path.startswith(prefix):
+        path = path[len(prefix):]
+    return any(path == excluded or path.startswith(excluded + "/") for excluded in UNCOMPRESSED_PATHS)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 사용할 인코딩 선택
+
+    Returns:
+        "br", "gzip" 또는 None (압축하지 않음)
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[token] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def add_vary_accept_encoding(headers: MutableHeaders) -> None:
+    """Vary 헤더에 Accept-Encoding 추가 (이미 있으면 그대로)"""
+    tokens = {token.strip().lower() for token in headers.get("vary", "").split(",")}
+    if "accept-encoding" not in tokens and "*" not in tokens:
+        headers.add_vary_header("Accept-Encoding")
+
+
+def _with_vary(start_message: Dict[str, Any]) -> Dict[str, Any]:
+    """압축 대상이 될 수 있는 응답(JSON·텍스트, 304)의 시작 메시지에 Vary: Accept-Encoding 추가"""
+    headers = MutableHeaders(raw=list(start_message.get("headers", [])))
+    if start_message["status"] != 304 and not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES):
+        return start_message
+    add_vary_accept_encoding(headers)
+    return {**start_message, "headers": headers.raw}
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """본문 압축 (gzip은 mtime을 고정해 같은 본문이면 같은 결과)"""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class CompressedBodyCache:
+    """압축 결과 LRU 캐시 - (인코딩, 본문 해시) → 압축 바이트 (스레드 안전)"""
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: 저장한 압축 바이트 합계 상한 (0이면 사용 안 함)
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def key(body: bytes, encoding: str) -> Tuple[str, bytes]:
+        return encoding, hashlib.blake2b(body, digest_size=16).digest()
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return value
+
+    def set(self, key: Tuple[str, bytes], value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = value
+            self._bytes += len(value)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes, **self.stats}
+
+
+# 압축 결과 캐시 인스턴스
+compressed_body_cache = CompressedBodyCache(max_bytes=settings.COMPRESSION_CACHE_MAX_BYTES)
+
+
+def compress_response_body(body: bytes, encoding: str, cacheable: bool) -> bytes:
+    """본문 압축 (cacheable이면 압축 결과 캐시 사용)"""
+    if not cacheable or compressed_body_cache.max_bytes <= 0:
+        return compress(body, encoding)
+    key = compressed_body_cache.key(body, encoding)
+    compressed = compressed_body_cache.get(key)
+    if compressed is None:
+        compressed = compress(body, encoding)
+        compressed_body_cache.set(key, compressed)
+    return compressed
+
+
+class ResponseCompressionMiddleware:
+    """
+    gzip·brotli 응답 압축 ASGI 미들웨어
+
+    응답 시작 메시지를 첫 본문 메시지까지 보류했다가 본문이 한 번에 전달되고
+    압축 조건을 만족하면 압축한 본문과 Content-Encoding·Content-Length·Vary 헤더로 전송합니다.
+    압축하지 않은 응답도 압축 대상이 될 수 있으면 Vary 헤더를 붙입니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.COMPRESSION_ENABLED or is_excluded(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            async def send_with_vary(message):
+                if message["type"] == "http.response.start":
+                    message = _with_vary(message)
+                await send(message)
+
+            await self.app(scope, receive, send_with_vary)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            passthrough = True
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=list(start_message.get("headers", [])))
+            if (
+                message.get("more_body", False)
+                or len(body) < settings.COMPRESSION_MIN_SIZE
+                or "content-encoding" in headers
+                or not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            ):
+                await send(_with_vary(start_message))
+                await send(message)
+                return
+
+            compressed = compress_response_body(body, encoding, cacheable="etag" in headers)
+            _stats["compressed"] += 1
+            _stats["bytes_in"] += len(body)
+            _stats["bytes_out"] += len(compressed)
+
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            add_vary_accept_encoding(headers)
+            await send({**start_message, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def get_stats() -> Dict[str, Any]:
+    ratio = _stats["bytes_out"] / _stats["bytes_in"] if _stats["bytes_in"] else None
+    return {
+        "enabled": settings.COMPRESSION_ENABLED,
+        "encodings": list(SUPPORTED_ENCODINGS),
+        "min_size": settings.COMPRESSION_MIN_SIZE,
+        **_stats,
+        "ratio": round(ratio, 4) if ratio is not None else None,
+        "cache": compressed_body_cache.get_stats(),
+    }
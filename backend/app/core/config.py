@@ -27,6 +27,81 @@ class Settings(BaseSettings):
     # 로깅 설정
     LOG_LEVEL: str = "INFO"
     
+    # 로그 정책 (조회 경로 로거 샘플링 비율·초당 최대 기록 수, 요청별 요약 한 줄 기록)
+    LOG_POLICY_ENABLED: bool = True
+    LOG_HOT_PATH_SAMPLE_RATE: float = 0.1
+    LOG_RATE_LIMIT_PER_SECOND: float = 20.0
+    LOG_REQUEST_SUMMARY: bool = True
+    
+    # 프로세스 풀 설정 (ARIMA 학습 등 CPU 집약 작업, 0이면 요청 처리 프로세스에서 직접 실행)
+    PROCESS_POOL_WORKERS: int = 2
+    PROCESS_POOL_TIMEOUT: float = 60.0
+    
+    # 서비스 실행 스레드 풀 설정 (조회·집계 서비스용, 무거운 분석용, 0이면 이벤트 루프에서 직접 실행)
+    IO_THREAD_POOL_WORKERS: int = 4
+    ANALYTICS_THREAD_POOL_WORKERS: int = 2
+    
+    # 서비스 결과 캐시 설정 (최대 항목 수, 최대 바이트, 기본 만료 시간(초), 데이터 변경 확인 주기(초))
+    RESULT_CACHE_ENABLED: bool = True
+    RESULT_CACHE_MAX_ENTRIES: int = 512
+    RESULT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESULT_CACHE_TTL: float = 600.0
+    DATA_VERSION_CHECK_INTERVAL: float = 30.0
+    
+    # 프로세스 간 공유 캐시 (여러 워커 프로세스 실행 시 결과·일자별 집계 공유, 디렉터리(빈 값이면 /dev/shm), 최대 바이트, 기본 만료 시간(초))
+    SHARED_CACHE_ENABLED: bool = False
+    SHARED_CACHE_DIR: str = ""
+    SHARED_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    SHARED_CACHE_TTL: float = 86400.0
+    # 공유 캐시 항목 서명 키 (빈 값이면 공유 디렉터리에 임의 키 파일 생성, 같은 호스트의 워커는 같은 값 사용)
+    SHARED_CACHE_SECRET: str = ""
+    
+    # 동일 요청 합치기 (진행 중인 같은 서비스 호출의 결과를 함께 기다림)
+    SINGLE_FLIGHT_ENABLED: bool = True
+    
+    # 시작 시 결과 캐시 예열 (예열할 최근 일수 목록, 서버 시작 후 대기 시간(초))
+    CACHE_WARMUP_ENABLED: bool = True
+    CACHE_WARMUP_DAYS: List[int] = [7, 30, 90]
+    CACHE_WARMUP_DELAY: float = 0.0
+    
+    # 프로세스 내 작업 스케줄러 (cron 식, 빈 문자열이면 작업 등록 안 함, 최대 지터(초), 단일 실행 잠금 파일 디렉터리(빈 값이면 임시 디렉터리))
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_JITTER: float = 30.0
+    SCHEDULER_LOCK_DIR: str = ""
+    SCHEDULE_ROLLUP_REFRESH: str = "*/10 * * * *"
+    SCHEDULE_FORECAST_PRECOMPUTE: str = "0 3 * * *"
+    SCHEDULE_CACHE_WARMUP: str = "50 8 * * *"
+    SCHEDULE_CACHE_EVICTION: str = "*/5 * * * *"
+    ROLLUP_REFRESH_DAYS: int = 90
+    
+    # 요청 범위 쿼리 메모 (한 요청 안의 같은 조회 재사용, 요청당 보관할 최대 행 수)
+    QUERY_MEMO_ENABLED: bool = True
+    QUERY_MEMO_MAX_ROWS: int = 200000
+    
+    # HTTP 캐시 (데이터 버전 기반 ETag·304, 조회 API의 Cache-Control max-age(초))
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_MAX_AGE: int = 60
+    
+    # 응답 압축 (최소 본문 크기(바이트), gzip 레벨, brotli 품질, 압축 결과 캐시 최대 바이트(0이면 사용 안 함))
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    
+    # 매장·일자별 부분 집계 캐시에 보관할 최대 일자 수
+    DAILY_AGGREGATE_CACHE_MAX_DAYS: int = 800
+    
+    # 내보내기(/export) 시 DB 커서에서 한 번에 읽을 행 수
+    EXPORT_BATCH_SIZE: int = 10000
+    
+    # 예측 기본 방법 (holt_winters, linear_weekday, seasonal_naive, arima)
+    FORECAST_DEFAULT_METHOD: str = "holt_winters"
+    
+    # 배치 예측 설정 (학습 기간 일수, 저장할 예측 일수)
+    FORECAST_BATCH_HISTORY_DAYS: int = 90
+    FORECAST_BATCH_HORIZON: int = 60
+    
     # AI API 설정
     ANTHROPIC_API_KEY: str = ""
     
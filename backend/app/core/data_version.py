@@ -0,0 +1,323 @@
+## data_version.py
+
+"""
+데이터 버전 및 변경 알림
+
+매출 데이터를 적재·수정하는 모든 경로(임포트 스크립트, 앱 내 적재)는 data_version
+테이블에 변경 범위(테이블, 날짜 구간, 매장)를 한 행씩 기록합니다. 행 id가 곧 데이터 버전입니다.
+
+서버 프로세스는 DataVersionBus로 새 변경 행을 감지해 구독자(결과 캐시, 일자별 집계 캐시 등)에
+DataChange를 전달하고, 각 구독자는 변경 범위와 겹치는 항목만 무효화합니다.
+
+임포트 스크립트는 sqlite3 연결만으로 기록할 수 있도록 record_data_change()를 사용합니다.
+
+최근 변경 이력을 보관하므로 다른 프로세스가 이전 버전에서 저장한 공유 캐시 항목도
+그 이후의 변경과 겹치지 않으면 계속 사용할 수 있습니다. (changes_since)
+"""
+
+from collections import deque
+from datetime import date
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+import json
+import logging
+import threading
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+DATA_VERSION_TABLE = "data_version"
+
+# 매출 원천 테이블
+SALES_TABLES = ("daily_sales_summary", "receipt_sales_detail")
+
+CREATE_TABLE_SQL = (
+    f"CREATE TABLE IF NOT EXISTS {DATA_VERSION_TABLE} ("
+    "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "tables TEXT NOT NULL, "
+    "start_date DATE, "
+    "end_date DATE, "
+    "store_names TEXT, "
+    "source TEXT, "
+    "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+)
+
+
+def _to_date(value: Any) -> Optional[date]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def table_date_range(conn, table: str) -> Tuple[Optional[date], Optional[date]]:
+    """테이블의 최소·최대 날짜 (DB-API 연결, 데이터가 없으면 (None, None))"""
+    row = conn.execute(f"SELECT MIN(date), MAX(date) FROM {table}").fetchone()
+    return _to_date(row[0]), _to_date(row[1])
+
+
+def union_date_range(*ranges: Tuple[Optional[date], Optional[date]]) -> Tuple[Optional[date], Optional[date]]:
+    """여러 날짜 구간을 모두 포함하는 구간 (테이블 교체 전후 범위 합산용)"""
+    starts = [start for start, _ in ranges if start is not None]
+    ends = [end for _, end in ranges if end is not None]
+    return (min(starts) if starts else None, max(ends) if ends else None)
+
+
+def record_data_change(
+    conn,
+    tables: Sequence[str],
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    store_names: Optional[Iterable[str]] = None,
+    source: str = ""
+) -> int:
+    """
+    데이터 변경을 기록하고 새 데이터 버전을 반환합니다. (커밋 포함)
+
+    Args:
+        conn: sqlite3 등 qmark 파라미터를 쓰는 DB-API 연결
+        tables: 변경된 테이블
+        start_date, end_date: 변경된 날짜 구간 (None이면 전체 기간)
+        store_names: 변경된 매장 (None이면 전체 매장)
+        source: 변경 주체 (스크립트 이름 등)
+
+    Returns:
+        데이터 버전
+    """
+    conn.execute(CREATE_TABLE_SQL)
+    cursor = conn.execute(
+        f"INSERT INTO {DATA_VERSION_TABLE} (tables, start_date, end_date, store_names, source) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (
+            ",".join(tables),
+            start_date.isoformat() if start_date else None,
+            end_date.isoformat() if end_date else None,
+            json.dumps(sorted(set(store_names)), ensure_ascii=False) if store_names is not None else None,
+            source
+        )
+    )
+    conn.commit()
+    version = cursor.lastrowid
+    logger.info(f"데이터 버전 {version} 기록: {tables} {start_date}~{end_date} 매장={store_names or '전체'} ({source})")
+    return version
+
+
+class DataChange:
+    """데이터 변경 범위 (None은 해당 축 전체)"""
+
+    __slots__ = ("version", "tables", "start_date", "end_date", "store_names", "source")
+
+    def __init__(
+        self,
+        version: int,
+        tables: Optional[Sequence[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        store_names: Optional[Iterable[str]] = None,
+        source: str = ""
+    ):
+        self.version = version
+        self.tables = frozenset(tables) if tables else None
+        self.start_date = start_date
+        self.end_date = end_date
+        self.store_names = frozenset(store_names) if store_names is not None else None
+        self.source = source
+
+    def affects(
+        self,
+        tables: Optional[Iterable[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        store_names: Optional[Iterable[str]] = None
+    ) -> bool:
+        """
+        주어진 데이터 범위가 이 변경의 영향을 받는지 확인합니다.
+
+        Args:
+            tables: 의존 테이블 (None이면 모든 매출 테이블)
+            start_date, end_date: 의존 날짜 구간 (None이면 전체 기간)
+            store_names: 의존 매장 (None이면 전체 매장)
+        """
+        if self.tables is not None and tables is not None and not self.tables.intersection(tables):
+            return False
+        if self.start_date is not None and end_date is not None and end_date < self.start_date:
+            return False
+        if self.end_date is not None and start_date is not None and start_date > self.end_date:
+            return False
+        if self.store_names is not None and store_names is not None and not self.store_names.intersection(store_names):
+            return False
+        return True
+
+    def __repr__(self) -> str:
+        return (f"DataChange(version={self.version}, tables={sorted(self.tables) if self.tables else None}, "
+                f"{self.start_date}~{self.end_date}, stores={sorted(self.store_names) if self.store_names else None})")
+
+
+class DataVersionBus:
+    """data_version 테이블 감시 및 구독자 알림"""
+
+    # 보관할 최근 변경 이력 수
+    HISTORY_SIZE = 1000
+
+    def __init__(self, check_interval: float):
+        """
+        Args:
+            check_interval: DB 재확인 최소 간격(초)
+        """
+        self.check_interval = check_interval
+        self.current: Optional[int] = None
+        self._checked_at = 0.0
+        self._subscribers: List[Callable[[DataChange], None]] = []
+        # 이 버전 이후의 변경은 모두 이력에 있음 (서버 시작·초기화 시점 버전)
+        self._history_after: Optional[int] = None
+        self._history: Deque[DataChange] = deque()
+        self._lock = threading.RLock()
+        self.stats = {"checks": 0, "changes": 0, "resets": 0}
+
+    def subscribe(self, callback: Callable[[DataChange], None]) -> Callable[[DataChange], None]:
+        """변경 알림 구독 (데코레이터로도 사용 가능)"""
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[[DataChange], None]) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _record(self, change: DataChange) -> None:
+        self._history.append(change)
+        if len(self._history) > self.HISTORY_SIZE:
+            self._history_after = self._history.popleft().version
+
+    def changes_since(self, version: int) -> Optional[List[DataChange]]:
+        """
+        주어진 버전 이후 이 프로세스가 확인한 변경 목록
+
+        Returns:
+            변경 목록 (이력이 남아 있지 않거나 현재 버전보다 새로운 버전이면 None)
+        """
+        with self._lock:
+            if self._history_after is None or version < self._history_after or version > (self.current or 0):
+                return None
+            return [change for change in self._history if change.version > version]
+
+    def _publish(self, change: DataChange) -> None:
+        logger.info(f"데이터 변경 알림: {change}")
+        self.stats["changes"] += 1
+        for callback in list(self._subscribers):
+            try:
+                callback(change)
+            except Exception as e:
+                logger.error(f"데이터 변경 구독자 처리 실패 ({getattr(callback, '__qualname__', callback)}): {e}")
+
+    def _read_changes(self, after: int) -> Tuple[int, List[DataChange]]:
+        from sqlalchemy import text
+        from sqlalchemy.exc import OperationalError
+        from app.core.database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            try:
+                latest = db.execute(text(f"SELECT MAX(id) FROM {DATA_VERSION_TABLE}")).scalar() or 0
+            except OperationalError:
+                # 테이블이 아직 없음 (변경 기록 전)
+                return 0, []
+            if latest <= after:
+                return latest, []
+            rows = db.execute(
+                text(f"SELECT id, tables, start_date, end_date, store_names, source "
+                     f"FROM {DATA_VERSION_TABLE} WHERE id > :after ORDER BY id"),
+                {"after": after}
+            ).fetchall()
+            changes = [
+                DataChange(
+                    version=row.id,
+                    tables=row.tables.split(",") if row.tables else None,
+                    start_date=_to_date(row.start_date),
+                    end_date=_to_date(row.end_date),
+                    store_names=json.loads(row.store_names) if row.store_names else None,
+                    source=row.source or ""
+                )
+                for row in rows
+            ]
+            return latest, changes
+        finally:
+            db.close()
+
+    def poll(self, force: bool = False) -> Optional[int]:
+        """
+        새 변경을 확인해 구독자에게 알리고 현재 데이터 버전을 반환합니다.
+
+        check_interval 초 안에 다시 호출하면 DB를 조회하지 않습니다.
+        """
+        now = time.monotonic()
+        if not force and self.current is not None and now - self._checked_at < self.check_interval:
+            return self.current
+
+        with self._lock:
+            if not force and self.current is not None and now - self._checked_at < self.check_interval:
+                return self.current
+            self.stats["checks"] += 1
+            try:
+                latest, changes = self._read_changes(self.current or 0)
+            except Exception as e:
+                logger.warning(f"데이터 버전 확인 실패: {e}")
+                self._checked_at = now
+                return self.current
+
+            if self.current is None:
+                # 서버 시작 시점 버전 - 이전 변경은 캐시가 비어 있으므로 알리지 않고 이력에만 기록
+                self.current = latest
+                self._history_after = 0
+                for change in changes:
+                    self._record(change)
+            elif latest < self.current:
+                # DB가 새로 생성됨 (버전 감소) - 전체 무효화
+                self.stats["resets"] += 1
+                self.current = self._history_after = latest
+                self._history.clear()
+                self._publish(DataChange(version=latest, source="reset"))
+            else:
+                for change in changes:
+                    self.current = change.version
+                    self._record(change)
+                    self._publish(change)
+            self._checked_at = now
+            return self.current
+
+    def bump(
+        self,
+        tables: Sequence[str],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        store_names: Optional[Iterable[str]] = None,
+        source: str = "app"
+    ) -> int:
+        """
+        앱 내 적재 경로용 - 변경을 기록하고 구독자에게 즉시 알립니다.
+
+        Returns:
+            새 데이터 버전
+        """
+        from app.core.database import engine
+
+        conn = engine.raw_connection()
+        try:
+            version = record_data_change(conn, tables, start_date, end_date, store_names, source)
+        finally:
+            conn.close()
+        self.poll(force=True)
+        return version
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "version": self.current,
+            "subscribers": len(self._subscribers),
+            "history": len(self._history),
+            **self.stats
+        }
+
+
+# 데이터 버전 감시 인스턴스
+data_version_bus = DataVersionBus(check_interval=settings.DATA_VERSION_CHECK_INTERVAL)
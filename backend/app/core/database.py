@@ -3,19 +3,20 @@ SQLAlchemy 기반 로컬 데이터베이스 연결 모듈
 Supabase를 SQLite로 교체
 """
 
-from sqlalchemy import create_engine, text, Column, Integer, String, Date, DateTime, Float
+from sqlalchemy import create_engine, text, Column, Integer, String, Date, DateTime, Float, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
 from typing import List, Dict, Any, Optional
 from datetime import date, datetime
 import logging
 import os
 
+from app.core import log_policy
 from app.core.config import settings
+from app.core.query_memo import freeze, invalidate_current, memoized_query
 
-# 로거 설정
-logger = logging.getLogger("database")
-logger.setLevel(logging.INFO)
+# 로거 설정 (수준은 LOG_LEVEL, 조회 경로 샘플링은 app.core.log_policy)
+logger = logging.getLogger(__name__)
 
 # SQLAlchemy Base
 Base = declarative_base()
@@ -107,6 +108,56 @@ class ReceiptSalesDetail(Base):
     created_at = Column(DateTime)
     store_name = Column(String)
 
+class ForecastModelState(Base):
+    """예측 모델 상태 (매장 집합·지표별 ARIMA 파라미터)"""
+    __tablename__ = "forecast_model_state"
+    
+    model_key = Column(String, primary_key=True)  # "매장1|매장2::metric"
+    metric = Column(String)
+    model_order = Column(String)  # "7,1,1"
+    params = Column(String)  # JSON 배열
+    series_start = Column(String)
+    series_end = Column(String)
+    series_hash = Column(String)  # 학습에 사용한 시계열 값의 해시
+    updated_at = Column(DateTime)
+
+class ForecastResult(Base):
+    """배치 예측 결과 (매장·지표·예측일별)"""
+    __tablename__ = "forecast_results"
+    __table_args__ = (
+        Index("ix_forecast_results_lookup", "store_name", "metric", "series_end"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    store_name = Column(String)  # 매장명 또는 '전체'
+    metric = Column(String)
+    series_start = Column(String)  # 학습 기간 시작일
+    series_end = Column(String)  # 학습 기간 종료일 (예측 기준일)
+    forecast_date = Column(String)
+    value = Column(Float)
+    upper_bound = Column(Float)
+    lower_bound = Column(Float)
+    method = Column(String)
+    generated_at = Column(DateTime)
+
+class SeasonalComponent(Base):
+    """시계열 분해 결과 (매장·지표·날짜별 성분)"""
+    __tablename__ = "seasonal_components"
+    __table_args__ = (
+        Index("ix_seasonal_components_lookup", "store_name", "metric", "date"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    store_name = Column(String)  # 매장명 또는 '전체'
+    metric = Column(String)
+    date = Column(String)
+    observed = Column(Float)
+    trend = Column(Float)
+    weekly = Column(Float)
+    yearly = Column(Float, nullable=True)  # 2년 미만 데이터는 NULL
+    residual = Column(Float)
+    generated_at = Column(DateTime)
+
 # 테이블 상수 (기존 코드와 호환성 유지)
 class Tables:
     RECEIPT_SALES_DETAIL = "receipt_sales_detail"
@@ -153,7 +204,7 @@ class SupabaseCompatibleQuery:
             # SQLAlchemy에서 특정 컬럼만 선택하려면 getattr를 사용
             # 현재는 전체 모델을 가져오는 것으로 단순화
             # TODO: 필요시 특정 컬럼만 선택하는 기능 구현
-            logger.debug(f"Selecting columns: {columns}")
+            logger.debug("Selecting columns: %s", columns)
         return self
     
     def gte(self, column: str, value: Any):
@@ -203,42 +254,54 @@ class SupabaseCompatibleQuery:
             self.query = self.query.filter(getattr(self.model, column).ilike(pattern))
         return self
     
+    def _memo_key(self):
+        """요청 범위 쿼리 메모 키 (컴파일된 SQL, 파라미터)"""
+        compiled = self.query.statement.compile(dialect=self.db.get_bind().dialect)
+        return ("orm", str(compiled), freeze(compiled.params))
+    
+    def _fetch(self) -> List[Dict[str, Any]]:
+        """쿼리 실행 및 ORM 객체를 딕셔너리로 변환"""
+        results = self.query.all()
+        
+        data = []
+        for row in results:
+            row_dict = {}
+            for column in row.__table__.columns:
+                value = getattr(row, column.name)
+                # 날짜 변환
+                if isinstance(value, date):
+                    value = value.isoformat()
+                elif isinstance(value, datetime):
+                    value = value.isoformat()
+                row_dict[column.name] = value
+            data.append(row_dict)
+        return data
+    
     def execute(self):
-        """쿼리 실행 및 Supabase 스타일 응답 반환"""
+        """쿼리 실행 및 Supabase 스타일 응답 반환 (같은 요청의 같은 쿼리는 메모된 결과 사용)"""
         try:
-            results = self.query.all()
-            
-            # ORM 객체를 딕셔너리로 변환
-            data = []
-            for row in results:
-                row_dict = {}
-                for column in row.__table__.columns:
-                    value = getattr(row, column.name)
-                    # 날짜 변환
-                    if isinstance(value, date):
-                        value = value.isoformat()
-                    elif isinstance(value, datetime):
-                        value = value.isoformat()
-                    row_dict[column.name] = value
-                data.append(row_dict)
+            data = memoized_query(self._memo_key(), self._fetch)
             
             # Supabase 스타일 응답
             class Response:
                 def __init__(self, data):
                     self.data = data
             
-            logger.info(f"Query executed: {self.table_name}, returned {len(data)} rows")
+            # 쿼리별 로그 대신 요청 요약에 합산
+            log_policy.count("queries")
+            log_policy.count("rows", len(data))
+            logger.debug("Query executed: %s, returned %d rows", self.table_name, len(data))
             return Response(data)
             
         except Exception as e:
             logger.error(f"Query execution failed: {e}")
             raise
 
-# 전역 DB 세션 (임시 - 점진적 마이그레이션용)
+# 전역 DB 세션 (임시 - 점진적 마이그레이션용, I/O 스레드 풀에서도 쓰이므로 스레드별 세션)
 _global_db = None
 if SessionLocal is not None:
     try:
-        _global_db = SessionLocal()
+        _global_db = scoped_session(SessionLocal)
         logger.info("Global database session created")
     except Exception as e:
         logger.error(f"Failed to create global database session: {e}")
@@ -253,9 +316,22 @@ def get_table(table_name: str):
         logger.error("Database connection not available")
         raise Exception("Database connection not available")
     
-    logger.info(f"테이블 접근: {table_name}")
+    logger.debug("테이블 접근: %s", table_name)
     return SupabaseCompatibleQuery(_global_db, table_name)
 
+def _run_select(query: str, params: Optional[dict] = None) -> List[Dict[str, Any]]:
+    """조회 SQL 실행 (Row 객체를 딕셔너리로 변환)"""
+    db = SessionLocal()
+    try:
+        rows = db.execute(text(query), params or {}).fetchall()
+        return [dict(row._mapping) for row in rows]
+    except Exception as e:
+        logger.error(f"SQL 쿼리 실행 실패: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
 # SQL 쿼리 직접 실행 (기존 코드 호환)
 async def run_query(query: str, params: dict = None) -> List[Dict[str, Any]]:
     """Raw SQL 쿼리 실행"""
@@ -263,22 +339,23 @@ async def run_query(query: str, params: dict = None) -> List[Dict[str, Any]]:
         logger.error("Database connection not available for query execution")
         raise Exception("Database connection not available")
     
-    logger.info(f"SQL 쿼리 실행: {query[:100]}...")
+    logger.debug("SQL 쿼리 실행: %.100s...", query)
+    
+    # SELECT 쿼리는 같은 요청 안에서 한 번만 실행 (요청 범위 쿼리 메모)
+    if query.strip().upper().startswith("SELECT"):
+        data = memoized_query(("sql", query, freeze(params or {})), lambda: _run_select(query, params))
+        log_policy.count("queries")
+        log_policy.count("rows", len(data))
+        logger.debug("SQL 쿼리 실행 결과: %d 레코드 반환", len(data))
+        return data
     
     db = SessionLocal()
     try:
-        result = db.execute(text(query), params or {})
-        
-        # SELECT 쿼리인 경우 결과 반환
-        if query.strip().upper().startswith("SELECT"):
-            rows = result.fetchall()
-            # Row 객체를 딕셔너리로 변환
-            data = [dict(row._mapping) for row in rows]
-            logger.info(f"SQL 쿼리 실행 결과: {len(data)} 레코드 반환")
-            return data
-        else:
-            db.commit()
-            return []
+        db.execute(text(query), params or {})
+        db.commit()
+        # 쓰기 이후의 조회는 다시 실행
+        invalidate_current()
+        return []
             
     except Exception as e:
         logger.error(f"SQL 쿼리 실행 실패: {e}")
@@ -0,0 +1,160 @@
+## executors.py
+
+"""
+서비스 실행 스레드 풀
+
+서비스 메서드는 async로 선언되어 있지만 내부에서 동기 DB 조회와 pandas 연산을 실행하므로
+이벤트 루프에서 실행하면 끝날 때까지 다른 요청(헬스체크 포함)이 모두 기다립니다.
+ManagedThreadPool은 이런 코루틴을 워커 스레드의 전용 이벤트 루프에서 실행합니다.
+
+- io_thread_pool: 일반 조회·집계 서비스, 기간별 조회 등 독립적인 조회의 동시 실행
+- analytics_thread_pool: 이상치 감지·상관관계·패턴·예측 등 무거운 분석 (일반 조회 워커를 점유하지 않도록 분리)
+- @offload(pool) 데코레이터로 서비스 메서드 본문을 풀에서 실행 (@cached 아래에 적용하면 캐시 적중 시 스레드 전환 없음)
+- 워커 스레드 안에서 다시 풀 실행을 요청하면 같은 스레드에서 바로 실행 (풀 고갈로 인한 교착 방지)
+- 호출 시점의 컨텍스트(요청 범위 쿼리 메모 등)를 복사해 워커 스레드에서 사용
+- ORM 세션은 스레드별 세션(scoped_session)을 사용하므로 워커 스레드 간에 공유되지 않음
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 워커 스레드별 이벤트 루프
+_thread_state = threading.local()
+
+
+def in_worker_thread() -> bool:
+    """현재 스레드가 스레드 풀 워커에서 코루틴을 실행 중인지 여부"""
+    return getattr(_thread_state, "loop", None) is not None
+
+
+def _run_coroutine(func: Callable[..., Awaitable[Any]], args: tuple, kwargs: dict) -> Any:
+    """워커 스레드의 이벤트 루프에서 코루틴 함수 실행"""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _thread_state.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(func(*args, **kwargs))
+
+
+class ManagedThreadPool:
+    """지연 생성되는 ThreadPoolExecutor 래퍼"""
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        """
+        Args:
+            max_workers: 워커 스레드 수 (0이면 풀 없이 호출한 이벤트 루프에서 직접 실행)
+            thread_name_prefix: 워커 스레드 이름 접두사
+        """
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._active = 0
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.thread_name_prefix
+                )
+                logger.info(f"스레드 풀 시작 ({self.thread_name_prefix}, workers={self.max_workers})")
+            return self._executor
+
+    async def _submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        context = contextvars.copy_context()
+        self.stats["submitted"] += 1
+        self._active += 1
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._get_executor(), context.run, fn, *args)
+            self.stats["completed"] += 1
+            return result
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+        finally:
+            self._active -= 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """동기 함수를 워커 스레드에서 실행하고 결과를 기다립니다."""
+        if not self.enabled:
+            return fn(*args)
+        return await self._submit(fn, *args)
+
+    async def run_async(self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """
+        블로킹 코드를 포함한 코루틴 함수를 워커 스레드의 이벤트 루프에서 실행합니다.
+
+        Args:
+            func: async 함수 (서비스 메서드 등)
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            코루틴 반환값
+        """
+        # 풀 비활성화 또는 이미 워커 스레드 안이면 바로 실행
+        if not self.enabled or in_worker_thread():
+            return await func(*args, **kwargs)
+        return await self._submit(_run_coroutine, func, args, kwargs)
+
+    def shutdown(self):
+        """앱 종료 시 풀 정리"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.info(f"스레드 풀 종료 ({self.thread_name_prefix})")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 상태 및 작업 통계"""
+        return {
+            "enabled": self.enabled,
+            "max_workers": self.max_workers,
+            "running": self._executor is not None,
+            "active_jobs": self._active,
+            **self.stats
+        }
+
+
+# 전역 I/O 스레드 풀 (조회·집계 서비스, 기간별 조회 등 독립적인 DB 조회 동시 실행용)
+io_thread_pool = ManagedThreadPool(max_workers=settings.IO_THREAD_POOL_WORKERS, thread_name_prefix="io")
+
+# 무거운 분석용 스레드 풀
+analytics_thread_pool = ManagedThreadPool(max_workers=settings.ANALYTICS_THREAD_POOL_WORKERS, thread_name_prefix="analytics")
+
+
+def offload(pool: ManagedThreadPool) -> Callable:
+    """
+    async 서비스 메서드 본문을 스레드 풀에서 실행하는 데코레이터
+
+    @staticmethod와 @cached 아래에 적용합니다.
+
+        @staticmethod
+        @cached("sales.get_daily_sales", tables=(Tables.DAILY_SALES_SUMMARY,))
+        @offload(io_thread_pool)
+        async def get_daily_sales(...): ...
+
+    Args:
+        pool: 실행할 스레드 풀
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await pool.run_async(func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
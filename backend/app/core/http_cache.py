@@ -0,0 +1,182 @@
+## http_cache.py
+
+"""
+조건부 GET(ETag)과 Cache-Control
+
+대시보드 조회 결과는 데이터가 새로 적재되기 전까지 같으므로 ETag를
+(경로, 정규화된 쿼리 파라미터, 데이터 버전, 오늘 날짜)로 계산합니다.
+응답 본문을 만들기 전에 계산할 수 있어 If-None-Match가 일치하면 엔드포인트와
+쿼리를 실행하지 않고 바로 304를 반환합니다.
+
+- 날짜를 지정하지 않은 요청은 오늘 기준 최근 N일을 조회하므로 오늘 날짜도 ETag에 포함
+- 응답 압축 등으로 바이트가 달라질 수 있어 약한 ETag(W/"...") 사용
+- Cache-Control은 경로 접두사별 정책(CACHE_POLICIES)으로 지정
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+import hashlib
+import logging
+
+from app.core import compression
+from app.core.config import settings
+from app.core.data_version import data_version_bus
+
+logger = logging.getLogger(__name__)
+
+# 304 응답 수, ETag를 붙인 응답 수
+_stats = {"not_modified": 0, "tagged": 0}
+
+
+class CachePolicy:
+    """경로별 HTTP 캐시 정책"""
+
+    __slots__ = ("cache_control", "etag")
+
+    def __init__(self, max_age: int = 0, etag: bool = True, no_store: bool = False):
+        """
+        Args:
+            max_age: 브라우저가 재검증 없이 재사용할 시간(초)
+            etag: 데이터 버전 기반 ETag·304 사용 여부
+            no_store: 저장 금지 (수정 가능한 데이터, 대용량 내보내기 등)
+        """
+        if no_store:
+            self.cache_control = "no-store"
+            self.etag = False
+        else:
+            self.cache_control = f"private, max-age={max_age}, must-revalidate" if max_age else "private, no-cache"
+            self.etag = etag
+
+
+# API 경로 접두사별 정책 (API_PREFIX 이후 경로, 가장 긴 접두사 우선)
+CACHE_POLICIES: Dict[str, CachePolicy] = {
+    # 매출 데이터에서 계산하는 조회 - 데이터 버전이 같으면 같은 결과
+    "/sales": CachePolicy(max_age=settings.HTTP_CACHE_MAX_AGE),
+    "/kpi": CachePolicy(max_age=settings.HTTP_CACHE_MAX_AGE),
+    "/compare": CachePolicy(max_age=settings.HTTP_CACHE_MAX_AGE),
+    "/analytics": CachePolicy(max_age=settings.HTTP_CACHE_MAX_AGE),
+    "/trends": CachePolicy(max_age=settings.HTTP_CACHE_MAX_AGE),
+    "/stores": CachePolicy(max_age=settings.HTTP_CACHE_MAX_AGE),
+    "/dashboard": CachePolicy(max_age=settings.HTTP_CACHE_MAX_AGE),
+    # DB 연결 확인용
+    "/sales/test-connection": CachePolicy(no_store=True),
+    # 수정 가능한 데이터, 외부 API 호출, 대용량 파일
+    "/notice": CachePolicy(no_store=True),
+    "/summary": CachePolicy(no_store=True),
+    "/ai": CachePolicy(no_store=True),
+    "/export": CachePolicy(no_store=True),
+}
+
+_SORTED_POLICIES: List[Tuple[str, CachePolicy]] = sorted(CACHE_POLICIES.items(), key=lambda item: -len(item[0]))
+
+
+def get_policy(path: str) -> Optional[CachePolicy]:
+    """요청 경로에 해당하는 정책 (없으면 None)"""
+    prefix = settings.API_PREFIX
+    if prefix:
+        if not path.startswith(prefix):
+            return None
+        path = path[len(prefix):]
+    for policy_prefix, policy in _SORTED_POLICIES:
+        if path == policy_prefix or path.startswith(policy_prefix + "/"):
+            return policy
+    return None
+
+
+def normalize_query(query_string: str) -> str:
+    """
+    쿼리 문자열 정규화 - 파라미터 이름순 정렬 (같은 이름의 값 순서는 유지)
+
+    ?days=7&store_name=A 와 ?store_name=A&days=7 은 같은 키가 됩니다.
+    """
+    grouped: Dict[str, List[str]] = {}
+    for name, value in parse_qsl(query_string, keep_blank_values=True):
+        grouped.setdefault(name, []).append(value)
+    return urlencode(sorted(grouped.items()), doseq=True)
+
+
+def compute_etag(path: str, query_string: str, version: Any) -> str:
+    """경로·파라미터·데이터 버전으로 약한 ETag 계산"""
+    key = "|".join((settings.VERSION, path, normalize_query(query_string), str(version), date.today().isoformat()))
+    return f'W/"{hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더 비교 (약한 비교, * 포함)"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+class ConditionalGetMiddleware:
+    """
+    ETag·304 및 Cache-Control ASGI 미들웨어
+
+    GET/HEAD 요청에 정책이 있으면 데이터 버전으로 ETag를 계산해
+    If-None-Match와 일치하면 엔드포인트를 호출하지 않고 304를 반환하고,
+    그렇지 않으면 200 응답에 ETag와 Cache-Control 헤더를 붙입니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD") or not settings.HTTP_CACHE_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        policy = get_policy(scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        etag = None
+        if policy.etag:
+            version = data_version_bus.poll()
+            if version is not None:
+                etag = compute_etag(scope["path"], scope.get("query_string", b"").decode("latin-1"), version)
+
+        if etag is not None:
+            if_none_match = None
+            for name, value in scope["headers"]:
+                if name == b"if-none-match":
+                    if_none_match = value.decode("latin-1")
+                    break
+            if if_none_match and etag_matches(if_none_match, etag):
+                _stats["not_modified"] += 1
+                headers = [
+                    (b"etag", etag.encode("latin-1")),
+                    (b"cache-control", policy.cache_control.encode("latin-1")),
+                ]
+                # 304도 200 응답과 같은 Vary를 가져야 함 (압축 대상 경로)
+                if settings.COMPRESSION_ENABLED and not compression.is_excluded(scope["path"]):
+                    headers.append((b"vary", b"Accept-Encoding"))
+                await send({"type": "http.response.start", "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = list(message.get("headers", []))
+                names = {name.lower() for name, _ in headers}
+                if b"cache-control" not in names:
+                    headers.append((b"cache-control", policy.cache_control.encode("latin-1")))
+                if etag is not None and b"etag" not in names:
+                    headers.append((b"etag", etag.encode("latin-1")))
+                    _stats["tagged"] += 1
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+def get_stats() -> Dict[str, Any]:
+    return {"enabled": settings.HTTP_CACHE_ENABLED, "max_age": settings.HTTP_CACHE_MAX_AGE, **_stats}
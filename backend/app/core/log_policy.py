@@ -0,0 +1,162 @@
+## log_policy.py
+
+"""
+로그 정책 (샘플링·속도 제한·요청 요약)
+
+조회 경로는 쿼리·청크마다 INFO 로그를 남겨 /sales/hourly 요청 하나(31일)에 120줄 이상이
+기록되었고, 기록하지 않는 수준에서도 f-string 메시지와 응답 샘플을 매번 만들었습니다.
+
+- 로거별 정책(LOG_POLICIES): WARNING 미만 레코드를 sample_rate 비율로 샘플링하고
+  초당 max_per_second 건으로 제한 (WARNING 이상은 항상 기록)
+- 조회 경로는 쿼리·청크 단위 로그 대신 count()로 요청별 카운터만 올리고,
+  RequestLogMiddleware가 요청이 끝나면 key=value 형식의 요약 한 줄을 남김
+- 세부 로그는 DEBUG와 %-스타일 인자로 남겨 기록하지 않을 때는 메시지를 만들지 않음
+
+요약 예: method=GET path=/api/sales/daily status=200 duration_ms=12.4 queries=1 rows=90 cache_hits=0
+"""
+
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+import logging
+import threading
+import time
+
+from app.core.config import settings
+
+# 요청 요약 로거 (다른 로그와 따로 수준을 지정할 수 있도록 분리)
+request_logger = logging.getLogger("app.request")
+
+
+class LogPolicy:
+    """로거 하나의 샘플링·속도 제한 정책"""
+
+    __slots__ = ("sample_rate", "max_per_second")
+
+    def __init__(self, sample_rate: float = 1.0, max_per_second: Optional[float] = None):
+        """
+        Args:
+            sample_rate: 기록할 비율 (0~1, 1이면 모두 기록)
+            max_per_second: 초당 최대 기록 수 (None이면 제한 없음)
+        """
+        self.sample_rate = sample_rate
+        self.max_per_second = max_per_second
+
+
+# 조회 경로 로거별 정책 (로거 이름 → 정책)
+LOG_POLICIES: Dict[str, LogPolicy] = {
+    # 쿼리마다 기록하는 DB 계층
+    "app.core.database": LogPolicy(settings.LOG_HOT_PATH_SAMPLE_RATE, settings.LOG_RATE_LIMIT_PER_SECOND),
+    # 매출 조회 서비스·엔드포인트
+    "app.services.sales_service": LogPolicy(settings.LOG_HOT_PATH_SAMPLE_RATE, settings.LOG_RATE_LIMIT_PER_SECOND),
+    "app.api.endpoints.sales": LogPolicy(settings.LOG_HOT_PATH_SAMPLE_RATE, settings.LOG_RATE_LIMIT_PER_SECOND),
+    # 매장 조회
+    "store_service": LogPolicy(max_per_second=settings.LOG_RATE_LIMIT_PER_SECOND),
+    "store_api": LogPolicy(max_per_second=settings.LOG_RATE_LIMIT_PER_SECOND),
+    # 일자별 집계 캐시 (조회마다 실행)
+    "app.services.daily_aggregates": LogPolicy(settings.LOG_HOT_PATH_SAMPLE_RATE, settings.LOG_RATE_LIMIT_PER_SECOND),
+}
+
+
+class PolicyFilter(logging.Filter):
+    """로거에 붙이는 샘플링·속도 제한 필터 (스레드 안전)"""
+
+    def __init__(self, policy: LogPolicy):
+        super().__init__()
+        self.policy = policy
+        # 샘플링은 난수 대신 N건마다 1건 (재현 가능, 난수 생성 비용 없음)
+        self._every = max(1, round(1 / policy.sample_rate)) if policy.sample_rate > 0 else 0
+        self._seen = 0
+        self._window = 0
+        self._window_count = 0
+        self._lock = threading.Lock()
+        self.stats = {"passed": 0, "sampled_out": 0, "rate_limited": 0}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        with self._lock:
+            self._seen += 1
+            if self._every == 0 or (self._seen - 1) % self._every:
+                self.stats["sampled_out"] += 1
+                return False
+            if self.policy.max_per_second is not None:
+                window = int(time.monotonic())
+                if window != self._window:
+                    self._window = window
+                    self._window_count = 0
+                if self._window_count >= self.policy.max_per_second:
+                    self.stats["rate_limited"] += 1
+                    return False
+                self._window_count += 1
+            self.stats["passed"] += 1
+            return True
+
+
+_filters: Dict[str, PolicyFilter] = {}
+
+
+def install_log_policies() -> None:
+    """LOG_POLICIES의 로거에 필터 설치 (앱 시작 시 한 번, 다시 호출하면 교체)"""
+    for name, log_filter in _filters.items():
+        logging.getLogger(name).removeFilter(log_filter)
+    _filters.clear()
+    if not settings.LOG_POLICY_ENABLED:
+        return
+    for name, policy in LOG_POLICIES.items():
+        log_filter = _filters[name] = PolicyFilter(policy)
+        logging.getLogger(name).addFilter(log_filter)
+
+
+# 현재 요청의 카운터 (요청 밖에서는 None - 배치 작업 등)
+_current_counters: ContextVar[Optional[Dict[str, Any]]] = ContextVar("request_log_counters", default=None)
+_stats = {"requests": 0}
+
+
+def count(field: str, value: int = 1) -> None:
+    """현재 요청의 요약 카운터 증가 (요청 밖에서는 무시)"""
+    counters = _current_counters.get()
+    if counters is not None:
+        counters[field] = counters.get(field, 0) + value
+
+
+class RequestLogMiddleware:
+    """HTTP 요청마다 카운터를 설정하고 끝나면 요약 한 줄을 남기는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.LOG_REQUEST_SUMMARY:
+            await self.app(scope, receive, send)
+            return
+
+        _stats["requests"] += 1
+        counters: Dict[str, Any] = {}
+        status = [500]
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        token = _current_counters.set(counters)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_counters.reset(token)
+            if request_logger.isEnabledFor(logging.INFO):
+                request_logger.info(
+                    "method=%s path=%s status=%d duration_ms=%.1f%s",
+                    scope["method"], scope["path"], status[0], (time.perf_counter() - started) * 1000,
+                    "".join(f" {key}={value}" for key, value in counters.items())
+                )
+
+
+def get_stats() -> Dict[str, Any]:
+    return {
+        "enabled": settings.LOG_POLICY_ENABLED,
+        "request_summary": settings.LOG_REQUEST_SUMMARY,
+        **_stats,
+        "loggers": {name: dict(log_filter.stats) for name, log_filter in _filters.items()},
+    }
@@ -0,0 +1,348 @@
+## process_pool.py
+
+"""
+CPU 집약 작업용 프로세스 풀
+
+ARIMA 학습, 시계열 분해처럼 CPU를 오래 점유하는 계산을 이벤트 루프 밖의
+워커 프로세스에서 실행합니다. 작업별 제한 시간을 두고, 시간 초과나 요청 취소 시
+대기 중인 작업은 취소하며 이미 실행 중인 작업은 워커를 재시작해 중단합니다.
+
+- 동시에 제출하는 작업은 워커 수까지로 제한하고 나머지는 부모 프로세스에서 순서대로 대기
+  (대기 시간은 제한 시간에 포함하지 않음)
+- 제한 시간은 워커가 작업 시작을 알린 시점부터 계산 (워커 기동·모듈 임포트 시간 제외)
+- 다른 작업의 시간 초과로 풀이 재시작되어 중단된 작업은 한 번 다시 제출
+"""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Deque, Dict, Optional, Sequence, Tuple
+import asyncio
+import importlib
+import itertools
+import logging
+import multiprocessing
+import threading
+import weakref
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessPoolTimeoutError(TimeoutError):
+    """프로세스 풀 작업 제한 시간 초과"""
+
+
+def _preload_modules(module_names: Sequence[str]):
+    """워커 초기화 - 무거운 모듈을 미리 임포트"""
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+
+# 작업 시작 알림 큐 (워커 프로세스에서 _init_worker가 설정)
+_started_queue = None
+
+
+def _init_worker(module_names: Sequence[str], started_queue) -> None:
+    """워커 초기화 - 시작 알림 큐 설정 및 모듈 미리 임포트"""
+    global _started_queue
+    _started_queue = started_queue
+    _preload_modules(module_names)
+
+
+def _run_job(job_id: int, fn: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+    """워커에서 작업 시작을 알린 뒤 실행"""
+    _started_queue.put(job_id)
+    return fn(*args)
+
+
+def _noop() -> None:
+    return None
+
+
+def _set_started(started: asyncio.Future) -> None:
+    if not started.done():
+        started.set_result(None)
+
+
+class ManagedProcessPool:
+    """지연 생성·재시작이 가능한 ProcessPoolExecutor 래퍼"""
+
+    def __init__(
+        self,
+        max_workers: int,
+        timeout: float,
+        preload: Sequence[str] = (),
+        start_method: str = "spawn"
+    ):
+        """
+        Args:
+            max_workers: 워커 프로세스 수 (0이면 풀 없이 현재 프로세스에서 실행)
+            timeout: 작업별 기본 제한 시간(초)
+            preload: 워커 시작 시 미리 임포트할 모듈
+            start_method: 워커 시작 방식 (스레드가 있는 서버 프로세스를 fork하지 않도록 spawn 사용)
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.preload = tuple(preload)
+        self.start_method = start_method
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._started_queue = None
+        self._lock = threading.Lock()
+        # 실행 중인 작업 수와 워커를 기다리는 작업 (이벤트 루프, 대기 future)
+        self._running = 0
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        # 작업 ID → 시작 알림 콜백
+        self._job_ids = itertools.count()
+        self._starting: Dict[int, Callable[[], None]] = {}
+        # 시간 초과·취소로 재시작한 풀 (중단된 다른 작업을 다시 제출할지 판단)
+        self._aborted: "weakref.WeakSet[ProcessPoolExecutor]" = weakref.WeakSet()
+        self.stats = {
+            "submitted": 0, "completed": 0, "failed": 0, "timeouts": 0,
+            "cancelled": 0, "restarts": 0, "resubmitted": 0
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_workers > 0
+
+    async def run(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        함수를 워커 프로세스에서 실행하고 결과를 기다립니다.
+
+        fn과 인자는 pickle 가능해야 합니다. (모듈 최상위 함수)
+
+        Args:
+            fn: 실행할 함수
+            *args: 함수 인자
+            timeout: 제한 시간(초), None이면 기본값 사용
+
+        Returns:
+            함수 반환값
+
+        Raises:
+            ProcessPoolTimeoutError: 제한 시간 초과
+        """
+        if not self.enabled:
+            return fn(*args)
+
+        timeout = self.timeout if timeout is None else timeout
+        self.stats["submitted"] += 1
+        await self._acquire_slot()
+        try:
+            resubmitted = False
+            while True:
+                executor, future, started, job_id = self._submit(fn, args)
+                try:
+                    return await self._wait(executor, future, started, timeout, fn)
+                except BrokenProcessPool:
+                    if executor in self._aborted and not resubmitted:
+                        # 다른 작업의 시간 초과로 워커가 종료됨 - 새 풀에 다시 제출
+                        resubmitted = True
+                        self.stats["resubmitted"] += 1
+                        continue
+                    self.stats["failed"] += 1
+                    self._restart(executor)
+                    raise
+                finally:
+                    with self._lock:
+                        self._starting.pop(job_id, None)
+        finally:
+            self._release_slot()
+
+    async def _wait(
+        self,
+        executor: ProcessPoolExecutor,
+        future: Future,
+        started: asyncio.Future,
+        timeout: float,
+        fn: Callable[..., Any]
+    ) -> Any:
+        """워커가 작업을 시작하면 그때부터 제한 시간 동안 결과를 기다립니다."""
+        wrapped = asyncio.wrap_future(future)
+        try:
+            await asyncio.wait((started, wrapped), return_when=asyncio.FIRST_COMPLETED)
+            result = await asyncio.wait_for(wrapped, timeout=timeout)
+            self.stats["completed"] += 1
+            return result
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            self._abort(executor, future)
+            logger.warning(f"프로세스 풀 작업 시간 초과 ({getattr(fn, '__name__', fn)}, {timeout}s)")
+            raise ProcessPoolTimeoutError(f"작업이 {timeout}초 안에 완료되지 않았습니다.")
+        except asyncio.CancelledError:
+            self.stats["cancelled"] += 1
+            wrapped.cancel()
+            self._abort(executor, future)
+            raise
+        except BrokenProcessPool:
+            raise
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+
+    async def _acquire_slot(self):
+        """실행 슬롯 확보 - 워커 수만큼 실행 중이면 앞선 작업이 끝날 때까지 순서대로 대기"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._running < self.max_workers and not self._waiters:
+                self._running += 1
+                return
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 넘겨받은 뒤 취소됨
+                self._release_slot()
+            else:
+                with self._lock:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+                # 목록에 없으면 슬롯을 넘기는 중 - _hand_over에서 반납
+            raise
+
+    def _release_slot(self):
+        """실행 슬롯 반납 - 대기 중인 작업이 있으면 그 작업에 넘김"""
+        with self._lock:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(self._hand_over, waiter)
+                    return
+                except RuntimeError:
+                    # 대기하던 이벤트 루프가 종료됨
+                    continue
+            self._running -= 1
+
+    def _hand_over(self, waiter: asyncio.Future):
+        if waiter.done():
+            # 슬롯을 넘기는 사이 취소됨
+            self._release_slot()
+        else:
+            waiter.set_result(None)
+
+    def _submit(self, fn: Callable[..., Any], args: Tuple[Any, ...]):
+        loop = asyncio.get_running_loop()
+        started = loop.create_future()
+        job_id = next(self._job_ids)
+
+        def notify():
+            loop.call_soon_threadsafe(_set_started, started)
+
+        for attempt in range(2):
+            executor = self._get_executor()
+            with self._lock:
+                self._starting[job_id] = notify
+            try:
+                return executor, executor.submit(_run_job, job_id, fn, args), started, job_id
+            except (BrokenProcessPool, RuntimeError):
+                # 워커가 비정상 종료되었거나 종료된 풀이면 새 풀로 한 번 재시도
+                if attempt:
+                    raise
+                self._restart(executor)
+
+    def _watch_started(self, started_queue, processes: Dict[int, Any]):
+        """워커의 작업 시작 알림을 받아 대기 중인 작업에 전달 (풀마다 스레드 하나)"""
+        while True:
+            job_id = started_queue.get()
+            if job_id is None:
+                # 기동 중인 워커가 큐를 연결할 수 있도록 워커가 모두 종료될 때까지 큐 참조 유지
+                for process in list(processes.values()):
+                    process.join()
+                return
+            with self._lock:
+                notify = self._starting.pop(job_id, None)
+            if notify is not None:
+                try:
+                    notify()
+                except RuntimeError:
+                    # 기다리던 이벤트 루프가 종료됨
+                    pass
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context(self.start_method)
+                self._started_queue = context.SimpleQueue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self.preload, self._started_queue)
+                )
+                threading.Thread(
+                    target=self._watch_started, args=(self._started_queue, self._executor._processes),
+                    name="process-pool-started", daemon=True
+                ).start()
+                logger.info(f"프로세스 풀 시작 (workers={self.max_workers})")
+            return self._executor
+
+    def _abort(self, executor: ProcessPoolExecutor, future: Future):
+        """작업 중단 - 대기 중이면 취소, 실행 중이면 워커 재시작"""
+        if future.done() or future.cancel():
+            return
+        self._restart(executor)
+
+    def _restart(self, executor: ProcessPoolExecutor):
+        """
+        풀을 버리고 워커 프로세스를 종료합니다. 다음 작업 제출 시 새 풀이 생성됩니다.
+
+        ProcessPoolExecutor는 워커 하나가 종료되어도 풀 전체가 중단되므로 풀 단위로 재시작합니다.
+        """
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            started_queue, self._started_queue = self._started_queue, None
+            self._aborted.add(executor)
+            self.stats["restarts"] += 1
+        started_queue.put(None)
+
+        # 실행 중인 작업을 취소하는 공개 API가 없어 워커 프로세스를 직접 종료
+        processes = list((getattr(executor, "_processes", None) or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        logger.warning(f"프로세스 풀 재시작 (종료된 워커 {len(processes)}개)")
+
+    def start(self):
+        """워커 프로세스를 미리 띄웁니다. (첫 요청에서 워커 기동·모듈 임포트 지연 방지)"""
+        if not self.enabled:
+            return
+        executor = self._get_executor()
+        for _ in range(self.max_workers):
+            executor.submit(_noop)
+
+    def shutdown(self):
+        """앱 종료 시 풀 정리"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            started_queue, self._started_queue = self._started_queue, None
+        if executor is not None:
+            started_queue.put(None)
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.info("프로세스 풀 종료")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 상태 및 작업 통계"""
+        return {
+            "enabled": self.enabled,
+            "max_workers": self.max_workers,
+            "timeout": self.timeout,
+            "running": self._executor is not None,
+            "active_jobs": self._running,
+            "queued_jobs": len(self._waiters),
+            **self.stats
+        }
+
+
+# 전역 프로세스 풀 (예측·시계열 분석용)
+process_pool = ManagedProcessPool(
+    max_workers=settings.PROCESS_POOL_WORKERS,
+    timeout=settings.PROCESS_POOL_TIMEOUT,
+    preload=("app.utils.time_series_models",)
+)
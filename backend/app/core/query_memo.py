@@ -0,0 +1,131 @@
+## query_memo.py
+
+"""
+요청 범위 쿼리 메모
+
+한 요청 안에서 여러 서비스가 같은 쿼리를 반복 실행하는 경우(기간 비교의 일별 매출 2회,
+분석 필터의 3가지 분석 등)를 위해 (컴파일된 SQL, 파라미터)를 키로 조회 결과를 요청이
+끝날 때까지 보관합니다. 쿼리 계층(get_table().execute(), run_query())이 자동으로 사용하므로
+엔드포인트와 서비스 코드는 수정할 필요가 없습니다.
+
+- QueryMemoMiddleware가 HTTP 요청마다 빈 메모를 ContextVar에 설정 (요청 밖에서는 메모 없음)
+- 같은 요청의 하위 작업(asyncio 태스크, 스레드 풀)은 컨텍스트를 복사하므로 같은 메모를 공유
+- 조회가 아닌 SQL(INSERT, UPDATE 등)을 실행하면 해당 요청의 메모를 비움
+- 결과 행(dict)은 같은 요청 안에서 공유되므로 수정하지 않아야 함 (목록은 호출마다 새로 생성)
+"""
+
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, List, Optional
+import logging
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 누적 통계 (모든 요청)
+_stats = {"requests": 0, "hits": 0, "misses": 0, "skipped": 0}
+
+
+def freeze(value: Any) -> Hashable:
+    """쿼리 파라미터를 키로 쓸 수 있게 변환 (목록·dict → 튜플)"""
+    if isinstance(value, dict):
+        return tuple(sorted((str(name), freeze(item)) for name, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(freeze(item) for item in value))
+    return value
+
+
+class QueryMemo:
+    """요청 하나의 쿼리 결과 보관소"""
+
+    __slots__ = ("_results", "rows", "max_rows")
+
+    def __init__(self, max_rows: int):
+        """
+        Args:
+            max_rows: 보관할 결과 행 수 합계 상한 (넘으면 더 저장하지 않음)
+        """
+        self._results: Dict[Hashable, List[Dict[str, Any]]] = {}
+        self.rows = 0
+        self.max_rows = max_rows
+
+    def get(self, key: Hashable) -> Optional[List[Dict[str, Any]]]:
+        return self._results.get(key)
+
+    def set(self, key: Hashable, rows: List[Dict[str, Any]]) -> bool:
+        if self.rows + len(rows) > self.max_rows:
+            return False
+        self._results[key] = rows
+        self.rows += len(rows)
+        return True
+
+    def clear(self) -> None:
+        self._results.clear()
+        self.rows = 0
+
+
+_current_memo: ContextVar[Optional[QueryMemo]] = ContextVar("query_memo", default=None)
+
+
+def get_current_memo() -> Optional[QueryMemo]:
+    """현재 요청의 메모 (요청 밖이거나 비활성화 시 None)"""
+    if not settings.QUERY_MEMO_ENABLED:
+        return None
+    return _current_memo.get()
+
+
+def memoized_query(key: Hashable, loader: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    현재 요청에서 같은 키로 조회한 적이 있으면 저장된 결과를, 없으면 loader() 결과를 반환합니다.
+
+    Args:
+        key: (컴파일된 SQL, 고정된 파라미터) 등 쿼리를 식별하는 키
+        loader: 실제 조회 함수
+    """
+    memo = get_current_memo()
+    if memo is None:
+        return loader()
+
+    rows = memo.get(key)
+    if rows is not None:
+        _stats["hits"] += 1
+        logger.debug(f"요청 쿼리 메모 적중: {len(rows)} 레코드")
+        return list(rows)
+
+    _stats["misses"] += 1
+    rows = loader()
+    if not memo.set(key, rows):
+        _stats["skipped"] += 1
+    return list(rows)
+
+
+def invalidate_current() -> None:
+    """현재 요청의 메모 비우기 (쓰기 쿼리 실행 후)"""
+    memo = _current_memo.get()
+    if memo is not None:
+        memo.clear()
+
+
+class QueryMemoMiddleware:
+    """HTTP 요청마다 새 쿼리 메모를 설정하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.QUERY_MEMO_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        _stats["requests"] += 1
+        token = _current_memo.set(QueryMemo(max_rows=settings.QUERY_MEMO_MAX_ROWS))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_memo.reset(token)
+
+
+def get_stats() -> Dict[str, Any]:
+    return {"enabled": settings.QUERY_MEMO_ENABLED, "max_rows": settings.QUERY_MEMO_MAX_ROWS, **_stats}
@@ -0,0 +1,130 @@
+## responses.py
+
+"""
+빠른 JSON 응답
+
+- get_type_adapter(): 응답 타입별 TypeAdapter. 서비스는 행마다 모델을 생성하는 대신
+  dict 목록을 validate_python()으로 한 번에 검증합니다. (pydantic v2에서는 model_construct보다
+  일괄 검증이 더 빠릅니다)
+- model_response(): 서비스가 만든 Pydantic 객체를 TypeAdapter.dump_json(Rust 직렬화)으로
+  바로 JSON bytes로 변환합니다. FastAPI의 응답 재검증과 dict 변환·json.dumps 단계를 건너뜁니다.
+  (response_model은 문서화 용도로 그대로 둡니다)
+- ORJSONResponse: dict 형태 응답을 orjson으로 직렬화합니다. (orjson 미설치 시 표준 json)
+- chart_response(): 차트 엔드포인트의 ?format=columnar 지원. 객체 배열 대신 필드별 배열
+  ({"date": [...], "total_sales": [...]})로 응답해 반복되는 키를 없앱니다.
+
+성능 비교: python -m benchmarks.bench_serialization
+"""
+
+from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, get_args, get_origin
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(response_type: Any) -> TypeAdapter:
+    """응답 타입별 TypeAdapter (스키마 빌드 비용이 커서 타입마다 한 번만 생성)"""
+    return TypeAdapter(response_type)
+
+
+def model_response(content: Any, response_type: Any, status_code: int = 200) -> Response:
+    """
+    서비스 결과를 검증 없이 JSON 응답으로 변환합니다.
+
+    content는 response_type에 맞게 서비스에서 생성한 신뢰할 수 있는 데이터여야 합니다.
+
+    Args:
+        content: 응답 데이터 (Pydantic 모델 또는 그 리스트)
+        response_type: 응답 타입 (예: List[HourlySalesResponse])
+        status_code: HTTP 상태 코드
+    """
+    return Response(
+        content=get_type_adapter(response_type).dump_json(content),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+def _orjson_default(value: Any) -> Any:
+    # orjson이 직접 처리하지 못하는 타입
+    if isinstance(value, BaseModel):
+        # 응답 모델은 별칭·커스텀 직렬화가 없으므로 필드 값을 그대로 사용 (중첩 모델은 재귀 처리)
+        return value.__dict__
+    return jsonable_encoder(value)
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson 직렬화 JSON 응답 (numpy 값과 Pydantic 모델 포함 dict 지원)"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(jsonable_encoder(content))
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+class ResponseFormat(str, Enum):
+    """차트 엔드포인트 응답 형식"""
+    ROWS = "rows"          # 객체 배열 (기본)
+    COLUMNAR = "columnar"  # 필드별 배열
+
+
+def _list_item_model(annotation: Any) -> Optional[type]:
+    """List[Model] 타입이면 Model, 아니면 None"""
+    if get_origin(annotation) is not list:
+        return None
+    args = get_args(annotation)
+    if args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+        return args[0]
+    return None
+
+
+def to_columns(rows: List[BaseModel], model: type) -> Dict[str, List[Any]]:
+    """모델 목록을 필드별 배열로 변환 (모델 필드 순서 유지, 빈 목록은 빈 배열)"""
+    return {name: list(map(attrgetter(name), rows)) for name in model.model_fields}
+
+
+def to_columnar(content: Any, response_type: Any) -> Any:
+    """
+    응답 데이터를 열 형식으로 변환합니다.
+
+    - List[Model] 응답: {필드: [값, ...]}
+    - 모델 응답: List[Model] 필드만 열 형식으로 바꾸고 나머지 필드는 그대로
+    """
+    item_model = _list_item_model(response_type)
+    if item_model is not None:
+        return to_columns(content, item_model)
+
+    result = {}
+    for name, field in response_type.model_fields.items():
+        value = getattr(content, name)
+        item_model = _list_item_model(field.annotation)
+        result[name] = to_columns(value, item_model) if item_model is not None else value
+    return result
+
+
+def chart_response(content: Any, response_type: Any, response_format: ResponseFormat = ResponseFormat.ROWS) -> Response:
+    """
+    차트 엔드포인트 응답 (형식 선택)
+
+    Args:
+        content: 서비스 결과
+        response_type: 응답 타입 (List[Model] 또는 List[Model] 필드를 가진 모델)
+        response_format: rows(객체 배열) 또는 columnar(필드별 배열)
+    """
+    if response_format == ResponseFormat.COLUMNAR:
+        return ORJSONResponse(to_columnar(content, response_type))
+    return model_response(content, response_type)
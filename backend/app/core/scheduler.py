@@ -0,0 +1,420 @@
+## scheduler.py
+
+"""
+프로세스 내 작업 스케줄러
+
+집계 갱신, 배치 예측, 캐시 예열처럼 주기적으로 실행할 작업을 서버 프로세스 안에서 실행합니다.
+외부 cron 없이 FastAPI lifespan에서 시작·종료합니다.
+
+- cron 형식 일정 ("분 시 일 월 요일", *, */n, a-b, a,b 지원)
+- 작업별 지터(초) - 여러 워커 프로세스가 같은 시각에 몰리지 않도록 실행 시각을 분산
+- 단일 실행 잠금 - 같은 호스트의 여러 워커 프로세스 중 하나만 실행 (잠금 파일, fcntl 미지원 OS는 프로세스 내 잠금만)
+  잠금 파일에 마지막으로 완료한 실행 시각(cron 기준)을 기록해 다른 워커가 같은 회차를 다시 실행하지 않음
+- 중복 실행 방지 - 이전 실행이 끝나지 않았으면 이번 실행은 건너뜀
+- 작업별 실행·실패·건너뜀 횟수, 마지막 실행 시간 등 통계
+- 시간 소스(Clock)를 주입할 수 있어 ManualClock으로 실제 시간을 기다리지 않고 검증 가능
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional
+import asyncio
+import logging
+import os
+import random
+import tempfile
+import time
+
+try:
+    import fcntl
+except ImportError:  # 선택 의존성 (Windows)
+    fcntl = None
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Clock:
+    """시스템 시간 소스"""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+
+class ManualClock(Clock):
+    """수동으로 진행하는 시간 소스 (검증용, sleep은 즉시 시간을 진행)"""
+
+    def __init__(self, start: datetime):
+        self.current = start
+
+    def now(self) -> datetime:
+        return self.current
+
+    def advance(self, seconds: float) -> None:
+        self.current += timedelta(seconds=seconds)
+
+    async def sleep(self, seconds: float) -> None:
+        # 먼저 다른 태스크(시작된 작업)를 실행한 뒤 시간 진행
+        await asyncio.sleep(0)
+        self.advance(seconds)
+
+
+class CronSchedule:
+    """5필드 cron 일정 (분 시 일 월 요일, 요일은 0=일요일, 분 단위)"""
+
+    _FIELDS = (("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31), ("month", 1, 12), ("weekday", 0, 6))
+
+    def __init__(self, expression: str):
+        """
+        Args:
+            expression: cron 식 (예: "*/10 * * * *", "0 3 * * *", "30 8 * * 1-5")
+
+        Raises:
+            ValueError: 형식이 잘못된 경우
+        """
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"cron 식은 5개 필드여야 합니다: {expression!r}")
+        self.expression = expression
+        values = {}
+        for text, (name, low, high) in zip(parts, self._FIELDS):
+            values[name] = self._parse_field(text, low, 7 if name == "weekday" else high)
+        self.minutes = values["minute"]
+        self.hours = values["hour"]
+        self.days = values["day"]
+        self.months = values["month"]
+        # 7도 일요일로 허용
+        self.weekdays = frozenset(day % 7 for day in values["weekday"])
+        # 일·요일이 모두 지정되면 둘 중 하나만 맞아도 실행 (cron 규칙)
+        self._day_any = parts[2] != "*" and parts[4] != "*"
+
+    @staticmethod
+    def _parse_field(text: str, low: int, high: int) -> FrozenSet[int]:
+        values = set()
+        for item in text.split(","):
+            base, _, step_text = item.partition("/")
+            step = int(step_text) if step_text else 1
+            if base == "*":
+                start, end = low, high
+            elif "-" in base:
+                start, end = (int(value) for value in base.split("-", 1))
+            else:
+                start = int(base)
+                end = high if step_text else start
+            if step <= 0 or start < low or end > high or start > end:
+                raise ValueError(f"cron 필드 범위 오류: {text!r}")
+            values.update(range(start, end + 1, step))
+        return frozenset(values)
+
+    def _day_matches(self, dt: datetime) -> bool:
+        day_ok = dt.day in self.days
+        weekday_ok = (dt.weekday() + 1) % 7 in self.weekdays
+        return (day_ok or weekday_ok) if self._day_any else (day_ok and weekday_ok)
+
+    def matches(self, dt: datetime) -> bool:
+        return (
+            dt.minute in self.minutes and dt.hour in self.hours
+            and dt.month in self.months and self._day_matches(dt)
+        )
+
+    def next_after(self, dt: datetime) -> datetime:
+        """dt 이후(초과) 첫 실행 시각"""
+        candidate = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year, month = (candidate.year + 1, 1) if candidate.month == 12 else (candidate.year, candidate.month + 1)
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"실행 시각을 찾을 수 없는 cron 식: {self.expression!r}")
+
+
+class _RunLock:
+    """
+    작업별 단일 실행 잠금 (같은 호스트의 프로세스 간, 잠금 파일 flock)
+
+    잠금 파일 내용은 마지막으로 완료한 실행 회차(cron 실행 시각, ISO 형식)입니다.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._file = None
+
+    def acquire(self) -> bool:
+        if self.path is None or fcntl is None:
+            return True
+        handle = open(self.path, "a+")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        self._file = handle
+        return True
+
+    def completed(self, slot: datetime) -> bool:
+        """slot 회차(또는 이후 회차)를 이미 다른 프로세스가 완료했는지 (잠금을 가진 상태에서 호출)"""
+        if self._file is None:
+            return False
+        self._file.seek(0)
+        content = self._file.read().strip()
+        try:
+            return bool(content) and datetime.fromisoformat(content) >= slot
+        except ValueError:
+            return False
+
+    def mark_completed(self, slot: datetime) -> None:
+        """slot 회차 완료 기록"""
+        if self._file is None:
+            return
+        self._file.seek(0)
+        self._file.truncate()
+        self._file.write(slot.isoformat())
+        self._file.flush()
+
+    def release(self) -> None:
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+
+class ScheduledJob:
+    """등록된 작업 하나"""
+
+    def __init__(
+        self,
+        name: str,
+        schedule: CronSchedule,
+        func: Callable[[], Awaitable[Any]],
+        jitter: float = 0.0,
+        single_run: bool = True
+    ):
+        self.name = name
+        self.schedule = schedule
+        self.func = func
+        self.jitter = jitter
+        self.single_run = single_run
+        # 다음 실행 회차(cron 실행 시각)와 지터를 더한 실제 실행 시각
+        self.next_slot: Optional[datetime] = None
+        self.next_run: Optional[datetime] = None
+        self.task: Optional[asyncio.Task] = None
+        self.active = False
+        self.stats: Dict[str, Any] = {
+            "runs": 0, "failures": 0, "skipped_overlap": 0, "skipped_locked": 0, "skipped_done": 0,
+            "last_started": None, "last_finished": None, "last_duration": None, "last_error": None,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self.active or (self.task is not None and not self.task.done())
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "schedule": self.schedule.expression,
+            "jitter": self.jitter,
+            "single_run": self.single_run,
+            "running": self.running,
+            "next_run": self.next_run.isoformat() if self.next_run else None,
+            **self.stats
+        }
+
+
+class JobScheduler:
+    """asyncio 기반 작업 스케줄러"""
+
+    # 한 번에 기다리는 최대 시간(초) - 시스템 시간 변경 등에도 다음 실행 시각을 다시 계산
+    MAX_SLEEP = 60.0
+
+    def __init__(
+        self,
+        clock: Optional[Clock] = None,
+        lock_dir: Optional[str] = None,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Args:
+            clock: 시간 소스 (기본값: 시스템 시간)
+            lock_dir: 단일 실행 잠금 파일 디렉터리 (None이면 프로세스 내 중복 방지만)
+            rng: 지터 난수 생성기 (검증 시 시드 고정)
+        """
+        self.clock = clock or Clock()
+        self.lock_dir = lock_dir
+        self.rng = rng or random.Random()
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def _schedule_next(self, job: ScheduledJob, after: datetime) -> None:
+        """after 이후 다음 실행 회차와 실행 시각(회차 + 지터) 계산"""
+        jitter = self.rng.uniform(0, job.jitter) if job.jitter > 0 else 0.0
+        job.next_slot = job.schedule.next_after(after)
+        job.next_run = job.next_slot + timedelta(seconds=jitter)
+
+    def add_job(
+        self,
+        name: str,
+        schedule: str,
+        func: Callable[[], Awaitable[Any]],
+        jitter: Optional[float] = None,
+        single_run: bool = True
+    ) -> ScheduledJob:
+        """
+        작업 등록 (같은 이름이 있으면 교체)
+
+        Args:
+            name: 작업 이름 (잠금 파일 이름에도 사용)
+            schedule: cron 식
+            func: 실행할 코루틴 함수 (인자 없음)
+            jitter: 실행 시각에 더할 최대 임의 지연(초), None이면 SCHEDULER_JITTER
+            single_run: 여러 프로세스 중 하나만 실행할지 여부
+                        (공유 데이터를 갱신하는 작업은 True, 프로세스별 캐시를 채우는 작업은 False)
+        """
+        job = ScheduledJob(
+            name, CronSchedule(schedule), func,
+            jitter=settings.SCHEDULER_JITTER if jitter is None else jitter,
+            single_run=single_run
+        )
+        self._schedule_next(job, self.clock.now())
+        self.jobs[name] = job
+        logger.info(f"작업 등록: {name} ({schedule}), 다음 실행 {job.next_run:%Y-%m-%d %H:%M:%S}")
+        return job
+
+    def _lock_for(self, job: ScheduledJob) -> _RunLock:
+        if not job.single_run or self.lock_dir is None:
+            return _RunLock(None)
+        return _RunLock(os.path.join(self.lock_dir, f"lepain-scheduler-{job.name}.lock"))
+
+    async def run_job(self, name: str, slot: Optional[datetime] = None) -> bool:
+        """
+        작업을 지금 실행하고 끝날 때까지 기다립니다.
+
+        Args:
+            name: 작업 이름
+            slot: 실행 회차(cron 실행 시각), None이면 회차와 관계없이 실행 (수동 실행)
+
+        Returns:
+            실행 여부 (이전 실행 중이거나 다른 프로세스가 잠금을 가졌거나 같은 회차를 이미 완료한 경우 False)
+        """
+        job = self.jobs[name]
+        if job.active:
+            job.stats["skipped_overlap"] += 1
+            logger.info(f"작업 {name}: 이전 실행이 끝나지 않아 건너뜀")
+            return False
+
+        lock = self._lock_for(job)
+        if not lock.acquire():
+            job.stats["skipped_locked"] += 1
+            logger.info(f"작업 {name}: 다른 프로세스에서 실행 중이라 건너뜀")
+            return False
+        if slot is not None and lock.completed(slot):
+            lock.release()
+            job.stats["skipped_done"] += 1
+            logger.info(f"작업 {name}: {slot:%Y-%m-%d %H:%M} 회차를 다른 프로세스가 완료해 건너뜀")
+            return False
+
+        job.active = True
+        started = time.perf_counter()
+        job.stats["last_started"] = self.clock.now().isoformat()
+        try:
+            await job.func()
+            job.stats["last_error"] = None
+            if slot is not None:
+                # 실패한 회차는 기록하지 않음 (다른 프로세스가 지터 이후 다시 시도)
+                lock.mark_completed(slot)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            job.stats["failures"] += 1
+            job.stats["last_error"] = str(e)
+            logger.error(f"작업 {name} 실패: {e}")
+        finally:
+            lock.release()
+            job.active = False
+            job.stats["runs"] += 1
+            job.stats["last_finished"] = self.clock.now().isoformat()
+            job.stats["last_duration"] = round(time.perf_counter() - started, 3)
+        return True
+
+    def _launch(self, job: ScheduledJob, slot: Optional[datetime]) -> bool:
+        """작업을 백그라운드 태스크로 시작 (실행 중이면 건너뜀)"""
+        if job.running:
+            job.stats["skipped_overlap"] += 1
+            logger.info(f"작업 {job.name}: 이전 실행이 끝나지 않아 건너뜀")
+            return False
+        job.task = asyncio.create_task(self.run_job(job.name, slot), name=f"job:{job.name}")
+        return True
+
+    async def run_pending(self, wait: bool = False) -> List[str]:
+        """
+        실행 시각이 지난 작업을 시작하고 다음 실행 시각을 계산합니다.
+
+        Args:
+            wait: 시작한 작업이 끝날 때까지 기다릴지 여부 (검증용)
+
+        Returns:
+            시작한 작업 이름 목록
+        """
+        now = self.clock.now()
+        started = []
+        for job in self.jobs.values():
+            if job.next_run is None or job.next_run > now:
+                continue
+            slot = job.next_slot
+            self._schedule_next(job, now)
+            if self._launch(job, slot):
+                started.append(job.name)
+        if wait:
+            await asyncio.gather(*(self.jobs[name].task for name in started))
+        return started
+
+    async def _run_loop(self) -> None:
+        while True:
+            pending = [job.next_run for job in self.jobs.values() if job.next_run is not None]
+            if not pending:
+                await self.clock.sleep(self.MAX_SLEEP)
+                continue
+            delay = (min(pending) - self.clock.now()).total_seconds()
+            if delay > 0:
+                await self.clock.sleep(min(delay, self.MAX_SLEEP))
+                continue
+            await self.run_pending()
+
+    def start(self) -> None:
+        """스케줄러 루프 시작 (현재 이벤트 루프의 태스크)"""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run_loop(), name="job_scheduler")
+        logger.info(f"작업 스케줄러 시작 ({len(self.jobs)}개 작업)")
+
+    async def stop(self) -> None:
+        """스케줄러 루프와 실행 중인 작업 취소"""
+        tasks = [job.task for job in self.jobs.values() if job.task is not None and not job.task.done()]
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if tasks:
+            logger.info("작업 스케줄러 종료")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """작업별 일정·실행 통계"""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "jobs": {name: job.get_stats() for name, job in self.jobs.items()},
+        }
+
+
+# 서버 스케줄러 인스턴스
+job_scheduler = JobScheduler(lock_dir=settings.SCHEDULER_LOCK_DIR or tempfile.gettempdir())
@@ -0,0 +1,464 @@
+## shared_cache.py
+
+"""
+프로세스 간 공유 캐시 (메모리 매핑 파일)
+
+uvicorn --workers N 으로 여러 워커 프로세스를 실행하면 결과 캐시와 일자별 집계 캐시가
+워커마다 따로 채워집니다. SharedCacheStore는 한 워커가 계산한 항목을 공유 디렉터리
+(기본: /dev/shm)의 파일 하나로 저장해 다른 워커가 같은 DB 조회·집계를 다시 하지 않게 합니다.
+
+공유되는 것은 계산(예열 포함)이며 메모리는 아닙니다. 읽은 값은 워커마다 객체로 역직렬화되어
+각자의 프로세스 캐시에도 저장되므로 캐시 메모리는 여전히 워커 수만큼 사용합니다.
+(일자별 집계 DailyPartial은 set·pydantic 모델로 구성되어 복사 없이 참조할 수 있는 버퍼가 없음)
+
+- 쓰기: 임시 파일에 기록한 뒤 os.replace로 교체 (원자적) - 읽는 쪽은 항상 완전한 이전
+  또는 새 항목만 보므로 읽기에 잠금이 필요 없음
+- 값은 pickle 프로토콜 5로 저장하고 numpy 배열 버퍼는 별도 영역에 기록 (읽을 때 버퍼는 복사하지 않음)
+- 보안: 디렉터리는 현재 사용자 전용(0700)으로 만들고 소유자가 다르거나 그룹·다른 사용자가
+  쓸 수 있으면 사용하지 않음, 항목 파일은 0600으로 생성, 항목마다 배포별 키로 서명(keyed BLAKE2b)해
+  서명이 맞는 항목만 unpickle
+- 항목마다 계산 시점의 데이터 버전과 의존 범위를 저장하고, 읽는 프로세스가 그 버전 이후의
+  변경(data_version_bus.changes_since)과 범위가 겹치지 않을 때만 사용
+- 만료·무효 항목 제거와 크기 상한(오래 전에 기록된 항목부터 제거)은 evict()에서 처리
+  (스케줄러 cache_eviction 작업)
+
+파일 형식: 헤더 | 서명 | 버퍼 위치 표 | 메타(pickle: 키, 의존 범위) | 값(pickle) | 버퍼...
+"""
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+import hashlib
+import hmac
+import logging
+import mmap
+import os
+import pickle
+import stat
+import struct
+import tempfile
+import threading
+import time
+
+from app.core.config import settings
+from app.core.data_version import DataChange, data_version_bus
+
+logger = logging.getLogger(__name__)
+
+# 헤더: 형식 식별자, 데이터 버전(-1은 없음), 만료 시각(epoch 초), 메타 길이, 값 길이, 버퍼 수
+_HEADER = struct.Struct("<4sqdIQI")
+_BUFFER_ENTRY = struct.Struct("<QQ")
+_MAGIC = b"LPC2"
+# 서명 길이 (헤더 바로 뒤, 헤더·위치 표·메타·값·버퍼 전체에 대한 keyed BLAKE2b)
+_TAG_SIZE = 32
+# SHARED_CACHE_SECRET이 없을 때 공유 디렉터리에 만드는 서명 키 파일
+_KEY_FILE = "secret.key"
+_KEY_SIZE = 32
+# 버퍼 시작 위치 정렬 (numpy 정렬 요구 충족)
+_ALIGN = 64
+# 쓰기 도중 중단된 임시 파일 정리 기준(초)
+_STALE_TMP_SECONDS = 60.0
+
+
+def _default_dir() -> str:
+    """공유 디렉터리 기본값 - /dev/shm(없으면 임시 디렉터리) 아래 DB 파일별 하위 디렉터리"""
+    from app.core.database import DB_PATH
+
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    digest = hashlib.blake2b(DB_PATH.encode("utf-8"), digest_size=6).hexdigest()
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(base, f"lepain-cache-{uid}-{digest}")
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class SharedCacheStore:
+    """파일 하나에 항목 하나를 저장하는 프로세스 간 공유 캐시 (읽기 무잠금)"""
+
+    def __init__(self, directory: str, max_bytes: int, default_ttl: float):
+        """
+        Args:
+            directory: 공유 디렉터리 (같은 호스트의 워커가 모두 같은 경로 사용)
+            max_bytes: 항목 파일 크기 합계 상한 (evict() 시 적용)
+            default_ttl: 기본 만료 시간(초)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        # 서명 키 (디렉터리 검증 후 설정), 검증에 실패하면 _unsafe
+        self._key: Optional[bytes] = None
+        self._unsafe = False
+        self._lock = threading.Lock()
+        self._init_lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "writes": 0, "errors": 0, "evictions": 0}
+
+    def _count(self, field: str, value: int = 1) -> None:
+        with self._lock:
+            self.stats[field] += value
+
+    def _prepare(self) -> bool:
+        """
+        공유 디렉터리 생성·검증과 서명 키 준비 (처음 한 번)
+
+        다른 사용자가 먼저 만들었거나 쓸 수 있는 디렉터리는 항목을 바꿔 넣을 수 있으므로
+        사용하지 않습니다. (이 경우 공유 캐시 없이 동작)
+
+        Returns:
+            사용 가능 여부
+        """
+        if self._key is not None:
+            return True
+        if self._unsafe:
+            return False
+        with self._init_lock:
+            if self._key is not None:
+                return True
+            try:
+                os.makedirs(self.directory, mode=0o700, exist_ok=True)
+                info = os.lstat(self.directory)
+                problem = None
+                if not stat.S_ISDIR(info.st_mode):
+                    problem = "디렉터리가 아님 (심볼릭 링크 포함)"
+                elif hasattr(os, "getuid") and info.st_uid != os.getuid():
+                    problem = f"소유자가 현재 사용자가 아님 (uid {info.st_uid})"
+                elif info.st_mode & 0o022:
+                    problem = f"그룹·다른 사용자가 쓸 수 있음 (권한 {oct(info.st_mode & 0o777)})"
+                if problem:
+                    logger.error(f"공유 캐시 디렉터리를 사용하지 않음 ({self.directory}): {problem}")
+                    self._unsafe = True
+                    return False
+                self._key = self._load_key()
+                return True
+            except (OSError, ValueError) as e:
+                logger.warning(f"공유 캐시 디렉터리 준비 실패: {e}")
+                self._count("errors")
+                return False
+
+    def _load_key(self) -> bytes:
+        """서명 키 - SHARED_CACHE_SECRET, 없으면 공유 디렉터리의 키 파일 (처음 워커가 생성)"""
+        if settings.SHARED_CACHE_SECRET:
+            return settings.SHARED_CACHE_SECRET.encode("utf-8")
+
+        path = os.path.join(self.directory, _KEY_FILE)
+        if not os.path.exists(path):
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(os.urandom(_KEY_SIZE))
+            try:
+                # 이미 있으면(다른 워커가 먼저 생성) 그 키를 사용
+                os.link(tmp_path, path)
+            except FileExistsError:
+                pass
+            finally:
+                os.unlink(tmp_path)
+        with open(path, "rb") as f:
+            key = f.read()
+        if len(key) != _KEY_SIZE:
+            raise ValueError(f"공유 캐시 키 파일 크기 오류: {path}")
+        return key
+
+    def _signer(self) -> "hashlib.blake2b":
+        return hashlib.blake2b(key=self._key, digest_size=_TAG_SIZE)
+
+    def _path(self, key: Hashable) -> str:
+        digest = hashlib.blake2b(pickle.dumps(key, protocol=4), digest_size=16).hexdigest()
+        return os.path.join(self.directory, f"{digest}.bin")
+
+    @staticmethod
+    def _is_valid(entry_version: Optional[int], scope: Any, version: Optional[int]) -> bool:
+        """
+        다른 프로세스가 entry_version에서 저장한 항목을 현재 버전(version)에서 사용할 수 있는지
+
+        그 사이의 변경이 모두 이력에 있고 의존 범위(scope, None이면 전체)와 겹치지 않아야 합니다.
+        현재 버전보다 새로운 항목은 이 프로세스가 아직 확인하지 않은 변경이 있으므로 사용하지 않습니다.
+        """
+        if entry_version == version:
+            return True
+        if entry_version is None or version is None or entry_version > version:
+            return False
+        changes = data_version_bus.changes_since(entry_version)
+        if changes is None:
+            return False
+        return not any(
+            scope is None or scope.affected_by(change)
+            for change in changes if change.version <= version
+        )
+
+    def _read_meta(self, view: memoryview) -> Tuple[int, float, Any, Any, Tuple[int, int], List[Tuple[int, int]]]:
+        """
+        서명 확인 후 헤더와 메타 읽기 (서명이 맞지 않으면 unpickle하지 않고 ValueError)
+
+        Returns:
+            (버전, 만료 시각, 키, 의존 범위, 값 (위치, 길이), 버퍼 (위치, 길이) 목록)
+        """
+        magic, version, expires_at, meta_len, value_len, nbufs = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC:
+            raise ValueError("공유 캐시 파일 형식이 아님")
+        table_offset = _HEADER.size + _TAG_SIZE
+        meta_offset = table_offset + nbufs * _BUFFER_ENTRY.size
+        if meta_offset + meta_len + value_len > len(view):
+            raise ValueError("공유 캐시 파일 길이 오류")
+        buffers = [_BUFFER_ENTRY.unpack_from(view, table_offset + i * _BUFFER_ENTRY.size) for i in range(nbufs)]
+
+        signer = self._signer()
+        signer.update(view[:_HEADER.size])
+        signer.update(view[table_offset:meta_offset + meta_len + value_len])
+        for start, length in buffers:
+            signer.update(view[start:start + length])
+        if not hmac.compare_digest(signer.digest(), view[_HEADER.size:table_offset]):
+            raise ValueError("공유 캐시 항목 서명 불일치")
+
+        key, scope = pickle.loads(view[meta_offset:meta_offset + meta_len])
+        return version, expires_at, key, scope, (meta_offset + meta_len, value_len), buffers
+
+    def get(self, key: Hashable, version: Optional[int]) -> Tuple[bool, Any]:
+        """
+        공유 캐시 조회 (잠금 없이 메모리 매핑으로 읽음)
+
+        Args:
+            key: 캐시 키 (pickle 가능한 정규화된 값)
+            version: 현재 데이터 버전
+
+        Returns:
+            (적중 여부, 값)
+        """
+        if not self._prepare():
+            self._count("misses")
+            return False, None
+        try:
+            with open(self._path(key), "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            # 항목 없음 또는 빈 파일
+            self._count("misses")
+            return False, None
+        except OSError as e:
+            logger.warning(f"공유 캐시 읽기 실패: {e}")
+            self._count("errors")
+            return False, None
+
+        view = memoryview(mm)
+        buffers: List[Tuple[int, int]] = []
+        try:
+            entry_version, expires_at, stored_key, scope, (value_offset, value_len), buffers = self._read_meta(view)
+            if stored_key != key:
+                # 해시 충돌
+                self._count("misses")
+                return False, None
+            if expires_at <= time.time() or not self._is_valid(
+                None if entry_version < 0 else entry_version, scope, version
+            ):
+                self._count("stale")
+                return False, None
+            value = pickle.loads(
+                view[value_offset:value_offset + value_len],
+                buffers=[view[start:start + length] for start, length in buffers]
+            )
+            self._count("hits")
+            return True, value
+        except Exception as e:
+            logger.warning(f"공유 캐시 항목 읽기 실패: {e}")
+            self._count("errors")
+            return False, None
+        finally:
+            # 배열이 매핑된 메모리를 참조하지 않으면 바로 해제 (참조하면 배열이 해제될 때 함께 해제)
+            if not buffers:
+                view.release()
+                try:
+                    mm.close()
+                except BufferError:
+                    pass
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        version: Optional[int],
+        ttl: Optional[float] = None,
+        scope: Any = None
+    ) -> bool:
+        """
+        공유 캐시 저장 (임시 파일 기록 후 원자적 교체)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값 (pickle 불가능하면 저장하지 않음)
+            version: 값을 계산한 데이터 버전
+            ttl: 만료 시간(초), None이면 기본값
+            scope: 의존 데이터 범위 (affected_by(change) 메서드, None이면 모든 변경에 의존)
+
+        Returns:
+            저장 여부
+        """
+        if not self._prepare():
+            return False
+        buffers: List[pickle.PickleBuffer] = []
+        try:
+            meta = pickle.dumps((key, scope), protocol=5)
+            payload = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        except Exception as e:
+            logger.debug(f"공유 캐시 저장 건너뜀 (pickle 불가): {e}")
+            self._count("errors")
+            return False
+
+        raws = [buffer.raw() for buffer in buffers]
+        expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        table_size = len(raws) * _BUFFER_ENTRY.size
+        offset = _align(_HEADER.size + _TAG_SIZE + table_size + len(meta) + len(payload))
+        positions = []
+        for raw in raws:
+            positions.append((offset, raw.nbytes))
+            offset = _align(offset + raw.nbytes)
+        if offset > self.max_bytes:
+            return False
+
+        header = _HEADER.pack(
+            _MAGIC, -1 if version is None else version, expires_at, len(meta), len(payload), len(raws)
+        )
+        table = b"".join(_BUFFER_ENTRY.pack(*position) for position in positions)
+        signer = self._signer()
+        for part in (header, table, meta, payload, *raws):
+            signer.update(part)
+
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(signer.digest())
+                f.write(table)
+                f.write(meta)
+                f.write(payload)
+                for (start, _), raw in zip(positions, raws):
+                    f.seek(start)
+                    f.write(raw)
+                f.truncate(offset)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"공유 캐시 쓰기 실패: {e}")
+            self._count("errors")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return False
+        self._count("writes")
+        return True
+
+    def _scan(self) -> List[Tuple[str, os.stat_result]]:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        files = []
+        for name in names:
+            if not name.endswith((".bin", ".tmp")):
+                # 서명 키 파일 등
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                files.append((path, os.stat(path)))
+            except FileNotFoundError:
+                continue
+        return files
+
+    @staticmethod
+    def _unlink(path: str) -> bool:
+        try:
+            os.unlink(path)
+            return True
+        except FileNotFoundError:
+            # 다른 워커가 먼저 제거
+            return False
+
+    def _entry_is_stale(self, path: str, now: float) -> bool:
+        """만료되었거나 현재 데이터 버전에서 사용할 수 없는 항목인지 (서명이 맞지 않는 항목 포함)"""
+        try:
+            with open(path, "rb") as f:
+                head = f.read(_HEADER.size)
+                magic, _, expires_at, _, _, _ = _HEADER.unpack(head)
+                if magic != _MAGIC or expires_at <= now:
+                    return True
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        version, _, _, scope, _, _ = self._read_meta(view)
+                    finally:
+                        view.release()
+        except FileNotFoundError:
+            return False
+        except Exception:
+            return True
+        return not self._is_valid(None if version < 0 else version, scope, data_version_bus.current)
+
+    def evict(self) -> int:
+        """
+        만료·무효 항목과 중단된 임시 파일을 제거하고, 크기 상한을 넘으면 오래 전에 기록된 항목부터 제거
+
+        Returns:
+            제거된 항목 수
+        """
+        if not self._prepare():
+            return 0
+        now = time.time()
+        removed = 0
+        live = []
+        for path, info in self._scan():
+            if path.endswith(".tmp"):
+                if now - info.st_mtime > _STALE_TMP_SECONDS:
+                    self._unlink(path)
+                continue
+            if self._entry_is_stale(path, now):
+                removed += self._unlink(path)
+            else:
+                live.append((info.st_mtime, info.st_size, path))
+
+        total = sum(size for _, size, _ in live)
+        for _, size, path in sorted(live):
+            if total <= self.max_bytes:
+                break
+            removed += self._unlink(path)
+            total -= size
+
+        self._count("evictions", removed)
+        return removed
+
+    def clear(self) -> int:
+        """모든 항목 제거"""
+        if not self._prepare():
+            return 0
+        removed = sum(self._unlink(path) for path, _ in self._scan())
+        self._count("evictions", removed)
+        return removed
+
+    def on_data_change(self, change: DataChange) -> None:
+        """데이터 변경 구독자 - DB 재생성(버전 감소) 시 버전 비교가 무의미하므로 전체 제거"""
+        if change.source == "reset":
+            self.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """공유 캐시 상태 (파일 수·크기는 디렉터리 조회)"""
+        files = [info for path, info in self._scan() if path.endswith(".bin")]
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"] + self.stats["stale"]
+            return {
+                "enabled": settings.SHARED_CACHE_ENABLED,
+                "directory": self.directory,
+                "usable": self._key is not None,
+                "entries": len(files),
+                "bytes": sum(info.st_size for info in files),
+                "max_bytes": self.max_bytes,
+                **self.stats,
+                "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+            }
+
+
+# 공용 인스턴스 (SHARED_CACHE_ENABLED일 때 결과 캐시·일자별 집계 캐시의 2차 저장소로 사용)
+shared_cache = SharedCacheStore(
+    directory=settings.SHARED_CACHE_DIR or _default_dir(),
+    max_bytes=settings.SHARED_CACHE_MAX_BYTES,
+    default_ttl=settings.SHARED_CACHE_TTL
+)
+data_version_bus.subscribe(shared_cache.on_data_change)
@@ -0,0 +1,113 @@
+## single_flight.py
+
+"""
+동일 요청 합치기 (single-flight)
+
+자동 새로고침이나 오전 9시 동시 접속처럼 같은 조회가 한꺼번에 시작되면 결과 캐시가
+채워지기 전이라 모든 호출이 DB를 조회합니다. SingleFlight는 같은 키의 계산이 진행 중이면
+새 호출이 계산을 시작하지 않고 진행 중인 계산의 결과를 함께 기다리게 합니다.
+
+- 결과 공유에 concurrent.futures.Future를 사용하므로 다른 스레드의 이벤트 루프
+  (I/O 스레드 풀)에서 시작된 계산도 기다릴 수 있음
+- 계산이 예외로 끝나면 기다리던 호출에도 같은 예외를 전달
+- 계산을 시작한 호출이 취소되면 기다리던 호출은 각자 다시 계산
+- 공유된 결과 객체는 수정하지 않아야 함 (결과 캐시와 동일)
+"""
+
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+import asyncio
+import logging
+import threading
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _LeaderCancelled(Exception):
+    """계산을 시작한 호출이 취소됨 (기다리던 호출은 다시 계산)"""
+
+
+class SingleFlight:
+    """키별로 진행 중인 계산을 하나로 합치는 관리자 (스레드 안전)"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"leaders": 0, "coalesced": 0, "errors": 0, "retries": 0}
+        self._namespace_stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, namespace: Optional[str], field: str) -> None:
+        self.stats[field] += 1
+        if namespace is not None:
+            counters = self._namespace_stats.setdefault(namespace, {"leaders": 0, "coalesced": 0})
+            counters[field] = counters.get(field, 0) + 1
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]],
+        namespace: Optional[str] = None
+    ) -> Any:
+        """
+        같은 키의 계산이 진행 중이면 그 결과를, 아니면 func()를 실행한 결과를 반환합니다.
+
+        Args:
+            key: 정규화된 호출 키
+            func: 실제 계산 (인자 없는 코루틴 함수)
+            namespace: 통계용 네임스페이스
+        """
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                leader = future is None
+                if leader:
+                    future = self._calls[key] = Future()
+                    # 실행 중 상태로 표시 (기다리던 호출이 취소되어도 공유 Future는 취소되지 않음)
+                    future.set_running_or_notify_cancel()
+                    self._count(namespace, "leaders")
+                else:
+                    self._count(namespace, "coalesced")
+
+            if not leader:
+                try:
+                    return await asyncio.wrap_future(future)
+                except _LeaderCancelled:
+                    with self._lock:
+                        self.stats["retries"] += 1
+                    continue
+
+            try:
+                value = await func()
+            except asyncio.CancelledError:
+                future.set_exception(_LeaderCancelled())
+                raise
+            except BaseException as e:
+                with self._lock:
+                    self.stats["errors"] += 1
+                future.set_exception(e)
+                raise
+            else:
+                future.set_result(value)
+                return value
+            finally:
+                with self._lock:
+                    if self._calls.get(key) is future:
+                        del self._calls[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """합쳐진 호출 수 등 통계"""
+        with self._lock:
+            calls = self.stats["leaders"] + self.stats["coalesced"]
+            return {
+                "enabled": settings.SINGLE_FLIGHT_ENABLED,
+                "in_flight": len(self._calls),
+                **self.stats,
+                "coalesced_rate": round(self.stats["coalesced"] / calls, 4) if calls else 0.0,
+                "namespaces": {name: dict(counters) for name, counters in self._namespace_stats.items()},
+            }
+
+
+# 서비스 공용 인스턴스
+single_flight = SingleFlight()
@@ -1,5 +1,6 @@
 ## main.py
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 import logging
 from datetime import datetime
@@ -10,6 +11,17 @@ from app.core.config import settings
 from app.api.router import api_router
 from app.services.notice_service import notice_service
 from app.services.store_service import store_service
+from app.services.cache_warmup import cache_warmup_service
+from app.services.scheduled_jobs import register_default_jobs
+from app.core.process_pool import process_pool
+from app.core.scheduler import job_scheduler
+from app.core.executors import analytics_thread_pool, io_thread_pool
+from app.core.cache import result_cache
+from app.core.shared_cache import shared_cache
+from app.core.single_flight import single_flight
+from app.core.data_version import data_version_bus
+from app.services.daily_aggregates import daily_aggregate_cache
+from app.core import compression, http_cache, log_policy, query_memo
 
 # 로거 설정
 logger = logging.getLogger("main")
@@ -41,6 +53,9 @@ logging.getLogger("hpack.table").setLevel(logging.ERROR)
 logging.getLogger("h2").setLevel(logging.WARNING)
 logging.getLogger("h2.connection").setLevel(logging.WARNING)
 
+# 조회 경로 로거 샘플링·속도 제한 (LOG_POLICIES)
+log_policy.install_log_policies()
+
 # Railway 환경에서 로그 레벨 강제 설정
 import os
 import signal
@@ -57,14 +72,35 @@ signal.signal(signal.SIGINT, signal.SIG_IGN)   # SIGINT 신호 무시 (Ctrl+C)
 
 logger.info("Signal handlers set to ignore SIGTERM and SIGINT - Railway termination protection enabled")
 
+# 서버 시작·종료 처리 (시작 이벤트 후 작업 스케줄러 시작, 종료 시 역순)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await startup_event()
+    if settings.SCHEDULER_ENABLED:
+        register_default_jobs(job_scheduler)
+        job_scheduler.start()
+    try:
+        yield
+    finally:
+        await job_scheduler.stop()
+        await shutdown_event()
+
 # FastAPI 앱 인스턴스 생성
 app = FastAPI(
     title=settings.APP_NAME,
     description="LePain Store Dashboard API",
     debug=settings.DEBUG,
     redirect_slashes=False,  # 307 리디렉션 방지
+    lifespan=lifespan,
 )
 
+# 요청 범위 쿼리 메모 미들웨어 - 한 요청 안의 같은 조회는 한 번만 실행 (가장 안쪽)
+app.add_middleware(query_memo.QueryMemoMiddleware)
+
+# 조건부 GET 미들웨어 - 데이터 버전 기반 ETag·304 및 Cache-Control
+# (나중에 추가한 미들웨어가 바깥쪽이므로 304 응답에도 CORS 헤더가 붙도록 CORS보다 먼저 등록)
+app.add_middleware(http_cache.ConditionalGetMiddleware)
+
 # CORS 미들웨어 설정 - 모든 origin 허용 (MVP용)
 app.add_middleware(
     CORSMiddleware,
@@ -74,11 +110,16 @@ app.add_middleware(
     allow_headers=["*"],  # 모든 header 허용
 )
 
+# 응답 압축 미들웨어 - gzip·brotli (최종 본문을 압축)
+app.add_middleware(compression.ResponseCompressionMiddleware)
+
+# 요청 요약 로그 미들웨어 - 요청마다 쿼리 수·행 수 등을 한 줄로 기록 (가장 바깥에서 전체 처리 시간 측정)
+app.add_middleware(log_policy.RequestLogMiddleware)
+
 # API 라우터 등록
 app.include_router(api_router, prefix=settings.API_PREFIX)
 
 # 서버 시작 시 샘플 데이터 초기화 및 환경 설정
-@app.on_event("startup")
 async def startup_event():
     """서버 시작 이벤트 핸들러"""
     try:
@@ -110,6 +151,12 @@ async def startup_event():
         if not settings.USE_LOCAL_DB:
             await notice_service.initialize_sample_notices()
         
+        # 예측용 프로세스 풀 워커 기동
+        process_pool.start()
+        
+        # 기본 조회 기간 결과 캐시 예열 (백그라운드)
+        app.state.cache_warmup_task = cache_warmup_service.start_background()
+        
         # 서버 시작 시간 기록
         app.state.start_time = datetime.now()
         app.state.uptime = 0
@@ -125,6 +172,14 @@ async def startup_event():
         # Railway에서는 startup 실패시에도 서버가 시작되도록 함
         logger.warning("Continuing startup despite errors...")
 
+# 서버 종료 시 캐시 예열 중단, 프로세스 풀·스레드 풀 정리
+async def shutdown_event():
+    """서버 종료 이벤트 핸들러"""
+    cache_warmup_service.stop(getattr(app.state, "cache_warmup_task", None))
+    process_pool.shutdown()
+    io_thread_pool.shutdown()
+    analytics_thread_pool.shutdown()
+
 # 루트 경로 헬스체크 엔드포인트 (확장)
 @app.get("/")
 def health_check():
@@ -160,6 +215,20 @@ def get_app_info():
         "debug": settings.DEBUG,
         "api_prefix": settings.API_PREFIX,
         "database_url": "***REDACTED***",  # 보안상 실제 URL은 노출하지 않음
+        "process_pool": process_pool.get_stats(),
+        "io_thread_pool": io_thread_pool.get_stats(),
+        "analytics_thread_pool": analytics_thread_pool.get_stats(),
+        "result_cache": result_cache.get_stats(),
+        "shared_cache": shared_cache.get_stats(),
+        "single_flight": single_flight.get_stats(),
+        "cache_warmup": cache_warmup_service.last_summary,
+        "scheduler": job_scheduler.get_stats(),
+        "data_version": data_version_bus.get_stats(),
+        "daily_aggregate_cache": daily_aggregate_cache.get_stats(),
+        "http_cache": http_cache.get_stats(),
+        "compression": compression.get_stats(),
+        "query_memo": query_memo.get_stats(),
+        "log_policy": log_policy.get_stats(),
     }
 
 # Railway 헬스체크 엔드포인트 - 비활성화
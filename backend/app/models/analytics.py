@@ -22,6 +22,28 @@ class AnomalyResponse(BaseModel):
     method: str = "z_score"
     threshold: float = 3.0
 
+# 매장/지표별 이상치 데이터 포인트 모델
+class StoreAnomalyPoint(BaseModel):
+    """매장/지표별 이상치 데이터 포인트 모델"""
+    date: date
+    store_name: str
+    metric: str
+    value: float
+    expected_value: Optional[float] = None
+    z_score: Optional[float] = None
+    is_anomaly: bool = False
+
+# 매장/지표별 이상치 감지 응답 모델
+class StoreAnomalyResponse(BaseModel):
+    """매장/지표별 이상치 감지 응답 모델 (요일별 기준선)"""
+    metrics: List[str]
+    data: List[StoreAnomalyPoint]
+    anomaly_count: int
+    method: str = "seasonal"
+    threshold: float = 3.5
+    window: int = 8
+    latest_date: Optional[date] = None
+
 # 상관관계 데이터 포인트 모델
 class CorrelationPoint(BaseModel):
     """상관관계 데이터 포인트 모델"""
@@ -0,0 +1,25 @@
+## dashboard.py
+
+from datetime import date
+from typing import List, Optional
+from pydantic import BaseModel
+
+from app.models.kpi import KPISummary
+from app.models.sales import (
+    DailySalesResponse,
+    HourlySalesResponse,
+    ProductSalesResponse,
+    PaymentTypeSalesResponse
+)
+
+# 대시보드 묶음 응답 모델
+class DashboardBundle(BaseModel):
+    """대시보드 첫 화면 위젯 묶음 - 각 필드는 개별 API 응답과 같은 형식"""
+    start_date: date
+    end_date: date
+    store_name: Optional[List[str]] = None
+    kpi_summary: KPISummary  # /kpi/summary
+    daily_sales: List[DailySalesResponse]  # /sales/daily
+    hourly_sales: List[HourlySalesResponse]  # /sales/hourly
+    product_sales: List[ProductSalesResponse]  # /sales/products
+    payment_type_sales: List[PaymentTypeSalesResponse]  # /sales/payment_types
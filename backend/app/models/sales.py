@@ -1,6 +1,7 @@
 ## sales.py
 
 from datetime import date, datetime
+from enum import Enum
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
@@ -107,6 +108,13 @@ class SalesFilterParams(BaseModel):
     payment_type: Optional[List[str]] = None
     product_code: Optional[List[str]] = None
 
+# 매출 비교 기준
+class ComparePeriod(str, Enum):
+    """매출 비교 기간 기준"""
+    PREVIOUS_PERIOD = "previous_period"  # 직전 같은 길이의 기간
+    PREVIOUS_YEAR = "previous_year"  # 전년 동기
+    TWO_YEARS_AGO = "two_years_ago"  # 2년 전 동기
+
 class HourlyProductSalesResponse(BaseModel):
     """시간대별 제품별 판매 수량 API 응답 모델"""
     hour: int  # 시(hour)
@@ -36,9 +36,32 @@ class ForecastResponse(BaseModel):
 class SeasonalityResponse(BaseModel):
     """계절성 분석 응답 모델"""
     period_type: str  # daily, weekly, monthly
-    seasonal_components: List[Dict[str, float]]
+    seasonal_components: List[Dict[str, Union[str, float]]]  # {"period": "월", "value": 0.12}
     strength: float = 0.0
     insights: List[str] = []
+    source: str = "live"  # live(원천 데이터 집계), precomputed(시계열 분해 결과)
+
+# 시계열 분해 포인트 모델
+class DecompositionPoint(BaseModel):
+    """시계열 분해 포인트 모델"""
+    date: date
+    observed: float
+    trend: float
+    weekly: float
+    yearly: Optional[float] = None  # 2년 미만 데이터는 연간 성분 없음
+    residual: float
+
+# 시계열 분해 응답 모델
+class DecompositionResponse(BaseModel):
+    """시계열 분해 응답 모델"""
+    store_name: str  # 매장명 또는 '전체'
+    metric: str
+    periods: List[int]  # 분해에 사용한 주기 (7, 365)
+    data: List[DecompositionPoint]
+    weekly_strength: float = 0.0
+    yearly_strength: Optional[float] = None
+    source: str = "live"
+    generated_at: Optional[datetime] = None
 
 # 트렌드 필터 파라미터 모델
 class TrendFilterParams(BaseModel):
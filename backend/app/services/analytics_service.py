@@ -2,20 +2,29 @@
 
 from datetime import date, datetime, timedelta
 from typing import List, Dict, Any, Optional, Union, Tuple
+import threading
 import pandas as pd
 import numpy as np
 
-from app.core.database import get_table, Tables
+from app.core.database import get_table, run_query, Tables
+from app.core.cache import cached
+from app.core.executors import analytics_thread_pool, offload
+from app.core.data_version import DataChange, data_version_bus
 from app.utils.date_utils import get_date_range
 from app.utils.data_processing import (
-    detect_anomalies_zscore,
-    detect_anomalies_iqr,
-    calculate_correlation,
-    process_time_series
+    zscore_anomalies_array,
+    iqr_anomalies_array,
+    correlation_array
+)
+from app.utils.anomaly_detection import (
+    detect_seasonal_anomalies,
+    SeasonalAnomalyDetector
 )
 from app.models.analytics import (
     AnomalyPoint,
     AnomalyResponse,
+    StoreAnomalyPoint,
+    StoreAnomalyResponse,
     CorrelationPoint,
     CorrelationResponse,
     PatternPoint,
@@ -26,7 +35,17 @@ from app.models.analytics import (
 class AnalyticsService:
     """고급 데이터 분석 서비스"""
     
+    # 요일별 기준선 이상치 감지 설정
+    SEASONAL_WINDOW = 8  # 요일별로 참고할 과거 주 수
+    SEASONAL_METRICS = ["total_sales", "actual_sales", "transactions", "avg_transaction"]
+    
+    # 증분 이상치 감지기 (최근 적재일 이상치 조회용, 분석 스레드 풀에서 동시에 갱신하지 않도록 잠금)
+    _seasonal_detector: Optional[SeasonalAnomalyDetector] = None
+    _detector_lock = threading.Lock()
+    
     @staticmethod
+    @cached("analytics.detect_sales_anomalies", tables=(Tables.DAILY_SALES_SUMMARY,), lookback_days=SEASONAL_WINDOW * 7)
+    @offload(analytics_thread_pool)
     async def detect_sales_anomalies(
         start_date: date,
         end_date: date,
@@ -43,16 +62,20 @@ class AnalyticsService:
             end_date: 종료 날짜
             store_name: 매장 이름 필터 (None인 경우 모든 매장)
             metric: 분석할 지표 (total_sales, transactions, avg_transaction 등)
-            method: 이상치 감지 방법 (zscore, iqr)
+            method: 이상치 감지 방법 (zscore, iqr, seasonal)
             threshold: 이상치 감지 임계값
             
         Returns:
             이상치 감지 결과
         """
+        # 요일별 기준선 방식은 기준선 계산을 위해 과거 데이터를 함께 조회
+        is_seasonal = method.lower() == 'seasonal'
+        query_start = start_date - timedelta(weeks=AnalyticsService.SEASONAL_WINDOW) if is_seasonal else start_date
+        
         # 요약 테이블을 통한 매출 데이터 조회
         query = get_table(Tables.DAILY_SALES_SUMMARY)\
                 .select("date", "total_sales", "actual_sales", "receipt_number")\
-                .gte("date", start_date.isoformat())\
+                .gte("date", query_start.isoformat())\
                 .lte("date", end_date.isoformat())
         
         # 매장 필터 추가
@@ -95,27 +118,48 @@ class AnalyticsService:
             daily_data = df.groupby('date')['total_sales'].sum().reset_index()
             value_field = 'total_sales'
         
-        # 이상치 감지 메소드 선택 및 적용
-        daily_list = daily_data.to_dict('records')
-        
-        if method.lower() == 'iqr':
-            anomaly_data = detect_anomalies_iqr(daily_list, value_field, threshold)
-        else:  # 기본값은 zscore
-            anomaly_data = detect_anomalies_zscore(daily_list, value_field, 'date', threshold)
+        # 이상치 감지 메소드 선택 및 적용 (컬럼 배열 단위로 처리)
+        if is_seasonal:
+            # 요일별 롤링 median/MAD 기준선 (주말 효과 제거)
+            seasonal = detect_seasonal_anomalies(
+                daily_data,
+                [value_field],
+                group_columns=[],
+                window=AnalyticsService.SEASONAL_WINDOW,
+                threshold=threshold,
+                output_start=start_date
+            )
+            dates = seasonal['date'].to_numpy()
+            values = seasonal['value'].to_numpy(dtype=float)
+            # 기준선이 없는 초기 구간은 관측값 자체를 기대값으로 사용
+            expected = np.where(seasonal['expected_value'].isna(), values, seasonal['expected_value'].to_numpy(dtype=float))
+            z_scores = np.nan_to_num(seasonal['z_score'].to_numpy(dtype=float), nan=0.0)
+            is_anomaly = seasonal['is_anomaly'].to_numpy(dtype=bool)
+        else:
+            dates = daily_data['date'].to_numpy()
+            values = daily_data[value_field].to_numpy(dtype=float)
+            
+            if method.lower() == 'iqr':
+                expected_value, _, _, is_anomaly = iqr_anomalies_array(values, threshold)
+                z_scores = np.zeros(len(values))
+            else:  # 기본값은 zscore
+                expected_value, z_scores, is_anomaly = zscore_anomalies_array(values, threshold)
+            expected = np.full(len(values), expected_value)
         
         # 이상치 데이터 포인트 변환
-        anomaly_points = []
-        for point in anomaly_data:
-            anomaly_points.append(AnomalyPoint(
-                date=point['date'],
-                value=float(point[value_field]),
-                expected_value=float(point['expected_value']),
-                z_score=float(point.get('z_score', 0.0)),
-                is_anomaly=bool(point['is_anomaly'])
-            ))
+        anomaly_points = [
+            AnomalyPoint(date=d, value=v, expected_value=e, z_score=z, is_anomaly=flag)
+            for d, v, e, z, flag in zip(
+                dates.tolist(),
+                values.tolist(),
+                expected.tolist(),
+                z_scores.tolist(),
+                is_anomaly.tolist()
+            )
+        ]
         
         # 이상치 개수 계산
-        anomaly_count = sum(1 for point in anomaly_points if point.is_anomaly)
+        anomaly_count = int(np.count_nonzero(is_anomaly))
         
         # 결과 반환
         return AnomalyResponse(
@@ -127,6 +171,204 @@ class AnalyticsService:
         )
         
     @staticmethod
+    async def _fetch_daily_store_metrics(
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        매장별 일별 지표를 한 번의 집계 쿼리로 조회합니다.
+        
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            store_name: 매장 이름 필터 (None인 경우 모든 매장)
+            
+        Returns:
+            date, store_name 및 SEASONAL_METRICS 컬럼을 가진 데이터프레임 ('전체' 합계 포함)
+        """
+        params: Dict[str, Any] = {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat()
+        }
+        store_filter = ""
+        if store_name:
+            placeholders = ", ".join(f":store_{i}" for i in range(len(store_name)))
+            store_filter = f" AND store_name IN ({placeholders})"
+            params.update({f"store_{i}": name for i, name in enumerate(store_name)})
+        
+        rows = await run_query(
+            "SELECT date, store_name, "
+            "SUM(total_sales) AS total_sales, "
+            "SUM(actual_sales) AS actual_sales, "
+            "COUNT(DISTINCT receipt_number) AS transactions "
+            "FROM daily_sales_summary "
+            f"WHERE date >= :start_date AND date <= :end_date{store_filter} "
+            "GROUP BY date, store_name",
+            params
+        )
+        
+        columns = ['date', 'store_name'] + AnalyticsService.SEASONAL_METRICS
+        if not rows:
+            return pd.DataFrame(columns=columns)
+        
+        df = pd.DataFrame(rows)
+        df['date'] = pd.to_datetime(df['date']).dt.date
+        
+        # 전체 매장 합계 시계열 추가
+        total = df.groupby('date')[['total_sales', 'actual_sales', 'transactions']].sum().reset_index()
+        total['store_name'] = '전체'
+        df = pd.concat([df, total], ignore_index=True)
+        
+        df['avg_transaction'] = df['total_sales'] / df['transactions'].replace(0, np.nan)
+        return df[columns]
+    
+    @staticmethod
+    def _to_store_anomaly_points(scores: pd.DataFrame) -> List[StoreAnomalyPoint]:
+        """점수 데이터프레임을 매장/지표별 이상치 포인트로 변환합니다."""
+        points = []
+        for row in scores.to_dict('records'):
+            points.append(StoreAnomalyPoint(
+                date=row['date'],
+                store_name=str(row['store_name']),
+                metric=row['metric'],
+                value=float(row['value']),
+                expected_value=float(row['expected_value']) if pd.notna(row['expected_value']) else None,
+                z_score=float(row['z_score']) if pd.notna(row['z_score']) else None,
+                is_anomaly=bool(row['is_anomaly'])
+            ))
+        return points
+    
+    @staticmethod
+    @cached("analytics.detect_store_anomalies", tables=(Tables.DAILY_SALES_SUMMARY,), lookback_days=SEASONAL_WINDOW * 7)
+    @offload(analytics_thread_pool)
+    async def detect_store_anomalies(
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]] = None,
+        metrics: Optional[List[str]] = None,
+        threshold: float = 3.5,
+        anomalies_only: bool = False
+    ) -> StoreAnomalyResponse:
+        """
+        모든 매장과 지표의 이상치를 요일별 기준선으로 일괄 감지합니다.
+        
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            store_name: 매장 이름 필터 (None인 경우 모든 매장 및 전체 합계)
+            metrics: 분석할 지표 리스트 (기본값: SEASONAL_METRICS)
+            threshold: robust z-score 임계값
+            anomalies_only: True인 경우 이상치로 판정된 포인트만 반환
+            
+        Returns:
+            매장/지표별 이상치 감지 결과
+        """
+        metrics = [m for m in (metrics or AnalyticsService.SEASONAL_METRICS) if m in AnalyticsService.SEASONAL_METRICS]
+        window = AnalyticsService.SEASONAL_WINDOW
+        
+        # 기준선 계산을 위해 window 주만큼 과거 데이터를 함께 조회
+        daily = await AnalyticsService._fetch_daily_store_metrics(
+            start_date - timedelta(weeks=window),
+            end_date,
+            store_name
+        )
+        
+        scores = detect_seasonal_anomalies(
+            daily,
+            metrics,
+            group_columns=['store_name'],
+            window=window,
+            threshold=threshold,
+            output_start=start_date
+        )
+        if anomalies_only:
+            scores = scores[scores['is_anomaly']]
+        scores = scores.sort_values(['date', 'store_name', 'metric'])
+        
+        points = AnalyticsService._to_store_anomaly_points(scores)
+        return StoreAnomalyResponse(
+            metrics=metrics,
+            data=points,
+            anomaly_count=sum(1 for point in points if point.is_anomaly),
+            threshold=threshold,
+            window=window,
+            latest_date=end_date
+        )
+    
+    @staticmethod
+    def _on_data_change(change: DataChange) -> None:
+        """데이터 변경 구독자 - 감지기 이력 구간이 바뀌면 다음 조회 때 다시 초기화"""
+        detector = AnalyticsService._seasonal_detector
+        if detector is None or detector.last_date is None:
+            return
+        history_start = detector.last_date - timedelta(weeks=AnalyticsService.SEASONAL_WINDOW)
+        if change.affects((Tables.DAILY_SALES_SUMMARY,), history_start, detector.last_date):
+            AnalyticsService._seasonal_detector = None
+    
+    @staticmethod
+    @offload(analytics_thread_pool)
+    async def get_latest_anomalies(anomalies_only: bool = False) -> StoreAnomalyResponse:
+        """
+        가장 최근 적재일의 매장/지표별 이상치를 조회합니다.
+        
+        최초 호출 시에만 과거 이력으로 증분 감지기를 초기화하고,
+        이후에는 새로 적재된 날짜만 조회해 감지기 상태를 갱신합니다.
+        
+        Args:
+            anomalies_only: True인 경우 이상치로 판정된 포인트만 반환
+            
+        Returns:
+            최근 적재일의 이상치 감지 결과
+        """
+        metrics = AnalyticsService.SEASONAL_METRICS
+        window = AnalyticsService.SEASONAL_WINDOW
+        
+        # 과거 데이터가 수정되었으면 감지기를 초기화하도록 변경 알림 먼저 처리
+        data_version_bus.poll()
+        
+        rows = await run_query("SELECT MAX(date) AS latest_date FROM daily_sales_summary")
+        latest = rows[0]['latest_date'] if rows else None
+        if not latest:
+            return StoreAnomalyResponse(metrics=metrics, data=[], anomaly_count=0, window=window)
+        latest_date = pd.to_datetime(latest).date()
+        
+        with AnalyticsService._detector_lock:
+            detector = AnalyticsService._seasonal_detector
+            if detector is None or (detector.last_date is not None and detector.last_date > latest_date):
+                # 최근일 직전까지의 이력으로 감지기 초기화
+                detector = SeasonalAnomalyDetector(metrics, window=window)
+                history = await AnalyticsService._fetch_daily_store_metrics(
+                    latest_date - timedelta(weeks=window),
+                    latest_date - timedelta(days=1)
+                )
+                detector.fit(history)
+                AnalyticsService._seasonal_detector = detector
+        
+            # 마지막 처리일 이후 새로 적재된 날짜만 조회해 증분 갱신
+            if detector.last_date is None or detector.last_date < latest_date:
+                fetch_start = detector.last_date + timedelta(days=1) if detector.last_date else latest_date
+                new_days = await AnalyticsService._fetch_daily_store_metrics(fetch_start, latest_date)
+                for day in get_date_range(fetch_start, latest_date):
+                    detector.update(day, new_days)
+        
+            scores = detector.last_result if detector.last_result is not None else pd.DataFrame()
+            if anomalies_only and not scores.empty:
+                scores = scores[scores['is_anomaly']]
+        
+        points = AnalyticsService._to_store_anomaly_points(scores)
+        return StoreAnomalyResponse(
+            metrics=metrics,
+            data=points,
+            anomaly_count=sum(1 for point in points if point.is_anomaly),
+            threshold=detector.threshold,
+            window=window,
+            latest_date=latest_date
+        )
+        
+    @staticmethod
+    @cached("analytics.analyze_correlations", tables=(Tables.DAILY_SALES_SUMMARY,))
+    @offload(analytics_thread_pool)
     async def analyze_correlations(
         start_date: date,
         end_date: date,
@@ -238,9 +480,9 @@ class AnalyticsService:
         for i, var1 in enumerate(normalized_variables):
             for j, var2 in enumerate(normalized_variables):
                 if i < j:  # 중복 피하기
-                    corr, p_value = calculate_correlation(
-                        corr_data[var1].values,
-                        corr_data[var2].values,
+                    corr, p_value = correlation_array(
+                        corr_data[var1].to_numpy(),
+                        corr_data[var2].to_numpy(),
                         method
                     )
                     
@@ -313,6 +555,8 @@ class AnalyticsService:
         return insights
 
     @staticmethod
+    @cached("analytics.analyze_patterns")
+    @offload(analytics_thread_pool)
     async def analyze_patterns(
         start_date: date,
         end_date: date,
@@ -648,3 +892,4 @@ class AnalyticsService:
 
 # 서비스 인스턴스 생성 (의존성 주입용)
 analytics_service = AnalyticsService()
+data_version_bus.subscribe(AnalyticsService._on_data_change)
@@ -0,0 +1,166 @@
+## cache_warmup.py
+
+"""
+시작 시 결과 캐시 예열
+
+배포 직후 첫 사용자는 대시보드의 모든 위젯에서 캐시 없이 조회합니다.
+서버가 시작되면 프론트엔드가 기본으로 요청하는 기간(최근 7/30/90일) × 매장(각 매장, 전체)의
+매출·KPI·트렌드 조회를 미리 실행해 결과 캐시를 채웁니다.
+
+- 엔드포인트 기본값과 같은 인자로 서비스 메서드를 호출하므로 요청과 같은 캐시 키로 저장
+- I/O 스레드 풀의 워커 하나에서 순서대로 실행해 요청 처리 이벤트 루프를 막지 않음
+- 예열 중 같은 요청이 들어오면 동일 요청 합치기로 진행 중인 계산을 함께 기다림
+- 대상 하나가 실패해도 나머지는 계속 실행
+"""
+
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import threading
+import time
+
+from app.core.config import settings
+from app.core.database import run_query
+from app.core.executors import io_thread_pool
+from app.services.kpi_service import kpi_service
+from app.services.sales_service import sales_service
+from app.services.trends_service import trends_service
+from app.utils.date_utils import get_recent_periods
+
+logger = logging.getLogger(__name__)
+
+# 예열 대상 - (이름, (start_date, end_date, store_name) → 서비스 호출), 인자는 각 엔드포인트 기본값
+WarmupTarget = Tuple[str, Callable[[date, date, Optional[List[str]]], Awaitable[Any]]]
+
+WARMUP_TARGETS: List[WarmupTarget] = [
+    ("sales.daily", lambda start, end, stores: sales_service.get_daily_sales(start, end, stores)),
+    ("sales.hourly", lambda start, end, stores: sales_service.get_hourly_sales(start, end, stores)),
+    ("sales.products", lambda start, end, stores: sales_service.get_product_sales(start, end, stores, 20)),
+    ("sales.payment_types", lambda start, end, stores: sales_service.get_payment_type_sales(start, end, stores)),
+    ("kpi.summary", lambda start, end, stores: kpi_service.get_kpi_summary(start, end, stores)),
+    ("kpi.trends", lambda start, end, stores: kpi_service.get_kpi_trends(start, end, stores, "total_sales")),
+    ("kpi.products", lambda start, end, stores: kpi_service.get_product_kpi(start, end, stores, 10)),
+    ("kpi.categories", lambda start, end, stores: kpi_service.get_category_kpi(start, end, stores)),
+    ("trends.time_series", lambda start, end, stores: trends_service.get_time_series(start, end, stores, "total_sales")),
+    ("trends.forecast", lambda start, end, stores: trends_service.get_forecast(start, end, 30, stores, "total_sales", None)),
+    ("trends.seasonality", lambda start, end, stores: trends_service.get_seasonality(start, end, stores, "weekly", "total_sales")),
+]
+
+
+class CacheWarmupService:
+    """결과 캐시 예열 서비스"""
+
+    # 마지막 실행 요약 (/info 표시용)
+    last_summary: Optional[Dict[str, Any]] = None
+    # 서버 종료 시 워커 스레드의 남은 예열 중단
+    _stop = threading.Event()
+
+    @staticmethod
+    async def _store_names() -> List[str]:
+        """매장 목록 ('전체' 집계 행 제외)"""
+        rows = await run_query(
+            "SELECT DISTINCT store_name FROM daily_sales_summary "
+            "WHERE store_name IS NOT NULL AND store_name != '전체' "
+            "ORDER BY store_name"
+        )
+        return [row["store_name"] for row in rows]
+
+    @staticmethod
+    async def _warm_one(
+        target: WarmupTarget,
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]]
+    ) -> bool:
+        """대상 하나 실행 (실패 시 로그만 남김)"""
+        name, call = target
+        try:
+            await call(start_date, end_date, store_name)
+            return True
+        except Exception as e:
+            logger.warning(f"캐시 예열 실패 ({name}, {start_date}~{end_date}, {store_name}): {e}")
+            return False
+
+    @staticmethod
+    async def _warm_all(days_list: List[int], end_date: date, stores: List[Optional[List[str]]]) -> Tuple[int, int]:
+        """모든 기간 × 매장 × 대상 순서대로 실행 (같은 스레드의 이벤트 루프에서 실행)"""
+        succeeded = failed = 0
+        for days in days_list:
+            start_date, _ = get_recent_periods(end_date=end_date, days=days)
+            for store_name in stores:
+                for target in WARMUP_TARGETS:
+                    if CacheWarmupService._stop.is_set():
+                        return succeeded, failed
+                    if await CacheWarmupService._warm_one(target, start_date, end_date, store_name):
+                        succeeded += 1
+                    else:
+                        failed += 1
+        return succeeded, failed
+
+    @staticmethod
+    async def run(days_list: Optional[List[int]] = None, end_date: Optional[date] = None) -> Dict[str, Any]:
+        """
+        기본 조회 기간의 서비스 결과를 미리 계산해 결과 캐시에 저장합니다.
+
+        Args:
+            days_list: 예열할 최근 일수 목록 (기본값: CACHE_WARMUP_DAYS)
+            end_date: 기간 종료일 (기본값: 오늘, 엔드포인트 기본값과 동일)
+
+        Returns:
+            실행 요약 정보
+        """
+        started = time.perf_counter()
+        days_list = days_list or settings.CACHE_WARMUP_DAYS
+        end_date = end_date or date.today()
+
+        if not settings.RESULT_CACHE_ENABLED:
+            logger.info("결과 캐시가 꺼져 있어 캐시 예열을 건너뜀")
+            return {"skipped": True}
+
+        stores: List[Optional[List[str]]] = [None]
+        stores += [[store] for store in await CacheWarmupService._store_names()]
+
+        # 워커 스레드 하나에서 순서대로 실행 (요청 처리 루프와 분리)
+        succeeded, failed = await io_thread_pool.run_async(CacheWarmupService._warm_all, days_list, end_date, stores)
+
+        summary = {
+            "end_date": end_date.isoformat(),
+            "days": list(days_list),
+            "stores": [store[0] if store else "전체" for store in stores],
+            "targets": len(WARMUP_TARGETS),
+            "succeeded": succeeded,
+            "failed": failed,
+            "elapsed_seconds": round(time.perf_counter() - started, 2)
+        }
+        CacheWarmupService.last_summary = summary
+        logger.info(f"캐시 예열 완료: {summary}")
+        return summary
+
+    @staticmethod
+    def start_background() -> Optional[asyncio.Task]:
+        """서버 시작 직후 백그라운드 태스크로 예열 시작 (CACHE_WARMUP_ENABLED=false면 실행 안 함)"""
+        if not settings.CACHE_WARMUP_ENABLED:
+            return None
+        CacheWarmupService._stop.clear()
+
+        async def _run():
+            if settings.CACHE_WARMUP_DELAY > 0:
+                await asyncio.sleep(settings.CACHE_WARMUP_DELAY)
+            try:
+                await CacheWarmupService.run()
+            except Exception as e:
+                logger.error(f"캐시 예열 중 오류: {e}")
+
+        return asyncio.create_task(_run(), name="cache_warmup")
+
+    @staticmethod
+    def stop(task: Optional[asyncio.Task] = None) -> None:
+        """진행 중인 예열 중단 (서버 종료 시)"""
+        CacheWarmupService._stop.set()
+        if task is not None and not task.done():
+            task.cancel()
+
+
+# 서비스 인스턴스 생성 (의존성 주입용)
+cache_warmup_service = CacheWarmupService()
@@ -1,10 +1,10 @@
-from datetime import date, datetime, timedelta
+from datetime import date
 from typing import List, Dict, Any, Optional, Tuple
-import pandas as pd
-import numpy as np
 
-from app.core.database import get_table, Tables
-from app.utils.date_utils import get_date_range
+from app.core.database import Tables
+from app.core.cache import cached
+from app.core.executors import io_thread_pool, offload
+from app.services.daily_aggregates import DailyPartial, daily_aggregate_cache
 from app.models.compare import (
     StoreComparisonResponse,
     StoreMetrics,
@@ -19,6 +19,8 @@ class CompareService:
     """매장 비교 분석 서비스"""
     
     @staticmethod
+    @cached("compare.get_store_comparison", tables=(Tables.DAILY_SALES_SUMMARY,), stores_param=None)
+    @offload(io_thread_pool)
     async def get_store_comparison(
         start_date: date,
         end_date: date,
@@ -43,16 +45,10 @@ class CompareService:
         if not metrics:
             metrics = ["total_sales", "avg_transaction", "discount_rate", "transaction_count"]
             
-        # 요약 테이블을 통한 매출 데이터 조회
-        query = get_table(Tables.DAILY_SALES_SUMMARY)\
-                .select("*")\
-                .gte("date", start_date.isoformat())\
-                .lte("date", end_date.isoformat())
-            
-        response = query.execute()
-        data = response.data
+        # 매장별 기간 집계 (일자별 부분 집계 캐시 병합)
+        store_totals = await daily_aggregate_cache.summarize(start_date, end_date)
         
-        if not data:
+        if not store_totals:
             # 데이터가 없는 경우 빈 응답 반환
             return StoreComparisonResponse(
                 store_name=store_name,
@@ -61,13 +57,8 @@ class CompareService:
                 insights=["비교 분석에 필요한 데이터가 충분하지 않습니다."]
             )
         
-        df = pd.DataFrame(data)
-        
-        # 필요한 필드 확인 및 타입 변환
-        df['date'] = pd.to_datetime(df['date']).dt.date
-        
         # 매장별 지표 계산
-        store_metrics = await CompareService._calculate_store_metrics(df)
+        store_metrics = await CompareService._calculate_store_metrics(store_totals)
         
         # 타겟 매장 존재 여부 확인
         if store_name not in {sm.store_name for sm in store_metrics}:
@@ -113,50 +104,33 @@ class CompareService:
         )
     
     @staticmethod
-    async def _calculate_store_metrics(df: pd.DataFrame) -> List[StoreMetrics]:
+    async def _calculate_store_metrics(store_totals: Dict[str, DailyPartial]) -> List[StoreMetrics]:
         """
-        데이터프레임에서 매장별 성과 지표를 계산합니다.
+        매장별 기간 집계에서 성과 지표를 계산합니다.
         
         Args:
-            df: 매출 데이터 데이터프레임
+            store_totals: 매장별 병합 집계 (daily_aggregate_cache.summarize 결과)
             
         Returns:
             매장별 지표 리스트
         """
-        # 필수 필드 존재 여부 확인
-        required_fields = ['store_name', 'date', 'total_sales', 'receipt_number']
-        for field in required_fields:
-            if field not in df.columns:
-                return []
-                
-        # 추가 지표 계산을 위한 필드
-        if 'total_discount' not in df.columns:
-            df['total_discount'] = 0
-        
-        # 매장별 집계
-        store_agg = df.groupby('store_name').agg({
-            'total_sales': 'sum',
-            'total_discount': 'sum',
-            'receipt_number': 'nunique',
-            'date': 'nunique'  # 데이터가 있는 날짜 수
-        }).reset_index()
-        
-        # 추가 지표 계산
-        store_agg['avg_transaction'] = store_agg['total_sales'] / store_agg['receipt_number'].replace(0, np.nan)
-        store_agg['discount_rate'] = (store_agg['total_discount'] / (store_agg['total_sales'] + store_agg['total_discount']) * 100)\
-                                    .where((store_agg['total_sales'] + store_agg['total_discount']) > 0, 0)
-        store_agg['avg_daily_sales'] = store_agg['total_sales'] / store_agg['date'].replace(0, np.nan)
-        
-        # 결과 변환
         result = []
-        for _, row in store_agg.iterrows():
+        for store, totals in store_totals.items():
+            # 매장명이 없는 레코드는 비교 대상에서 제외
+            if store == daily_aggregate_cache.UNKNOWN_STORE:
+                continue
+            
+            transaction_count = totals.transaction_count
+            gross_sales = totals.total_sales + totals.total_discount
+            
             result.append(StoreMetrics(
-                store_name=str(row['store_name']),
-                total_sales=float(row['total_sales']),
-                transaction_count=int(row['receipt_number']),
-                avg_transaction=float(row['avg_transaction']) if not pd.isna(row['avg_transaction']) else 0.0,
-                discount_rate=float(row['discount_rate']),
-                avg_daily_sales=float(row['avg_daily_sales']) if not pd.isna(row['avg_daily_sales']) else 0.0
+                store_name=store,
+                total_sales=float(totals.total_sales),
+                transaction_count=int(transaction_count),
+                avg_transaction=float(totals.total_sales / transaction_count) if transaction_count > 0 else 0.0,
+                discount_rate=float(totals.total_discount / gross_sales * 100) if gross_sales > 0 else 0.0,
+                # 데이터가 있는 날짜 수 기준 일 평균 매출
+                avg_daily_sales=float(totals.total_sales / totals.days) if totals.days > 0 else 0.0
             ))
             
         return result
@@ -363,6 +337,8 @@ class CompareService:
         return insights
         
     @staticmethod
+    @cached("compare.get_top_performers", tables=(Tables.DAILY_SALES_SUMMARY,), stores_param=None)
+    @offload(io_thread_pool)
     async def get_top_performers(
         start_date: date,
         end_date: date,
@@ -381,16 +357,10 @@ class CompareService:
         Returns:
             상위 매장 조회 결과
         """
-        # 요약 테이블을 통한 매출 데이터 조회
-        query = get_table(Tables.DAILY_SALES_SUMMARY)\
-                .select("*")\
-                .gte("date", start_date.isoformat())\
-                .lte("date", end_date.isoformat())
-            
-        response = query.execute()
-        data = response.data
+        # 매장별 기간 집계 (일자별 부분 집계 캐시 병합)
+        store_totals = await daily_aggregate_cache.summarize(start_date, end_date)
         
-        if not data:
+        if not store_totals:
             # 데이터가 없는 경우 빈 응답 반환
             return TopPerformerResponse(
                 metric_name=metric,
@@ -399,13 +369,8 @@ class CompareService:
                 performers=[]
             )
         
-        df = pd.DataFrame(data)
-        
-        # 필요한 필드 확인 및 타입 변환
-        df['date'] = pd.to_datetime(df['date']).dt.date
-        
         # 매장별 지표 계산
-        store_metrics = await CompareService._calculate_store_metrics(df)
+        store_metrics = await CompareService._calculate_store_metrics(store_totals)
         
         # 메트릭 기준 정렬 방향 결정 (할인율은 낮을수록 좋음, 나머지는 높을수록 좋음)
         reverse = metric != "discount_rate"
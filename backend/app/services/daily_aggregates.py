@@ -0,0 +1,294 @@
+## daily_aggregates.py
+
+"""
+매장·일자별 부분 집계 캐시
+
+대시보드는 최근 7/30/90일처럼 겹치는 기간을 하루씩 밀어 가며 조회하므로
+응답 단위 캐시는 날짜가 바뀔 때마다 모두 빗나갑니다. 이 캐시는 (매장, 일자)별
+매출 합계·행 수·영수증 번호 집합을 일자 단위로 저장하고, 임의의 기간 요청을
+캐시된 일자의 병합과 누락된 일자 구간만의 조회로 응답합니다.
+
+영수증 번호 집합을 그대로 보관하므로 기간 전체의 고유 거래 건수(nunique)도
+원천 데이터로 계산한 값과 정확히 같습니다.
+
+I/O 스레드 풀에서 여러 기간을 동시에 조회하므로 캐시 상태 변경은 잠금 안에서 하고,
+누락 구간의 DB 조회는 잠금 밖에서 실행합니다.
+
+SHARED_CACHE_ENABLED이면 누락 일자를 DB보다 먼저 프로세스 간 공유 캐시에서 찾고,
+DB에서 조회한 일자도 공유 캐시에 저장해 다른 워커 프로세스가 다시 조회하지 않게 합니다.
+"""
+
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+import logging
+import threading
+
+from app.core import log_policy
+from app.core.cache import DataScope
+from app.core.config import settings
+from app.core.data_version import DataChange, data_version_bus
+from app.core.database import Tables, run_query
+from app.core.shared_cache import shared_cache
+from app.utils.date_utils import get_date_range
+
+logger = logging.getLogger(__name__)
+
+
+class DailyPartial:
+    """매장 하나의 부분 집계 (일자 하나 또는 여러 일자 병합)"""
+
+    __slots__ = ("total_sales", "actual_sales", "total_discount", "row_count", "receipts", "days")
+
+    def __init__(
+        self,
+        total_sales: int = 0,
+        actual_sales: int = 0,
+        total_discount: int = 0,
+        row_count: int = 0,
+        receipts: Optional[Set[str]] = None,
+        days: int = 0
+    ):
+        self.total_sales = total_sales
+        self.actual_sales = actual_sales
+        self.total_discount = total_discount
+        self.row_count = row_count
+        self.receipts = receipts if receipts is not None else set()
+        self.days = days
+
+    def merge(self, other: "DailyPartial") -> "DailyPartial":
+        self.total_sales += other.total_sales
+        self.actual_sales += other.actual_sales
+        self.total_discount += other.total_discount
+        self.row_count += other.row_count
+        self.receipts |= other.receipts
+        self.days += other.days
+        return self
+
+    @property
+    def transaction_count(self) -> int:
+        """고유 영수증 번호 수"""
+        return len(self.receipts)
+
+
+class DailyAggregateCache:
+    """일자 단위 LRU로 관리하는 (매장, 일자) 부분 집계 캐시"""
+
+    # 영수증 번호 구분자 (GROUP_CONCAT)
+    _SEPARATOR = "\x1f"
+    # 매장명이 없는 레코드의 키 (전체 합계에는 포함, 매장별 결과에서는 제외)
+    UNKNOWN_STORE = ""
+
+    def __init__(self, max_days: int):
+        """
+        Args:
+            max_days: 캐시에 보관할 최대 일자 수
+        """
+        self.max_days = max_days
+        # 일자 → {매장: 부분 집계}, 조회한 일자는 데이터가 없어도 빈 dict로 저장
+        self._days: "OrderedDict[date, Dict[str, DailyPartial]]" = OrderedDict()
+        self.stats = {
+            "cached_days": 0, "shared_days": 0, "fetched_days": 0, "queries": 0, "evictions": 0, "invalidated_days": 0
+        }
+        self._lock = threading.Lock()
+
+    def on_data_change(self, change: DataChange) -> None:
+        """데이터 변경 구독자 - 변경된 날짜 구간의 일자만 제거 (구간이 없으면 전체)"""
+        if not change.affects(tables=(Tables.DAILY_SALES_SUMMARY,)):
+            return
+        with self._lock:
+            removed = [
+                day for day in self._days
+                if (change.start_date is None or day >= change.start_date)
+                and (change.end_date is None or day <= change.end_date)
+            ]
+            for day in removed:
+                del self._days[day]
+            self.stats["invalidated_days"] += len(removed)
+        if removed:
+            logger.info(f"데이터 변경으로 일자별 집계 캐시 {len(removed)}일 무효화 (버전 {change.version})")
+
+    @staticmethod
+    def _missing_spans(missing: List[date]) -> List[Tuple[date, date]]:
+        """누락 일자를 연속 구간으로 묶음"""
+        spans = []
+        for day in missing:
+            if spans and spans[-1][1] + timedelta(days=1) == day:
+                spans[-1] = (spans[-1][0], day)
+            else:
+                spans.append((day, day))
+        return spans
+
+    async def _fetch_span(self, start_date: date, end_date: date) -> Dict[date, Dict[str, DailyPartial]]:
+        """한 구간의 모든 매장 부분 집계를 한 번의 쿼리로 조회"""
+        rows = await run_query(
+            "SELECT date, store_name, "
+            "SUM(total_sales) AS total_sales, "
+            "SUM(actual_sales) AS actual_sales, "
+            "SUM(total_discount) AS total_discount, "
+            "COUNT(*) AS row_count, "
+            "GROUP_CONCAT(receipt_number, :separator) AS receipts "
+            "FROM daily_sales_summary "
+            "WHERE date >= :start_date AND date <= :end_date "
+            "GROUP BY date, store_name",
+            {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "separator": self._SEPARATOR
+            }
+        )
+        with self._lock:
+            self.stats["queries"] += 1
+
+        result: Dict[date, Dict[str, DailyPartial]] = {day: {} for day in get_date_range(start_date, end_date)}
+        for row in rows:
+            day = date.fromisoformat(str(row["date"])[:10])
+            store = row["store_name"] or self.UNKNOWN_STORE
+            partial = DailyPartial(
+                total_sales=int(row["total_sales"] or 0),
+                actual_sales=int(row["actual_sales"] or 0),
+                total_discount=int(row["total_discount"] or 0),
+                row_count=int(row["row_count"]),
+                receipts=set(row["receipts"].split(self._SEPARATOR)) if row["receipts"] else set(),
+                days=1
+            )
+            stores = result.setdefault(day, {})
+            if store in stores:
+                stores[store].merge(partial).days = 1
+            else:
+                stores[store] = partial
+        return result
+
+    @staticmethod
+    def _shared_key(day: date) -> Tuple[str, str]:
+        return ("daily_aggregates.day", day.isoformat())
+
+    def _load_shared(self, days: List[date], version: Optional[int]) -> Dict[date, Dict[str, DailyPartial]]:
+        """공유 캐시에서 다른 워커 프로세스가 조회한 일자 찾기"""
+        if not settings.SHARED_CACHE_ENABLED:
+            return {}
+        loaded = {}
+        for day in days:
+            found, partials = shared_cache.get(self._shared_key(day), version)
+            if found:
+                loaded[day] = partials
+        return loaded
+
+    def _store_shared(self, fetched: Dict[date, Dict[str, DailyPartial]], version: Optional[int]) -> None:
+        """DB에서 조회한 일자를 공유 캐시에 저장 (조회 도중 데이터가 바뀌었으면 저장하지 않음)"""
+        if not settings.SHARED_CACHE_ENABLED or data_version_bus.current != version:
+            return
+        for day, partials in fetched.items():
+            scope = DataScope(tables=(Tables.DAILY_SALES_SUMMARY,), start_date=day, end_date=day)
+            shared_cache.set(self._shared_key(day), partials, version, scope=scope)
+
+    async def get_days(self, start_date: date, end_date: date) -> Dict[date, Dict[str, DailyPartial]]:
+        """
+        기간의 일자별·매장별 부분 집계 조회 (누락된 일자만 DB 조회)
+
+        반환값은 캐시 내부 객체이므로 수정하지 않아야 합니다.
+
+        Returns:
+            {일자: {매장: 부분 집계}}
+        """
+        version = data_version_bus.poll()
+        dates = get_date_range(start_date, end_date)
+        cached: Dict[date, Dict[str, DailyPartial]] = {}
+        with self._lock:
+            for day in dates:
+                if day in self._days:
+                    self._days.move_to_end(day)
+                    cached[day] = self._days[day]
+        missing = [day for day in dates if day not in cached]
+
+        shared = self._load_shared(missing, version)
+        fetched: Dict[date, Dict[str, DailyPartial]] = {}
+        for span_start, span_end in self._missing_spans([day for day in missing if day not in shared]):
+            fetched.update(await self._fetch_span(span_start, span_end))
+        self._store_shared(fetched, version)
+        fetched.update(shared)
+
+        with self._lock:
+            self.stats["cached_days"] += len(cached)
+            self.stats["shared_days"] += len(shared)
+            self.stats["fetched_days"] += len(missing) - len(shared)
+            # 조회 중 데이터 버전이 바뀌었으면 이전 버전 값이므로 저장하지 않음 (반환은 그대로)
+            if data_version_bus.current == version:
+                for day in missing:
+                    self._days[day] = fetched[day]
+            while len(self._days) > self.max_days:
+                self._days.popitem(last=False)
+                self.stats["evictions"] += 1
+
+        result = {day: cached[day] if day in cached else fetched[day] for day in dates}
+
+        if missing:
+            log_policy.count("rollup_days_fetched", len(missing) - len(shared))
+            logger.debug("일자별 집계 캐시: %d일 중 %d일 조회, %d일 공유 캐시", len(dates), len(missing) - len(shared), len(shared))
+        return result
+
+    async def summarize(
+        self,
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]] = None
+    ) -> Dict[str, DailyPartial]:
+        """
+        기간 전체의 매장별 병합 집계 (days는 데이터가 있는 일자 수)
+
+        Args:
+            store_name: 매장 필터 (None이면 모든 매장)
+
+        Returns:
+            {매장: 병합된 부분 집계}, 매장명 순 정렬
+        """
+        return self.merge_stores(await self.get_days(start_date, end_date), store_name)
+
+    @staticmethod
+    def merge_stores(
+        days: Dict[date, Dict[str, DailyPartial]],
+        store_name: Optional[List[str]] = None
+    ) -> Dict[str, DailyPartial]:
+        """
+        일자별 부분 집계를 매장별로 병합 (입력 객체는 수정하지 않음)
+
+        Returns:
+            {매장: 병합된 부분 집계}, 매장명 순 정렬
+        """
+        stores = set(store_name) if store_name else None
+        merged: Dict[str, DailyPartial] = {}
+        for partials in days.values():
+            for store, partial in partials.items():
+                if stores is not None and store not in stores:
+                    continue
+                merged.setdefault(store, DailyPartial()).merge(partial)
+        return dict(sorted(merged.items()))
+
+    async def refresh(self, days: int, end_date: Optional[date] = None) -> int:
+        """
+        최근 일자 집계를 미리 채움 (데이터 변경으로 제거된 일자 재조회, 스케줄러 작업)
+
+        Args:
+            days: 최근 일수
+            end_date: 종료일 (기본값: 오늘)
+
+        Returns:
+            새로 조회한 일자 수
+        """
+        end_date = end_date or date.today()
+        fetched_before = self.stats["fetched_days"]
+        await self.get_days(end_date - timedelta(days=days - 1), end_date)
+        return self.stats["fetched_days"] - fetched_before
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._days.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"days": len(self._days), "max_days": self.max_days, **self.stats}
+
+
+# 캐시 인스턴스
+daily_aggregate_cache = DailyAggregateCache(max_days=settings.DAILY_AGGREGATE_CACHE_MAX_DAYS)
+data_version_bus.subscribe(daily_aggregate_cache.on_data_change)
@@ -0,0 +1,219 @@
+## dashboard_service.py
+
+"""
+대시보드 묶음 조회
+
+대시보드 첫 화면은 일별·시간대별·제품별·결제 유형별 매출과 KPI 요약을 같은 기간으로
+조회합니다. 위젯마다 API를 호출하면 같은 구간을 테이블별로 여러 번 읽으므로,
+테이블마다 한 번의 GROUP BY 쿼리로 위젯들이 공유하는 부분 합계를 만들고
+각 위젯 결과는 개별 서비스와 같은 변환 함수(build_*)로 계산합니다.
+
+- daily_sales_summary: (일자, 매장, 결제 유형)별 합계 → 일별 매출, KPI 요약, 결제 유형별 매출
+- receipt_sales_detail: (시간대, 매장, 제품)별 합계 → 시간대별 매출, 제품별 매출
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+import pandas as pd
+
+from app.core.cache import cached
+from app.core.executors import io_thread_pool, offload
+from app.core.database import Tables, run_query
+from app.models.dashboard import DashboardBundle
+from app.services.daily_aggregates import DailyAggregateCache, DailyPartial
+from app.services.kpi_service import KPIService
+from app.services.sales_service import SalesService
+from app.utils.date_utils import get_date_range
+
+logger = logging.getLogger(__name__)
+
+
+class DashboardService:
+    """대시보드 묶음 조회 서비스"""
+
+    # 영수증 번호 구분자 (GROUP_CONCAT)
+    _SEPARATOR = "\x1f"
+
+    @staticmethod
+    def _store_filter(store_name: Optional[List[str]], params: Dict[str, Any]) -> str:
+        """매장 필터 조건 (바인드 파라미터를 params에 추가)"""
+        if not store_name:
+            return ""
+        placeholders = ", ".join(f":store_{i}" for i in range(len(store_name)))
+        params.update({f"store_{i}": name for i, name in enumerate(store_name)})
+        return f" AND store_name IN ({placeholders})"
+
+    @staticmethod
+    async def _scan_daily_summary(
+        start_date: date,
+        end_date: date
+    ) -> Tuple[Dict[date, Dict[str, DailyPartial]], pd.DataFrame]:
+        """
+        daily_sales_summary 한 번 조회 - (일자, 매장, 결제 유형)별 합계
+
+        일별 매출은 매장 필터를 적용하기 전의 전체 매장 목록이 필요하므로 모든 매장을 조회합니다.
+
+        Returns:
+            ({일자: {매장: 부분 집계}}, store_name·payment_type·total_sales·receipt_count 컬럼의 부분 합계)
+        """
+        rows = await run_query(
+            "SELECT date, store_name, payment_type, "
+            "SUM(total_sales) AS total_sales, "
+            "SUM(actual_sales) AS actual_sales, "
+            "SUM(total_discount) AS total_discount, "
+            "COUNT(*) AS row_count, "
+            "COUNT(receipt_number) AS receipt_count, "
+            "GROUP_CONCAT(receipt_number, :separator) AS receipts "
+            "FROM daily_sales_summary "
+            "WHERE date >= :start_date AND date <= :end_date "
+            "GROUP BY date, store_name, payment_type",
+            {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "separator": DashboardService._SEPARATOR
+            }
+        )
+
+        days: Dict[date, Dict[str, DailyPartial]] = {day: {} for day in get_date_range(start_date, end_date)}
+        for row in rows:
+            day = date.fromisoformat(str(row["date"])[:10])
+            store = row["store_name"] or DailyAggregateCache.UNKNOWN_STORE
+            partial = DailyPartial(
+                total_sales=int(row["total_sales"] or 0),
+                actual_sales=int(row["actual_sales"] or 0),
+                total_discount=int(row["total_discount"] or 0),
+                row_count=int(row["row_count"]),
+                receipts=set(row["receipts"].split(DashboardService._SEPARATOR)) if row["receipts"] else set(),
+                days=1
+            )
+            stores = days.setdefault(day, {})
+            if store in stores:
+                stores[store].merge(partial).days = 1
+            else:
+                stores[store] = partial
+
+        payment_rows = pd.DataFrame(rows, columns=["store_name", "payment_type", "total_sales", "receipt_count"])
+        return days, payment_rows
+
+    @staticmethod
+    async def _scan_receipt_detail(
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        receipt_sales_detail 한 번 조회 - (시간대, 매장, 제품)별 합계
+
+        Returns:
+            hour, store_name, product_name, product_code, quantity, total_sales,
+            discount_amount, actual_sales, receipt_count 컬럼의 부분 합계
+        """
+        params: Dict[str, Any] = {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat()
+        }
+        store_filter = DashboardService._store_filter(store_name, params)
+        rows = await run_query(
+            "SELECT CAST(strftime('%H', payment_time) AS INTEGER) AS hour, "
+            "store_name, product_name, product_code, "
+            "SUM(quantity) AS quantity, "
+            "SUM(total_sales) AS total_sales, "
+            "SUM(discount_amount) AS discount_amount, "
+            "SUM(actual_sales) AS actual_sales, "
+            "COUNT(receipt_number) AS receipt_count "
+            "FROM receipt_sales_detail "
+            f"WHERE date >= :start_date AND date <= :end_date{store_filter} "
+            "GROUP BY hour, store_name, product_name, product_code",
+            params
+        )
+        return pd.DataFrame(rows, columns=[
+            "hour", "store_name", "product_name", "product_code", "quantity",
+            "total_sales", "discount_amount", "actual_sales", "receipt_count"
+        ])
+
+    @staticmethod
+    def _payment_type_sales(payment_rows: pd.DataFrame, store_name: Optional[List[str]] = None):
+        """결제 유형별 매출 (매장 필터는 여기서 적용)"""
+        if store_name:
+            payment_rows = payment_rows[payment_rows["store_name"].isin(store_name)]
+        if payment_rows.empty:
+            return []
+        payment_rows = payment_rows.assign(
+            payment_type=payment_rows["payment_type"].fillna("Unknown"),
+            total_sales=payment_rows["total_sales"].fillna(0)
+        )
+        payment_sales = payment_rows.groupby("payment_type").agg({
+            "total_sales": "sum",
+            "receipt_count": "sum"
+        }).reset_index().rename(columns={"receipt_count": "receipt_number"})
+        return SalesService.build_payment_type_sales(payment_sales)
+
+    @staticmethod
+    def _hourly_sales(receipt_rows: pd.DataFrame, store_name: Optional[List[str]] = None):
+        """시간대별 매출 (결제 시간·매장이 없는 행 제외)"""
+        if receipt_rows.empty:
+            return SalesService.empty_hourly_sales(store_name)
+        hourly_sales = receipt_rows.groupby(["hour", "store_name"]).agg({
+            "total_sales": "sum",
+            "receipt_count": "sum"
+        }).reset_index().rename(columns={"receipt_count": "receipt_number"})
+        return SalesService.build_hourly_sales(hourly_sales, store_name)
+
+    @staticmethod
+    def _product_sales(receipt_rows: pd.DataFrame, store_name: Optional[List[str]] = None, limit: int = 20):
+        """제품별 매출 (null 값 처리는 개별 조회와 동일)"""
+        if receipt_rows.empty:
+            return []
+        df = receipt_rows.assign(
+            quantity=receipt_rows["quantity"].fillna(0),
+            total_sales=receipt_rows["total_sales"].fillna(0),
+            discount_amount=receipt_rows["discount_amount"].fillna(0),
+            actual_sales=receipt_rows["actual_sales"].fillna(0),
+            store_name=receipt_rows["store_name"].fillna("전체")
+        )
+        return SalesService.build_product_sales(df, store_name, limit)
+
+    @staticmethod
+    @cached("dashboard.get_bundle", tables=(Tables.DAILY_SALES_SUMMARY, Tables.RECEIPT_SALES_DETAIL))
+    @offload(io_thread_pool)
+    async def get_bundle(
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]] = None,
+        product_limit: int = 20
+    ) -> DashboardBundle:
+        """
+        대시보드 위젯 묶음을 테이블별 한 번의 조회로 계산합니다.
+
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            store_name: 매장 이름 필터 (None인 경우 모든 매장)
+            product_limit: 제품별 매출 상위 제품 수 제한
+
+        Returns:
+            KPI 요약, 일별·시간대별·제품별·결제 유형별 매출 묶음
+        """
+        logger.info(f"대시보드 묶음 조회: start_date={start_date}, end_date={end_date}, store_name={store_name}")
+
+        days, payment_rows = await DashboardService._scan_daily_summary(start_date, end_date)
+        receipt_rows = await DashboardService._scan_receipt_detail(start_date, end_date, store_name)
+
+        return DashboardBundle(
+            start_date=start_date,
+            end_date=end_date,
+            store_name=store_name,
+            kpi_summary=KPIService.build_kpi_summary(
+                DailyAggregateCache.merge_stores(days, store_name), start_date, end_date, store_name
+            ),
+            daily_sales=SalesService.build_daily_sales(days, store_name),
+            hourly_sales=DashboardService._hourly_sales(receipt_rows, store_name),
+            product_sales=DashboardService._product_sales(receipt_rows, store_name, product_limit),
+            payment_type_sales=DashboardService._payment_type_sales(payment_rows, store_name)
+        )
+
+
+# 서비스 인스턴스 생성 (의존성 주입용)
+dashboard_service = DashboardService()
@@ -0,0 +1,432 @@
+## export_service.py
+
+"""
+대용량 데이터 내보내기
+
+원천 테이블(영수증 상세, 일별 요약)과 집계 테이블(매장·일자별 매출, 제품·일자별 판매,
+배치 예측 결과, 시계열 분해 결과)을 날짜·매장 조건으로 내보냅니다.
+- DB 커서에서 EXPORT_BATCH_SIZE 행씩 읽어 배치 단위로 변환·전송하므로 기간이 길어도
+  전체 결과를 메모리에 올리지 않습니다.
+- Apache Arrow IPC 스트림과 Parquet 형식 지원 (pyarrow, requirements.txt에 포함)
+- 가벼운 대안으로 NDJSON(한 줄에 JSON 객체 하나)과 CSV 형식 지원
+- StreamingResponse가 클라이언트 수신 속도에 맞춰 다음 청크를 요청하므로 DB 커서도
+  그만큼만 진행됩니다. (클라이언트가 느리면 읽기도 멈춤)
+"""
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import csv
+import io
+import json
+import logging
+
+from sqlalchemy import bindparam, inspect, text
+
+from app.core.config import settings
+from app.core.database import Tables, engine
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # 설치되지 않은 환경에서는 arrow·parquet 요청에 501 응답
+    pa = None
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class ExportFormat(str, Enum):
+    """내보내기 형식"""
+    ARROW = "arrow"      # Apache Arrow IPC 스트림
+    PARQUET = "parquet"  # Parquet 파일
+    NDJSON = "ndjson"    # 줄 단위 JSON
+    CSV = "csv"          # CSV (헤더 포함)
+
+
+# 형식별 (Content-Type, 파일 확장자)
+EXPORT_MEDIA_TYPES: Dict[ExportFormat, Tuple[str, str]] = {
+    ExportFormat.ARROW: ("application/vnd.apache.arrow.stream", "arrow"),
+    ExportFormat.PARQUET: ("application/vnd.apache.parquet", "parquet"),
+    ExportFormat.NDJSON: ("application/x-ndjson", "ndjson"),
+    ExportFormat.CSV: ("text/csv; charset=utf-8", "csv"),
+}
+
+# pyarrow가 필요한 형식
+ARROW_FORMATS = (ExportFormat.ARROW, ExportFormat.PARQUET)
+
+
+class ExportSource:
+    """내보내기 대상 (테이블 또는 집계 쿼리)"""
+
+    def __init__(
+        self,
+        name: str,
+        columns: Sequence[Tuple[str, str]],
+        from_clause: str,
+        date_column: str = "date",
+        store_column: Optional[str] = "store_name",
+        group_by: Optional[str] = None,
+        order_by: Optional[str] = None,
+        description: str = ""
+    ):
+        """
+        Args:
+            name: 내보내기 이름 (/export/{name})
+            columns: (출력 컬럼명, 타입) 목록, 타입은 int/float/str/date/timestamp
+                     집계 대상은 출력 컬럼명 대신 "SQL 식 AS 컬럼명" 형태의 식을 사용할 수 있음
+            from_clause: FROM 대상 테이블
+            date_column: 날짜 필터 컬럼
+            store_column: 매장 필터 컬럼 (None이면 매장 필터 없음)
+            group_by: 집계 쿼리의 GROUP BY 절
+            order_by: 정렬 (기본: 날짜 컬럼)
+        """
+        self.name = name
+        self.columns = [(_column_name(expr), kind) for expr, kind in columns]
+        self.select_list = ", ".join(expr for expr, _ in columns)
+        self.from_clause = from_clause
+        self.date_column = date_column
+        self.store_column = store_column
+        self.group_by = group_by
+        self.order_by = order_by or date_column
+        self.description = description
+
+    def build_query(
+        self,
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]] = None
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """필터가 적용된 SELECT 문과 파라미터"""
+        conditions = [f"{self.date_column} >= :start_date", f"{self.date_column} <= :end_date"]
+        params: Dict[str, Any] = {"start_date": start_date.isoformat(), "end_date": end_date.isoformat()}
+        if store_name and self.store_column:
+            conditions.append(f"{self.store_column} IN :store_names")
+            params["store_names"] = list(store_name)
+
+        sql = f"SELECT {self.select_list} FROM {self.from_clause} WHERE {' AND '.join(conditions)}"
+        if self.group_by:
+            sql += f" GROUP BY {self.group_by}"
+        sql += f" ORDER BY {self.order_by}"
+
+        query = text(sql)
+        if "store_names" in params:
+            query = query.bindparams(bindparam("store_names", expanding=True))
+        return query, params
+
+
+def _column_name(expr: str) -> str:
+    """집계 식의 출력 컬럼명 (예: SUM(x) AS total → total)"""
+    return expr.rsplit(" AS ", 1)[-1].strip()
+
+
+_DETAIL_COLUMNS = [
+    ("id", "int"), ("date", "date"), ("pos_number", "str"), ("receipt_number", "str"),
+    ("payment_type", "str"), ("table_name", "str"), ("first_order", "timestamp"),
+    ("payment_time", "timestamp"), ("product_code", "str"), ("barcode", "str"),
+    ("product_name", "str"), ("quantity", "int"), ("total_sales", "int"),
+    ("erp_mapping_code", "str"), ("note", "str"), ("discount_amount", "int"),
+    ("discount_type", "str"), ("actual_sales", "int"), ("price", "int"), ("vat", "int"),
+    ("created_at", "timestamp"), ("store_name", "str"),
+]
+
+_SUMMARY_COLUMNS = [
+    ("id", "int"), ("date", "date"), ("no", "int"), ("pos_number", "str"),
+    ("receipt_number", "str"), ("payment_time", "timestamp"), ("payment_type", "str"),
+    ("total_sales", "int"), ("total_discount", "int"), ("actual_sales", "int"),
+    ("price", "int"), ("vat", "int"), ("created_at", "timestamp"), ("store_name", "str"),
+]
+
+# 내보내기 대상 목록
+EXPORT_SOURCES: Dict[str, ExportSource] = {
+    source.name: source for source in [
+        # 원천 테이블
+        ExportSource(
+            Tables.RECEIPT_SALES_DETAIL, _DETAIL_COLUMNS, Tables.RECEIPT_SALES_DETAIL,
+            order_by="date, id", description="영수증 상세 (제품 단위)"
+        ),
+        ExportSource(
+            Tables.DAILY_SALES_SUMMARY, _SUMMARY_COLUMNS, Tables.DAILY_SALES_SUMMARY,
+            order_by="date, id", description="일별 매출 요약 (영수증 단위)"
+        ),
+        # 집계 테이블
+        ExportSource(
+            "daily_store_sales",
+            [
+                ("date", "date"), ("store_name", "str"),
+                ("SUM(total_sales) AS total_sales", "int"),
+                ("SUM(actual_sales) AS actual_sales", "int"),
+                ("SUM(total_discount) AS total_discount", "int"),
+                ("COUNT(DISTINCT receipt_number) AS transaction_count", "int"),
+            ],
+            Tables.DAILY_SALES_SUMMARY,
+            group_by="date, store_name", order_by="date, store_name",
+            description="매장·일자별 매출 집계"
+        ),
+        ExportSource(
+            "daily_product_sales",
+            [
+                ("date", "date"), ("store_name", "str"), ("product_name", "str"),
+                ("SUM(quantity) AS quantity", "int"),
+                ("SUM(total_sales) AS total_sales", "int"),
+                ("SUM(actual_sales) AS actual_sales", "int"),
+            ],
+            Tables.RECEIPT_SALES_DETAIL,
+            group_by="date, store_name, product_name", order_by="date, store_name, product_name",
+            description="매장·제품·일자별 판매 집계"
+        ),
+        ExportSource(
+            "forecast_results",
+            [
+                ("store_name", "str"), ("metric", "str"), ("series_start", "date"),
+                ("series_end", "date"), ("forecast_date", "date"), ("value", "float"),
+                ("upper_bound", "float"), ("lower_bound", "float"), ("method", "str"),
+                ("generated_at", "timestamp"),
+            ],
+            "forecast_results",
+            date_column="forecast_date", order_by="forecast_date, store_name, metric",
+            description="배치 예측 결과 (예측일 기준 필터)"
+        ),
+        ExportSource(
+            "seasonal_components",
+            [
+                ("store_name", "str"), ("metric", "str"), ("date", "date"), ("observed", "float"),
+                ("trend", "float"), ("weekly", "float"), ("yearly", "float"), ("residual", "float"),
+                ("generated_at", "timestamp"),
+            ],
+            "seasonal_components",
+            order_by="date, store_name, metric",
+            description="시계열 분해 결과"
+        ),
+    ]
+}
+
+
+class _ChunkSink(io.RawIOBase):
+    """pyarrow writer 출력을 모아 두었다가 배치마다 꺼내는 쓰기 전용 버퍼"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _json_default(value: Any) -> Any:
+    # DB 드라이버가 날짜·시각 객체를 반환하는 경우 (SQLite는 문자열)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+class ExportService:
+    """원천·집계 데이터 내보내기 서비스"""
+
+    @staticmethod
+    def get_source(name: str) -> Optional[ExportSource]:
+        return EXPORT_SOURCES.get(name)
+
+    @staticmethod
+    def source_ready(source: ExportSource) -> bool:
+        """대상 테이블 존재 여부 (배치 결과 테이블은 배치 실행 전에는 없음)"""
+        return engine is not None and inspect(engine).has_table(source.from_clause)
+
+    @staticmethod
+    def list_sources() -> List[Dict[str, Any]]:
+        """내보내기 대상과 컬럼 목록"""
+        return [
+            {"name": source.name, "description": source.description, "columns": [name for name, _ in source.columns]}
+            for source in EXPORT_SOURCES.values()
+        ]
+
+    @staticmethod
+    def iter_batches(
+        source: ExportSource,
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]] = None,
+        batch_size: Optional[int] = None
+    ) -> Iterator[List[tuple]]:
+        """
+        서버 측 커서에서 batch_size 행씩 읽어 반환합니다. (동기 제너레이터)
+
+        제너레이터가 종료되거나 닫히면 DB 연결도 반환됩니다.
+        """
+        if engine is None:
+            raise Exception("Database connection not available")
+
+        batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+        query, params = source.build_query(start_date, end_date, store_name)
+        rows = 0
+        with engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(query, params)
+            for partition in result.partitions(batch_size):
+                rows += len(partition)
+                yield partition
+        logger.info(f"내보내기 완료: {source.name} {start_date}~{end_date} {rows}행")
+
+    # Arrow / Parquet
+
+    @staticmethod
+    def arrow_available() -> bool:
+        return pa is not None
+
+    @staticmethod
+    def arrow_schema(source: ExportSource) -> "pa.Schema":
+        types = {
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "str": pa.string(),
+            "date": pa.date32(),
+            "timestamp": pa.timestamp("us"),
+        }
+        return pa.schema([(name, types[kind]) for name, kind in source.columns])
+
+    @staticmethod
+    def _arrow_array(values: Sequence[Any], field: "pa.Field") -> "pa.Array":
+        """한 컬럼의 값을 Arrow 배열로 변환 (SQLite의 날짜·시각 문자열은 Arrow 캐스트로 변환)"""
+        if not (pa.types.is_date(field.type) or pa.types.is_timestamp(field.type)):
+            return pa.array(values, type=field.type)
+
+        array = pa.array(values)
+        if pa.types.is_null(array.type):
+            return pa.nulls(len(values), type=field.type)
+        if pa.types.is_string(array.type):
+            if pa.types.is_date(field.type):
+                # "YYYY-MM-DD HH:MM:SS" 형태로 저장된 날짜도 허용
+                array = pc.utf8_slice_codeunits(array, 0, 10)
+            try:
+                return array.cast(field.type)
+            except pa.ArrowInvalid:
+                # 형식이 섞인 값은 개별 변환 (변환할 수 없는 값은 null)
+                parsed = [_parse_datetime(value) for value in array.to_pylist()]
+                if pa.types.is_date(field.type):
+                    parsed = [value.date() if value else None for value in parsed]
+                return pa.array(parsed, type=field.type)
+        return array.cast(field.type)
+
+    @staticmethod
+    def to_record_batch(rows: List[tuple], schema: "pa.Schema") -> "pa.RecordBatch":
+        """행 목록(한 배치)을 Arrow RecordBatch로 변환"""
+        columns = list(zip(*rows)) if rows else [()] * len(schema)
+        arrays = [ExportService._arrow_array(values, field) for values, field in zip(columns, schema)]
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    @staticmethod
+    def stream_arrow(
+        source: ExportSource,
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]] = None,
+        file_format: ExportFormat = ExportFormat.ARROW
+    ) -> Iterator[bytes]:
+        """
+        Arrow IPC 스트림 또는 Parquet 바이트를 배치 단위로 생성합니다.
+
+        Parquet은 배치마다 row group 하나를 쓰고 마지막에 footer를 씁니다.
+
+        Args:
+            file_format: ExportFormat.ARROW 또는 ExportFormat.PARQUET
+        """
+        schema = ExportService.arrow_schema(source)
+        sink = _ChunkSink()
+        if file_format == ExportFormat.PARQUET:
+            writer = pq.ParquetWriter(sink, schema, compression="zstd")
+        else:
+            writer = pa.ipc.new_stream(sink, schema)
+
+        try:
+            header = sink.drain()
+            if header:
+                yield header
+            for rows in ExportService.iter_batches(source, start_date, end_date, store_name):
+                writer.write_batch(ExportService.to_record_batch(rows, schema))
+                yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
+
+    # NDJSON / CSV
+
+    @staticmethod
+    def stream_ndjson(
+        source: ExportSource,
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]] = None
+    ) -> Iterator[bytes]:
+        """한 줄에 행 하나씩 JSON 객체로 인코딩한 바이트를 배치 단위로 생성합니다."""
+        names = [name for name, _ in source.columns]
+        for rows in ExportService.iter_batches(source, start_date, end_date, store_name):
+            if orjson is not None:
+                lines = [orjson.dumps(dict(zip(names, row)), default=_json_default) for row in rows]
+                yield b"\n".join(lines) + b"\n"
+            else:
+                lines = [json.dumps(dict(zip(names, row)), ensure_ascii=False, default=_json_default) for row in rows]
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+
+    @staticmethod
+    def stream_csv(
+        source: ExportSource,
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]] = None
+    ) -> Iterator[bytes]:
+        """헤더 행과 데이터 행을 CSV로 인코딩한 바이트를 배치 단위로 생성합니다. (NULL은 빈 값)"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow([name for name, _ in source.columns])
+        yield buffer.getvalue().encode("utf-8")
+        for rows in ExportService.iter_batches(source, start_date, end_date, store_name):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(rows)
+            yield buffer.getvalue().encode("utf-8")
+
+    @staticmethod
+    def stream(
+        source: ExportSource,
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]] = None,
+        file_format: ExportFormat = ExportFormat.ARROW
+    ) -> Iterator[bytes]:
+        """형식에 맞는 내보내기 스트림 (StreamingResponse 본문)"""
+        if file_format == ExportFormat.NDJSON:
+            return ExportService.stream_ndjson(source, start_date, end_date, store_name)
+        if file_format == ExportFormat.CSV:
+            return ExportService.stream_csv(source, start_date, end_date, store_name)
+        return ExportService.stream_arrow(source, start_date, end_date, store_name, file_format)
+
+
+# 서비스 인스턴스 생성
+export_service = ExportService()
@@ -0,0 +1,213 @@
+## fast_forecast.py
+
+"""
+NumPy 기반 경량 예측 엔진
+
+여러 시계열을 (시계열 수, 일수) 2차원 배열로 받아 한 번에 예측합니다.
+- seasonal_naive: 직전 같은 요일 값 반복
+- holt_winters: 주간 계절성 가법 Holt-Winters (감쇠 추세), 파라미터는 격자 탐색으로 시계열별 선택
+- linear_weekday: 선형 추세 + 요일 더미 회귀 (최소제곱)
+
+시간 축 반복만 Python 루프이고 시계열·파라미터 축은 모두 벡터 연산이므로,
+수천 개 시계열도 수 밀리초~수십 밀리초 안에 학습·예측합니다.
+"""
+
+from datetime import date
+from typing import Dict, Optional, Tuple
+import itertools
+
+import numpy as np
+
+SEASON_LENGTH = 7  # 주간 계절성
+
+# Holt-Winters 격자 탐색 후보 (level, trend, season 평활 계수)
+HW_ALPHAS = (0.1, 0.3, 0.5)
+HW_BETAS = (0.01, 0.05, 0.1)
+HW_GAMMAS = (0.05, 0.15, 0.3)
+HW_DAMPING = 0.98  # 장기 예측에서 추세가 발산하지 않도록 감쇠
+
+# 요청 method 값 → 응답의 forecast_method 표기
+FAST_FORECAST_METHODS: Dict[str, str] = {
+    "seasonal_naive": "SeasonalNaive",
+    "holt_winters": "HoltWinters",
+    "linear_weekday": "LinearWeekday",
+}
+
+
+def _as_2d(values: np.ndarray) -> Tuple[np.ndarray, bool]:
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        return values[np.newaxis, :], True
+    return values, False
+
+
+def seasonal_naive_forecast(
+    values: np.ndarray,
+    steps: int,
+    season_length: int = SEASON_LENGTH
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    계절 naive 예측 - 마지막 한 주기의 값을 반복합니다.
+
+    Args:
+        values: (시계열 수, 일수) 배열
+        steps: 예측할 일수
+        season_length: 계절 주기
+
+    Returns:
+        (예측값 (시계열 수, steps), 잔차 표준편차 (시계열 수,))
+    """
+    last_season = values[:, -season_length:]
+    reps = -(-steps // season_length)
+    forecast = np.tile(last_season, (1, reps))[:, :steps]
+    if values.shape[1] <= season_length:
+        return forecast, values.std(axis=1)
+    residuals = values[:, season_length:] - values[:, :-season_length]
+    return forecast, residuals.std(axis=1)
+
+
+def holt_winters_forecast(
+    values: np.ndarray,
+    steps: int,
+    season_length: int = SEASON_LENGTH,
+    alphas: Tuple[float, ...] = HW_ALPHAS,
+    betas: Tuple[float, ...] = HW_BETAS,
+    gammas: Tuple[float, ...] = HW_GAMMAS,
+    phi: float = HW_DAMPING
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    가법 Holt-Winters (감쇠 추세) 예측.
+
+    모든 파라미터 조합 × 시계열을 (조합 수, 시계열 수) 상태 배열로 동시에 갱신하고,
+    한 단계 앞 예측 오차 제곱합이 가장 작은 조합을 시계열별로 선택합니다.
+
+    Args:
+        values: (시계열 수, 일수) 배열, 최소 2주기 이상
+        steps: 예측할 일수
+        season_length: 계절 주기
+        alphas, betas, gammas: 격자 탐색 후보
+        phi: 추세 감쇠 계수
+
+    Returns:
+        (예측값 (시계열 수, steps), 잔차 표준편차 (시계열 수,))
+    """
+    n_series, n_days = values.shape
+    m = season_length
+
+    grid = np.array(list(itertools.product(alphas, betas, gammas)))
+    alpha = grid[:, 0, np.newaxis]
+    beta = grid[:, 1, np.newaxis]
+    gamma = grid[:, 2, np.newaxis]
+    n_combos = len(grid)
+
+    # 초기 상태: 첫 두 주기의 평균 차이로 추세, 첫 주기 편차로 계절 성분
+    first = values[:, :m].mean(axis=1)
+    second = values[:, m:2 * m].mean(axis=1)
+    level = np.broadcast_to(first, (n_combos, n_series)).copy()
+    trend = np.broadcast_to((second - first) / m, (n_combos, n_series)).copy()
+    # 계절 성분은 (주기, 조합 수, 시계열 수) 배치로 두어 시점별 접근이 연속 메모리가 되도록 함
+    season = np.broadcast_to((values[:, :m] - first[:, np.newaxis]).T[:, np.newaxis, :], (m, n_combos, n_series)).copy()
+
+    sse = np.zeros((n_combos, n_series))
+    for t in range(n_days):
+        y = values[:, t]
+        s = season[t % m]
+        damped_trend = phi * trend
+        error = y - (level + damped_trend + s)
+        if t >= m:  # 초기화에 사용한 첫 주기는 오차 평가에서 제외
+            sse += error * error
+
+        new_level = alpha * (y - s) + (1 - alpha) * (level + damped_trend)
+        trend = beta * (new_level - level) + (1 - beta) * damped_trend
+        season[t % m] = gamma * (y - new_level) + (1 - gamma) * s
+        level = new_level
+
+    best = sse.argmin(axis=0)
+    series_index = np.arange(n_series)
+    level = level[best, series_index]
+    trend = trend[best, series_index]
+    season = season[:, best, series_index].T
+    residual_std = np.sqrt(sse[best, series_index] / max(n_days - m, 1))
+
+    horizon = np.arange(1, steps + 1)
+    damping = np.cumsum(phi ** horizon)
+    season_index = (n_days + horizon - 1) % m
+    forecast = level[:, np.newaxis] + damping * trend[:, np.newaxis] + season[:, season_index]
+    return forecast, residual_std
+
+
+def linear_weekday_forecast(
+    values: np.ndarray,
+    steps: int,
+    start_date: Optional[date] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    선형 추세 + 요일 효과 회귀 예측.
+
+    모든 시계열이 같은 설계 행렬을 공유하므로 최소제곱 해를 한 번에 구합니다.
+
+    Args:
+        values: (시계열 수, 일수) 배열
+        steps: 예측할 일수
+        start_date: 첫 관측일 (요일 계산용, 없으면 첫 날을 월요일로 간주)
+
+    Returns:
+        (예측값 (시계열 수, steps), 잔차 표준편차 (시계열 수,))
+    """
+    n_series, n_days = values.shape
+    first_weekday = start_date.weekday() if start_date else 0
+
+    def design(t: np.ndarray) -> np.ndarray:
+        weekday = (first_weekday + t) % SEASON_LENGTH
+        dummies = (weekday[:, np.newaxis] == np.arange(1, SEASON_LENGTH)).astype(float)
+        return np.column_stack([np.ones(len(t)), t, dummies])
+
+    x_train = design(np.arange(n_days))
+    coef, *_ = np.linalg.lstsq(x_train, values.T, rcond=None)
+
+    residuals = values - (x_train @ coef).T
+    dof = max(n_days - x_train.shape[1], 1)
+    residual_std = np.sqrt((residuals * residuals).sum(axis=1) / dof)
+
+    forecast = (design(np.arange(n_days, n_days + steps)) @ coef).T
+    return forecast, residual_std
+
+
+def fast_forecast(
+    values: np.ndarray,
+    steps: int,
+    method: str = "holt_winters",
+    start_date: Optional[date] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    경량 예측 엔진 진입점.
+
+    Args:
+        values: 일별 시계열 (일수,) 또는 (시계열 수, 일수) 배열
+        steps: 예측할 일수
+        method: seasonal_naive, holt_winters, linear_weekday
+        start_date: 첫 관측일 (linear_weekday 요일 계산용)
+
+    Returns:
+        (예측값, 잔차 표준편차) - 입력이 1차원이면 (steps,) 배열과 스칼라로 반환합니다.
+        매출·거래 건수 예측이므로 음수 예측값은 0으로 보정합니다.
+    """
+    data, squeeze = _as_2d(values)
+
+    if method == "seasonal_naive":
+        forecast, residual_std = seasonal_naive_forecast(data, steps)
+    elif method == "linear_weekday":
+        forecast, residual_std = linear_weekday_forecast(data, steps, start_date)
+    elif method == "holt_winters":
+        if data.shape[1] < 2 * SEASON_LENGTH:
+            # 초기화에 2주기가 필요 - 데이터가 짧으면 계절 naive로 대체
+            forecast, residual_std = seasonal_naive_forecast(data, steps)
+        else:
+            forecast, residual_std = holt_winters_forecast(data, steps)
+    else:
+        raise ValueError(f"지원하지 않는 예측 방법입니다: {method}")
+
+    forecast = np.maximum(forecast, 0)
+    if squeeze:
+        return forecast[0], residual_std[0]
+    return forecast, residual_std
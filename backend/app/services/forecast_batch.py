@@ -0,0 +1,303 @@
+## forecast_batch.py
+
+"""
+배치 예측 작업
+
+모든 매장('전체' 포함) × 지표의 예측을 미리 계산해 forecast_results 테이블에 저장합니다.
+- 학습용 일별 시계열은 한 번의 집계 쿼리로 조회
+- 모델 학습은 프로세스 풀에서 병렬 실행 (매장·지표별 모델 캐시로 warm start)
+- /trends/forecast 는 단일 매장 또는 전체 매장 요청을 이 테이블에서 바로 응답
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import delete, insert
+
+from app.core.data_version import data_version_bus
+from app.core.config import settings
+from app.core.database import SessionLocal, engine, ForecastResult, run_query
+from app.core.process_pool import ManagedProcessPool, process_pool
+from app.services.forecast_models import forecast_model_cache
+from app.utils.date_utils import get_date_range, get_recent_periods
+from app.utils.time_series_models import linear_trend_forecast
+
+logger = logging.getLogger(__name__)
+
+
+class ForecastBatchService:
+    """매장·지표별 배치 예측 서비스"""
+
+    METRICS = ["total_sales", "actual_sales", "transactions", "avg_transaction"]
+    ALL_STORES = "전체"
+    MIN_DAYS = 14  # 최소 2주 데이터 필요 (온디맨드 예측과 동일 기준)
+
+    _table_ready = False
+
+    @staticmethod
+    def _ensure_table() -> bool:
+        """forecast_results 테이블 생성 (없는 경우)"""
+        if not ForecastBatchService._table_ready and engine is not None:
+            ForecastResult.__table__.create(bind=engine, checkfirst=True)
+            ForecastBatchService._table_ready = True
+        return ForecastBatchService._table_ready
+
+    @staticmethod
+    async def fetch_daily_series(start_date: date, end_date: date) -> pd.DataFrame:
+        """
+        모든 매장의 일별 지표와 전체 매장 합계를 한 번의 쿼리로 조회합니다.
+
+        전체 매장의 거래 건수는 온디맨드 예측과 같게 날짜별 영수증 번호 고유 개수로 계산합니다.
+        """
+        rows = await run_query(
+            "SELECT date, store_name, "
+            "SUM(total_sales) AS total_sales, "
+            "SUM(actual_sales) AS actual_sales, "
+            "COUNT(DISTINCT receipt_number) AS transactions "
+            "FROM daily_sales_summary "
+            "WHERE date >= :start_date AND date <= :end_date "
+            "GROUP BY date, store_name "
+            "UNION ALL "
+            "SELECT date, :all_stores AS store_name, "
+            "SUM(total_sales), SUM(actual_sales), COUNT(DISTINCT receipt_number) "
+            "FROM daily_sales_summary "
+            "WHERE date >= :start_date AND date <= :end_date "
+            "GROUP BY date",
+            {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "all_stores": ForecastBatchService.ALL_STORES
+            }
+        )
+
+        if not rows:
+            return pd.DataFrame(columns=['date', 'store_name'] + ForecastBatchService.METRICS)
+
+        df = pd.DataFrame(rows)
+        df = df[df['store_name'].notna()]
+        df['date'] = pd.to_datetime(df['date']).dt.date
+        df['avg_transaction'] = df['total_sales'] / df['transactions'].replace(0, np.nan)
+        return df
+
+    @staticmethod
+    def build_series(
+        daily: pd.DataFrame,
+        start_date: date,
+        end_date: date,
+        metrics: List[str]
+    ) -> Dict[Tuple[str, str], np.ndarray]:
+        """매장·지표별 전체 기간 시계열 생성 (누락된 날짜는 0으로 채움)"""
+        dates = get_date_range(start_date, end_date)
+        series = {}
+        for store, group in daily.groupby('store_name'):
+            if group['date'].nunique() < ForecastBatchService.MIN_DAYS:
+                continue
+            frame = group.set_index('date').reindex(dates)[metrics].fillna(0)
+            for metric in metrics:
+                series[(str(store), metric)] = frame[metric].to_numpy(dtype=float)
+        return series
+
+    @staticmethod
+    async def _forecast_series(
+        store: str,
+        metric: str,
+        values: np.ndarray,
+        start_date: date,
+        end_date: date,
+        horizon: int,
+        pool: Optional[ManagedProcessPool]
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """한 시계열을 예측하고 저장할 행 목록을 반환합니다."""
+        try:
+            forecast_values, _ = await forecast_model_cache.forecast(
+                store_name=None if store == ForecastBatchService.ALL_STORES else [store],
+                metric=metric,
+                series_start=start_date,
+                series_end=end_date,
+                values=values,
+                steps=horizon,
+                pool=pool
+            )
+            method = "ARIMA"
+        except Exception as e:
+            logger.warning(f"ARIMA 예측 실패, 선형 회귀로 대체 ({store}/{metric}): {e}")
+            forecast_values = linear_trend_forecast(values, horizon)
+            method = "LinearRegression"
+
+        # 신뢰구간 (표준편차의 2배 범위, 온디맨드 예측과 동일)
+        std_dev = float(np.std(values))
+        rows = []
+        for i, value in enumerate(np.asarray(forecast_values, dtype=float), start=1):
+            rows.append({
+                "store_name": store,
+                "metric": metric,
+                "series_start": start_date.isoformat(),
+                "series_end": end_date.isoformat(),
+                "forecast_date": (end_date + timedelta(days=i)).isoformat(),
+                "value": float(value),
+                "upper_bound": float(value + 2 * std_dev),
+                "lower_bound": float(max(value - 2 * std_dev, 0)),
+                "method": method
+            })
+        return method, rows
+
+    @staticmethod
+    def _write_results(rows: List[Dict[str, Any]], series_end: date, keys: List[Tuple[str, str]]):
+        """같은 기준일의 기존 결과를 교체합니다."""
+        generated_at = datetime.now()
+        for row in rows:
+            row["generated_at"] = generated_at
+
+        db = SessionLocal()
+        try:
+            table = ForecastResult.__table__
+            for store, metric in keys:
+                db.execute(delete(table).where(
+                    table.c.store_name == store,
+                    table.c.metric == metric,
+                    table.c.series_end == series_end.isoformat()
+                ))
+            if rows:
+                db.execute(insert(table), rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    async def run(
+        end_date: Optional[date] = None,
+        history_days: Optional[int] = None,
+        horizon: Optional[int] = None,
+        metrics: Optional[List[str]] = None,
+        pool: Optional[ManagedProcessPool] = None
+    ) -> Dict[str, Any]:
+        """
+        모든 매장·지표의 예측을 계산해 저장합니다. (CLI 및 스케줄러 진입점)
+
+        Args:
+            end_date: 학습 기간 종료일 (기본값: 오늘, /trends/forecast 기본값과 동일)
+            history_days: 학습 기간 일수 (기본값: FORECAST_BATCH_HISTORY_DAYS)
+            horizon: 저장할 예측 일수 (기본값: FORECAST_BATCH_HORIZON)
+            metrics: 예측할 지표 목록 (기본값: 전체 지표)
+            pool: 학습에 사용할 프로세스 풀 (None이면 전역 풀)
+
+        Returns:
+            실행 요약 정보
+        """
+        started = time.perf_counter()
+        end_date = end_date or date.today()
+        history_days = history_days or settings.FORECAST_BATCH_HISTORY_DAYS
+        horizon = horizon or settings.FORECAST_BATCH_HORIZON
+        metrics = metrics or ForecastBatchService.METRICS
+        start_date, _ = get_recent_periods(end_date=end_date, days=history_days)
+
+        ForecastBatchService._ensure_table()
+        daily = await ForecastBatchService.fetch_daily_series(start_date, end_date)
+        series = ForecastBatchService.build_series(daily, start_date, end_date, metrics)
+
+        # 동시에 학습하는 시계열은 워커 수까지 (나머지를 한꺼번에 제출하면 온디맨드 요청이 배치 뒤에서 대기)
+        limit = asyncio.Semaphore(max(1, (pool or process_pool).max_workers))
+
+        async def forecast_limited(store: str, metric: str, values: np.ndarray):
+            async with limit:
+                return await ForecastBatchService._forecast_series(
+                    store, metric, values, start_date, end_date, horizon, pool
+                )
+
+        results = await asyncio.gather(*(
+            forecast_limited(store, metric, values) for (store, metric), values in series.items()
+        ))
+
+        rows = [row for _, series_rows in results for row in series_rows]
+        ForecastBatchService._write_results(rows, end_date, list(series.keys()))
+
+        # 예측 결과 변경 기록 - 이전 예측 응답 캐시와 ETag 무효화 (다른 프로세스 포함)
+        data_version_bus.bump((ForecastResult.__tablename__,), source="forecast_batch")
+
+        methods = [method for method, _ in results]
+        summary = {
+            "series_start": start_date.isoformat(),
+            "series_end": end_date.isoformat(),
+            "horizon": horizon,
+            "series_count": len(series),
+            "stores": sorted({store for store, _ in series}),
+            "arima_count": methods.count("ARIMA"),
+            "fallback_count": methods.count("LinearRegression"),
+            "rows_written": len(rows),
+            "elapsed_seconds": round(time.perf_counter() - started, 2)
+        }
+        logger.info(f"배치 예측 완료: {summary}")
+        return summary
+
+    @staticmethod
+    async def load_forecast(
+        store_name: Optional[List[str]],
+        metric: str,
+        start_date: date,
+        end_date: date,
+        forecast_days: int
+    ) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
+        """
+        저장된 배치 예측을 조회합니다.
+
+        단일 매장 또는 전체 매장 요청만 대상이며, 학습 기간(시작일·기준일)이 같고 예측 일수를
+        모두 포함하는 결과가 없으면 None을 반환합니다. (호출 측에서 온디맨드 예측으로 대체)
+        학습 기간이 다르면 예측값과 신뢰구간이 온디맨드 예측과 달라지므로 사용하지 않습니다.
+
+        Returns:
+            (date, value, upper_bound, lower_bound 컬럼의 예측 데이터프레임, 예측 정보) 또는 None
+        """
+        stores = sorted(set(store_name)) if store_name else [ForecastBatchService.ALL_STORES]
+        if len(stores) != 1:
+            return None
+
+        try:
+            ForecastBatchService._ensure_table()
+            rows = await run_query(
+                "SELECT forecast_date, value, upper_bound, lower_bound, method, series_start, generated_at "
+                "FROM forecast_results "
+                "WHERE store_name = :store_name AND metric = :metric "
+                "AND series_start = :series_start AND series_end = :series_end "
+                "ORDER BY forecast_date "
+                "LIMIT :limit",
+                {
+                    "store_name": stores[0],
+                    "metric": metric,
+                    "series_start": start_date.isoformat(),
+                    "series_end": end_date.isoformat(),
+                    "limit": forecast_days
+                }
+            )
+        except Exception as e:
+            logger.warning(f"배치 예측 조회 실패: {e}")
+            return None
+
+        if len(rows) < forecast_days:
+            return None
+
+        df = pd.DataFrame(rows)
+        forecast_df = pd.DataFrame({
+            'date': pd.to_datetime(df['forecast_date']).dt.date,
+            'value': df['value'].astype(float),
+            'upper_bound': df['upper_bound'].astype(float),
+            'lower_bound': df['lower_bound'].astype(float)
+        })
+        info = {
+            "forecast_method": str(df['method'].iloc[0]),
+            "forecast_source": "batch",
+            "training_start": str(df['series_start'].iloc[0]),
+            "generated_at": str(df['generated_at'].iloc[0])
+        }
+        return forecast_df, info
+
+
+# 서비스 인스턴스
+forecast_batch_service = ForecastBatchService()
@@ -0,0 +1,231 @@
+## forecast_models.py
+
+"""
+예측 모델 캐시
+
+매장 집합·지표별로 학습된 ARIMA 파라미터를 보관하고 재사용합니다.
+- 같은 시계열로 예측 기간만 바뀌면 저장된 파라미터로 필터링만 수행 (재학습 없음)
+- 새 날짜가 추가되거나 기간이 이동하면 이전 파라미터를 초기값으로 재학습 (warm start)
+- 파라미터는 forecast_model_state 테이블에 저장되어 서버 재시작 후에도 재사용
+"""
+
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import hashlib
+import json
+import logging
+import threading
+import time
+
+import numpy as np
+
+from app.core.database import SessionLocal, engine, ForecastModelState
+from app.core.process_pool import ManagedProcessPool, process_pool
+from app.utils.time_series_models import ARIMA_ORDER, fit_and_forecast, forecast_with_params
+
+logger = logging.getLogger(__name__)
+
+
+def series_hash(values: np.ndarray) -> str:
+    """시계열 값의 해시 (캐시된 파라미터가 같은 데이터로 학습되었는지 확인용)"""
+    return hashlib.sha1(np.ascontiguousarray(values, dtype=float).tobytes()).hexdigest()
+
+
+def model_key(store_name: Optional[Sequence[str]], metric: str) -> str:
+    """매장 집합·지표로 모델 키 생성 (매장 순서 무관, None은 전체 매장)"""
+    stores = "|".join(sorted(set(store_name))) if store_name else "전체"
+    return f"{stores}::{metric}"
+
+
+class CachedForecastModel:
+    """학습된 모델 상태"""
+
+    def __init__(
+        self,
+        key: str,
+        order: Tuple[int, int, int],
+        params: np.ndarray,
+        series_start: date,
+        series_end: date,
+        values_hash: str
+    ):
+        self.key = key
+        self.order = order
+        self.params = params
+        self.series_start = series_start
+        self.series_end = series_end
+        self.values_hash = values_hash
+
+    def matches(self, series_start: date, series_end: date, values_hash: str) -> bool:
+        """같은 시계열로 학습된 모델인지 확인"""
+        return (
+            self.series_start == series_start
+            and self.series_end == series_end
+            and self.values_hash == values_hash
+        )
+
+
+class ForecastModelCache:
+    """매장 집합·지표별 ARIMA 모델 캐시 (메모리 LRU + DB 저장)"""
+
+    def __init__(self, max_entries: int = 128, order: Tuple[int, int, int] = ARIMA_ORDER, persist: bool = True):
+        self.max_entries = max_entries
+        self.order = order
+        self.persist = persist and engine is not None
+        self._entries: "OrderedDict[str, CachedForecastModel]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._table_ready = False
+        self.stats = {"hit": 0, "warm_start": 0, "cold_start": 0}
+
+    async def forecast(
+        self,
+        store_name: Optional[List[str]],
+        metric: str,
+        series_start: date,
+        series_end: date,
+        values: np.ndarray,
+        steps: int,
+        pool: Optional[ManagedProcessPool] = None
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        캐시된 모델을 활용해 예측합니다. 학습·필터링은 프로세스 풀에서 실행됩니다.
+
+        Args:
+            store_name: 매장 필터 (None이면 전체 매장)
+            metric: 예측 지표
+            series_start: 시계열 시작일
+            series_end: 시계열 종료일
+            values: 일별 시계열 값
+            steps: 예측할 일수
+            pool: 학습에 사용할 프로세스 풀 (None이면 전역 풀)
+
+        Returns:
+            (예측값 배열, 모델 정보)
+        """
+        pool = pool or process_pool
+        key = model_key(store_name, metric)
+        values = np.asarray(values, dtype=float)
+        values_hash = series_hash(values)
+        started = time.perf_counter()
+
+        cached = self._get(key)
+        if cached is not None and cached.matches(series_start, series_end, values_hash):
+            # 같은 데이터 → 예측 기간만 달라진 경우, 재학습 없이 필터링만 수행
+            forecast_values = await pool.run(forecast_with_params, values, cached.params, steps, self.order)
+            status = "hit"
+        else:
+            start_params = cached.params if cached is not None else None
+            params, forecast_values, warm = await pool.run(
+                fit_and_forecast, values, steps, self.order, start_params
+            )
+            status = "warm_start" if warm else "cold_start"
+            self._put(CachedForecastModel(key, self.order, params, series_start, series_end, values_hash))
+
+        self.stats[status] += 1
+        info = {
+            "model_cache": status,
+            "model_order": list(self.order),
+            "model_seconds": round(time.perf_counter() - started, 4)
+        }
+        return forecast_values, info
+
+    def invalidate(self, store_name: Optional[List[str]] = None, metric: Optional[str] = None):
+        """메모리 캐시 무효화 (인자가 없으면 전체)"""
+        with self._lock:
+            if store_name is None and metric is None:
+                self._entries.clear()
+                return
+            prefix = model_key(store_name, "") if store_name is not None else None
+            for key in list(self._entries):
+                if prefix is not None and not key.startswith(prefix):
+                    continue
+                if metric is not None and not key.endswith(f"::{metric}"):
+                    continue
+                del self._entries[key]
+
+    def _get(self, key: str) -> Optional[CachedForecastModel]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+
+        # 메모리에 없으면 저장된 파라미터 조회 (서버 재시작 후 재사용)
+        cached = self._load(key)
+        if cached is not None:
+            with self._lock:
+                self._remember(cached)
+        return cached
+
+    def _put(self, cached: CachedForecastModel):
+        with self._lock:
+            self._remember(cached)
+        self._save(cached)
+
+    def _remember(self, cached: CachedForecastModel):
+        self._entries[cached.key] = cached
+        self._entries.move_to_end(cached.key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _ensure_table(self) -> bool:
+        if not self.persist:
+            return False
+        if not self._table_ready:
+            try:
+                ForecastModelState.__table__.create(bind=engine, checkfirst=True)
+                self._table_ready = True
+            except Exception as e:
+                logger.warning(f"예측 모델 상태 테이블 생성 실패, 메모리 캐시만 사용: {e}")
+                self.persist = False
+        return self._table_ready
+
+    def _load(self, key: str) -> Optional[CachedForecastModel]:
+        if not self._ensure_table():
+            return None
+        db = SessionLocal()
+        try:
+            row = db.get(ForecastModelState, key)
+            if row is None or row.model_order != ",".join(map(str, self.order)):
+                return None
+            return CachedForecastModel(
+                key=key,
+                order=self.order,
+                params=np.asarray(json.loads(row.params), dtype=float),
+                series_start=date.fromisoformat(row.series_start),
+                series_end=date.fromisoformat(row.series_end),
+                values_hash=row.series_hash
+            )
+        except Exception as e:
+            logger.warning(f"예측 모델 상태 조회 실패 ({key}): {e}")
+            return None
+        finally:
+            db.close()
+
+    def _save(self, cached: CachedForecastModel):
+        if not self._ensure_table():
+            return
+        db = SessionLocal()
+        try:
+            metric = cached.key.rsplit("::", 1)[-1]
+            db.merge(ForecastModelState(
+                model_key=cached.key,
+                metric=metric,
+                model_order=",".join(map(str, cached.order)),
+                params=json.dumps([float(p) for p in cached.params]),
+                series_start=cached.series_start.isoformat(),
+                series_end=cached.series_end.isoformat(),
+                series_hash=cached.values_hash,
+                updated_at=datetime.now()
+            ))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"예측 모델 상태 저장 실패 ({cached.key}): {e}")
+        finally:
+            db.close()
+
+
+# 전역 모델 캐시
+forecast_model_cache = ForecastModelCache()
@@ -6,7 +6,12 @@ import pandas as pd
 import numpy as np
 
 from app.core.database import get_table, Tables
+from app.core.cache import cached
+from app.core.executors import io_thread_pool, offload
+from app.core.responses import get_type_adapter
+from app.services.daily_aggregates import DailyPartial, daily_aggregate_cache
 from app.utils.date_utils import get_date_range
+from app.utils.data_processing import basic_stats_array
 from app.models.kpi import (
     KPISummary,
     KPITrend,
@@ -20,6 +25,8 @@ class KPIService:
     """KPI 계산 서비스"""
     
     @staticmethod
+    @cached("kpi.get_kpi_summary", tables=(Tables.DAILY_SALES_SUMMARY,))
+    @offload(io_thread_pool)
     async def get_kpi_summary(
         start_date: date,
         end_date: date,
@@ -36,39 +43,48 @@ class KPIService:
         Returns:
             KPI 요약 객체
         """
-        # 요약 테이블을 통한 매출 데이터 조회
-        query = get_table(Tables.DAILY_SALES_SUMMARY)\
-                .select("*")\
-                .gte("date", start_date.isoformat())\
-                .lte("date", end_date.isoformat())
-        
-        # 매장 필터 추가
-        if store_name:
-            query = query.in_("store_name", store_name)
-            
-        response = query.execute()
-        summary_data = response.data
+        # 매장별 기간 집계 (일자별 부분 집계 캐시 병합)
+        store_totals = await daily_aggregate_cache.summarize(start_date, end_date, store_name)
+        return KPIService.build_kpi_summary(store_totals, start_date, end_date, store_name)
+    
+    @staticmethod
+    def build_kpi_summary(
+        store_totals: Dict[str, DailyPartial],
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]] = None
+    ) -> KPISummary:
+        """
+        매장별 기간 집계로 KPI 요약을 만듭니다. (개별 조회와 대시보드 묶음 조회가 공유)
         
+        Args:
+            store_totals: {매장: 기간 병합 부분 집계} (매장 필터 적용 완료)
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            store_name: 매장 이름 필터 (단일 매장이면 해당 매장명 표시)
+        """
         # 기본값 초기화
         summary = KPISummary()
         
-        if not summary_data:
+        if not store_totals:
             return summary
-            
-        df = pd.DataFrame(summary_data)
+        
+        totals = DailyPartial()
+        for partial in store_totals.values():
+            totals.merge(partial)
         
         # 날짜 수 계산
         date_range = get_date_range(start_date, end_date)
         days_count = len(date_range)
         
         # 총 매출 계산
-        total_sales = df['total_sales'].sum()
+        total_sales = totals.total_sales
         
         # 할인 금액 및 비율 계산
-        total_discount = df['total_discount'].sum() if 'total_discount' in df.columns else 0
+        total_discount = totals.total_discount
         
         # 거래 건수 (유니크 영수증 번호 기준)
-        total_transactions = df['receipt_number'].nunique()
+        total_transactions = totals.transaction_count
         
         # 실 고객 수 추정 (영수증 번호 기준, 더 정확한 측정법이 있다면 대체 가능)
         total_customers = total_transactions
@@ -102,6 +118,8 @@ class KPIService:
         return summary
     
     @staticmethod
+    @cached("kpi.get_kpi_trends", tables=(Tables.DAILY_SALES_SUMMARY,))
+    @offload(io_thread_pool)
     async def get_kpi_trends(
         start_date: date,
         end_date: date,
@@ -236,7 +254,10 @@ class KPIService:
             # 트렌드 포인트 생성
             for day_str, value in sorted(result_dict.items()):
                 day = datetime.strptime(day_str, "%Y-%m-%d").date()
-                trend_points.append(KPITrendPoint(date=day, store_name=store, value=value))
+                trend_points.append({"date": day, "store_name": store, "value": value})
+        
+        # 행 단위 생성 대신 목록 전체를 한 번에 검증
+        trend_points = get_type_adapter(List[KPITrendPoint]).validate_python(trend_points)
         
         # 단일 매장 필터링
         if store_name and len(store_name) == 1:
@@ -262,13 +283,14 @@ class KPIService:
         if not trend_points:
             return {"trend": "unknown"}
             
-        values = [point.value for point in trend_points]
+        values = np.fromiter((point.value for point in trend_points), dtype=float, count=len(trend_points))
         
-        # 기본 통계
-        mean_value = np.mean(values)
-        std_value = np.std(values)
-        min_value = np.min(values)
-        max_value = np.max(values)
+        # 기본 통계 (모집단 표준편차)
+        stats = basic_stats_array(values, ddof=0)
+        mean_value = stats["mean"]
+        std_value = stats["std"]
+        min_value = stats["min"]
+        max_value = stats["max"]
         
         # 성장률 계산
         first_value = values[0] if values[0] != 0 else 0.01  # 0으로 나누기 방지
@@ -276,12 +298,12 @@ class KPIService:
         growth_rate = ((last_value - first_value) / first_value) * 100 if first_value != 0 else 0
         
         # 선형 추세 계산 (기울기)
-        days = list(range(len(values)))
+        days = np.arange(len(values))
         if len(days) > 1:
             # 선형 회귀 계수 계산
             slope, intercept = np.polyfit(days, values, 1)
         else:
-            slope, intercept = 0, values[0] if values else 0
+            slope, intercept = 0, values[0] if len(values) else 0
         
         # 추세 유형 결정
         if abs(slope) < mean_value * 0.01:
@@ -308,6 +330,8 @@ class KPIService:
         }
     
     @staticmethod
+    @cached("kpi.get_product_kpi", tables=(Tables.RECEIPT_SALES_DETAIL,))
+    @offload(io_thread_pool)
     async def get_product_kpi(
         start_date: date,
         end_date: date,
@@ -434,6 +458,8 @@ class KPIService:
         return result
         
     @staticmethod
+    @cached("kpi.get_category_kpi", tables=(Tables.RECEIPT_SALES_DETAIL,))
+    @offload(io_thread_pool)
     async def get_category_kpi(
         start_date: date,
         end_date: date,
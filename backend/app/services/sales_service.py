@@ -1,12 +1,21 @@
 ## sales_service.py
 
-from datetime import date, datetime
-from typing import List, Dict, Any, Optional
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple
+import asyncio
+import logging
+import numpy as np
 import pandas as pd
 
+from app.core import log_policy
 from app.core.database import get_table, Tables
-from app.utils.date_utils import get_date_range
+from app.core.cache import cached
+from app.core.executors import io_thread_pool, offload
+from app.core.responses import get_type_adapter
+from app.services.daily_aggregates import DailyPartial, daily_aggregate_cache
+from app.utils.date_utils import get_date_range, shift_years
 from app.models.sales import (
+    ComparePeriod,
     DailySalesResponse, 
     HourlySalesResponse,
     ProductSalesResponse,
@@ -14,11 +23,18 @@ from app.models.sales import (
     HourlyProductSalesResponse
 )
 
+logger = logging.getLogger(__name__)
+
+# 기간 비교 합계 항목 (일별 매출 필드)
+PERIOD_TOTAL_FIELDS = ("total_sales", "actual_sales", "total_discount", "transaction_count")
+
 # 매출 데이터 서비스
 class SalesService:
     """매출 데이터 처리 서비스"""
     
     @staticmethod
+    @cached("sales.get_daily_sales", tables=(Tables.DAILY_SALES_SUMMARY,))
+    @offload(io_thread_pool)
     async def get_daily_sales(
         start_date: date,
         end_date: date,
@@ -35,210 +51,14 @@ class SalesService:
         Returns:
             일별 매출 데이터 리스트
         """
-        import logging
-        from datetime import timedelta
-        logger = logging.getLogger("sales_service")
-        logger.setLevel(logging.INFO)
-        
-        # 현재 로깅 레벨 가져오기
-        logging_level = logger.getEffectiveLevel()
-        
         # 로깅 - 요청 파라미터
-        logger.info(f"일별 매출 조회 요청: start_date={start_date}, end_date={end_date}, store_name={store_name}")
+        logger.debug("일별 매출 조회 요청: start_date=%s, end_date=%s, store_name=%s", start_date, end_date, store_name)
         
         try:
-            # 4일 단위로 데이터를 조회
-            chunk_size = 1  # 4일 단위로 데이터 조회
-            all_data = {}   # 날짜별 데이터를 저장할 딕셔너리
-            
-            # 시작일부터 종료일까지 4일 단위로 처리
-            current_date = start_date
-            while current_date <= end_date:
-                # 현재 청크의 종료일 계산 (4일 후 또는 end_date 중 작은 값)
-                chunk_end = min(current_date + timedelta(days=chunk_size-1), end_date)
-                logger.info(f"청크 조회: {current_date} ~ {chunk_end}")
-                
-                # 현재 청크의 날짜 범위
-                date_range = get_date_range(current_date, chunk_end)
-                
-                try:
-                    # 청크 단위로 데이터 조회
-                    date_start_str = current_date.isoformat()
-                    date_end_str = chunk_end.isoformat()
-                    
-                    query = get_table(Tables.DAILY_SALES_SUMMARY)\
-                           .select("*")\
-                           .gte("date", date_start_str)\
-                           .lte("date", date_end_str)
-                    
-                    # 매장 필터 추가
-                    if store_name:
-                        query = query.in_("store_name", store_name)
-                    
-                    # 데이터 조회
-                    response = query.execute()
-                    chunk_data = response.data
-                    logger.info(f"청크 데이터 개수: {len(chunk_data)}")
-                    
-                    # 날짜별로 데이터 정리
-                    if chunk_data:
-                        # 날짜별로 그룹화
-                        for record in chunk_data:
-                            record_date = record.get('date')
-                            if record_date:
-                                # 날짜 문자열을 date 객체로 변환
-                                if isinstance(record_date, str):
-                                    record_date = pd.to_datetime(record_date).date()
-                                
-                                # 해당 날짜의 데이터 목록에 추가
-                                if record_date not in all_data:
-                                    all_data[record_date] = []
-                                all_data[record_date].append(record)
-                
-                except Exception as e:
-                    logger.error(f"청크 데이터 조회 중 오류 발생: {str(e)}")
-                    logger.exception(e)
-                    # 오류 발생 시 해당 구간은 건너뛰고 계속 진행
-                
-                # 다음 청크의 시작일 설정
-                current_date = chunk_end + timedelta(days=1)
-            
-            # 모든 날짜 범위를 생성
-            all_dates = get_date_range(start_date, end_date)
-            result = []
-            
-            # 고유한 매장 목록 추출 (필터링 선택 또는 모든 데이터에서)
-            unique_stores = set()
-            for date_data in all_data.values():
-                for record in date_data:
-                    if 'store_name' in record and record['store_name']:
-                        unique_stores.add(record['store_name'])
-            
-            logger.info(f"발견된 매장 목록: {unique_stores}")
-            
-            # 매장별, 날짜별로 데이터 집계
-            if store_name and len(store_name) == 1:
-                # 단일 매장 선택 시 해당 매장 데이터만 처리
-                selected_store = store_name[0]
-                logger.info(f"단일 매장 선택: {selected_store}")
-                
-                for single_date in all_dates:
-                    date_data = all_data.get(single_date, [])
-                    
-                    # 해당 날짜의 선택 매장 데이터 필터링
-                    store_date_data = [item for item in date_data if item.get('store_name') == selected_store]
-                    
-                    if store_date_data:
-                        # 선택 매장 데이터가 있는 경우
-                        total_sales = sum([item.get('total_sales', 0) or 0 for item in store_date_data])
-                        actual_sales = sum([item.get('actual_sales', 0) or 0 for item in store_date_data])
-                        total_discount = sum([item.get('total_discount', 0) or 0 for item in store_date_data])
-                        transaction_count = len(store_date_data)
-                        
-                        # 평균 거래 금액 계산
-                        avg_transaction_value = actual_sales / transaction_count if transaction_count > 0 else 0
-                        
-                        # 결과 추가
-                        result.append(DailySalesResponse(
-                            date=single_date,
-                            store_name=selected_store,
-                            total_sales=int(total_sales),
-                            actual_sales=int(actual_sales),
-                            total_discount=int(total_discount),
-                            transaction_count=int(transaction_count),
-                            avg_transaction_value=float(avg_transaction_value)
-                        ))
-                    else:
-                        # 해당 날짜에 선택 매장 데이터가 없는 경우 0으로 채움
-                        result.append(DailySalesResponse(
-                            date=single_date,
-                            store_name=selected_store,
-                            total_sales=0,
-                            actual_sales=0,
-                            total_discount=0,
-                            transaction_count=0,
-                            avg_transaction_value=0
-                        ))
-            else:
-                # 여러 매장 선택 또는 모든 매장 - 개별 매장별로 데이터 처리
-                for store in unique_stores:
-                    for single_date in all_dates:
-                        date_data = all_data.get(single_date, [])
-                        
-                        # 해당 날짜의 현재 매장 데이터 필터링
-                        store_date_data = [item for item in date_data if item.get('store_name') == store]
-                        
-                        if store_date_data:
-                            # 현재 매장 데이터가 있는 경우
-                            total_sales = sum([item.get('total_sales', 0) or 0 for item in store_date_data])
-                            actual_sales = sum([item.get('actual_sales', 0) or 0 for item in store_date_data])
-                            total_discount = sum([item.get('total_discount', 0) or 0 for item in store_date_data])
-                            transaction_count = len(store_date_data)
-                            
-                            # 평균 거래 금액 계산
-                            avg_transaction_value = actual_sales / transaction_count if transaction_count > 0 else 0
-                            
-                            # 결과 추가
-                            result.append(DailySalesResponse(
-                                date=single_date,
-                                store_name=store,
-                                total_sales=int(total_sales),
-                                actual_sales=int(actual_sales),
-                                total_discount=int(total_discount),
-                                transaction_count=int(transaction_count),
-                                avg_transaction_value=float(avg_transaction_value)
-                            ))
-                        else:
-                            # 해당 날짜에 현재 매장 데이터가 없는 경우 0으로 채움
-                            result.append(DailySalesResponse(
-                                date=single_date,
-                                store_name=store,
-                                total_sales=0,
-                                actual_sales=0,
-                                total_discount=0,
-                                transaction_count=0,
-                                avg_transaction_value=0
-                            ))
-                
-                # 전체 합계 데이터 추가
-                for single_date in all_dates:
-                    date_data = all_data.get(single_date, [])
-                    
-                    if date_data:
-                        # 모든 매장 데이터를 합산
-                        total_sales = sum([item.get('total_sales', 0) or 0 for item in date_data])
-                        actual_sales = sum([item.get('actual_sales', 0) or 0 for item in date_data])
-                        total_discount = sum([item.get('total_discount', 0) or 0 for item in date_data])
-                        transaction_count = len(date_data)
-                        
-                        # 평균 거래 금액 계산
-                        avg_transaction_value = actual_sales / transaction_count if transaction_count > 0 else 0
-                        
-                        # 전체 합계 결과 추가
-                        result.append(DailySalesResponse(
-                            date=single_date,
-                            store_name="전체",
-                            total_sales=int(total_sales),
-                            actual_sales=int(actual_sales),
-                            total_discount=int(total_discount),
-                            transaction_count=int(transaction_count),
-                            avg_transaction_value=float(avg_transaction_value)
-                        ))
-                    else:
-                        # 해당 날짜에 데이터가 없는 경우 0으로 채움
-                        result.append(DailySalesResponse(
-                            date=single_date,
-                            store_name="전체",
-                            total_sales=0,
-                            actual_sales=0,
-                            total_discount=0,
-                            transaction_count=0,
-                            avg_transaction_value=0
-                        ))
-            
-            # 날짜순, 매장명순 정렬
-            result.sort(key=lambda x: (x.date, x.store_name))
-            logger.info(f"최종 반환 데이터 개수: {len(result)}")
+            # 매장·일자별 부분 집계 (캐시된 일자는 재사용, 누락된 일자만 조회)
+            daily_partials = await daily_aggregate_cache.get_days(start_date, end_date)
+            result = SalesService.build_daily_sales(daily_partials, store_name)
+            logger.debug("최종 반환 데이터 개수: %d", len(result))
             return result
             
         except Exception as e:
@@ -276,6 +96,8 @@ class SalesService:
                 ]
 
     @staticmethod
+    @cached("sales.get_hourly_sales", tables=(Tables.RECEIPT_SALES_DETAIL,))
+    @offload(io_thread_pool)
     async def get_hourly_sales(
         start_date: date,
         end_date: date,
@@ -292,16 +114,8 @@ class SalesService:
         Returns:
             시간대별 매출 데이터 리스트
         """
-        import logging
-        from datetime import timedelta
-        logger = logging.getLogger("sales_service")
-        logger.setLevel(logging.INFO)
-        
-        # 현재 로깅 레벨 가져오기
-        logging_level = logger.getEffectiveLevel()
-        
         # 로깅 - 요청 파라미터
-        logger.info(f"시간대별 매출 조회 요청: start_date={start_date}, end_date={end_date}, store_name={store_name}")
+        logger.debug("시간대별 매출 조회 요청: start_date=%s, end_date=%s, store_name=%s", start_date, end_date, store_name)
         
         # 페이지네이션 구현 - 7일 단위로 데이터 조회
         all_data = []
@@ -311,7 +125,6 @@ class SalesService:
         while current_start <= end_date:
             # 현재 청크의 종료일 계산
             current_end = min(current_start + timedelta(days=page_size-1), end_date)
-            logger.info(f"청크 조회: {current_start} ~ {current_end}")
             
             # 상세 영수증 데이터에서 결제 시간 정보 조회
             query = get_table(Tables.RECEIPT_SALES_DETAIL)\
@@ -323,15 +136,11 @@ class SalesService:
             if store_name:
                 query = query.in_("store_name", store_name)
             
-            # SQL 쿼리 로깅 (디버깅용)
-            if logging_level == logging.DEBUG:
-                logger.debug(f"Supabase 쿼리: {query}")
-            
             # 데이터 조회
             try:
                 response = query.execute()
                 chunk_data = response.data
-                logger.info(f"청크 데이터 개수: {len(chunk_data)}")
+                log_policy.count("chunks")
                 
                 # 데이터가 있으면 결과에 추가
                 if chunk_data:
@@ -345,32 +154,10 @@ class SalesService:
             # 다음 청크의 시작일 설정
             current_start = current_end + timedelta(days=1)
             
-        logger.info(f"전체 조회된 데이터 개수: {len(all_data)}")
+        logger.debug("전체 조회된 데이터 개수: %d", len(all_data))
         
         if not all_data:
-            # 데이터가 없는 경우 24시간 모든 시간대 0값으로 반환
-            # 특정 매장만 선택된 경우 해당 매장만 반환
-            if store_name and len(store_name) == 1:
-                return [
-                    HourlySalesResponse(
-                        hour=h,
-                        store_name=store_name[0],
-                        total_sales=0,
-                        transaction_count=0,
-                        avg_transaction_value=0
-                    ) for h in range(24)
-                ]
-            else:
-                # 모든 매장 또는 여러 매장 요청 시 기본값으로 '전체' 반환
-                return [
-                    HourlySalesResponse(
-                        hour=h,
-                        store_name="전체",
-                        total_sales=0,
-                        transaction_count=0,
-                        avg_transaction_value=0
-                    ) for h in range(24)
-                ]
+            return SalesService.empty_hourly_sales(store_name)
         
         df = pd.DataFrame(all_data)
         
@@ -398,64 +185,11 @@ class SalesService:
             # 매장명 컬럼 추가
             hourly_sales['store_name'] = '전체'
         
-        # 평균 거래 금액 계산
-        hourly_sales['avg_transaction_value'] = hourly_sales.apply(
-            lambda row: row['total_sales'] / row['receipt_number'] if row['receipt_number'] > 0 else 0,
-            axis=1
-        )
-        
-        # 결과 변환
-        result = []
-        for _, row in hourly_sales.iterrows():
-            result.append(HourlySalesResponse(
-                hour=int(row['hour']),
-                store_name=row['store_name'] if 'store_name' in row else '전체',
-                total_sales=int(row['total_sales']),
-                transaction_count=int(row['receipt_number']),
-                avg_transaction_value=float(row['avg_transaction_value'])
-            ))
-        
-        # 누락된 시간대 채우기
-        # 모든 매장과 시간대 조합 만들기
-        complete_result = []
-        
-        # 사용 가능한 매장 목록 추출
-        stores = set()
-        for item in result:
-            stores.add(item.store_name)
-            
-        logger.info(f"시간대별 매출 데이터 - 매장 목록: {stores}")
-        
-        # 각 매장별로 모든 시간대 채우기
-        for store in stores:
-            # 해당 매장의 시간대 데이터 추출
-            store_items = {item.hour: item for item in result if item.store_name == store}
-            
-            # 모든 시간대 확인 및 누락 채우기
-            for h in range(24):
-                if h in store_items:
-                    complete_result.append(store_items[h])
-                else:
-                    # 누락된 시간대는 0값으로 채움
-                    complete_result.append(HourlySalesResponse(
-                        hour=h,
-                        store_name=store,
-                        total_sales=0,
-                        transaction_count=0,
-                        avg_transaction_value=0
-                    ))
-        
-        # 시간대순, 매장명순 정렬
-        complete_result.sort(key=lambda x: (x.hour, x.store_name))
-        
-        # 특정 매장만 필터링 (요청 시)
-        if store_name and len(store_name) == 1:
-            selected_store = store_name[0]
-            complete_result = [item for item in complete_result if item.store_name == selected_store]
-            
-        return complete_result
+        return SalesService.build_hourly_sales(hourly_sales, store_name)
 
     @staticmethod
+    @cached("sales.get_product_sales", tables=(Tables.RECEIPT_SALES_DETAIL,))
+    @offload(io_thread_pool)
     async def get_product_sales(
         start_date: date,
         end_date: date,
@@ -474,16 +208,8 @@ class SalesService:
         Returns:
             제품별 매출 데이터 리스트
         """
-        import logging
-        from datetime import timedelta
-        logger = logging.getLogger("sales_service")
-        logger.setLevel(logging.INFO)
-        
-        # 현재 로깅 레벨 가져오기
-        logging_level = logger.getEffectiveLevel()
-        
         # 로깅 - 요청 파라미터
-        logger.info(f"제품별 매출 조회 요청: start_date={start_date}, end_date={end_date}, store_name={store_name}, limit={limit}")
+        logger.debug("제품별 매출 조회 요청: start_date=%s, end_date=%s, store_name=%s, limit=%s", start_date, end_date, store_name, limit)
         
         # 페이지네이션 구현 - 7일 단위로 데이터 조회
         all_data = []
@@ -493,7 +219,6 @@ class SalesService:
         while current_start <= end_date:
             # 현재 청크의 종료일 계산
             current_end = min(current_start + timedelta(days=page_size-1), end_date)
-            logger.info(f"청크 조회: {current_start} ~ {current_end}")
             
             # 상세 영수증 데이터에서 제품별 매출 정보 조회
             query = get_table(Tables.RECEIPT_SALES_DETAIL)\
@@ -505,15 +230,11 @@ class SalesService:
             if store_name:
                 query = query.in_("store_name", store_name)
             
-            # SQL 쿼리 로깅 (디버깅용)
-            if logging_level == logging.DEBUG:
-                logger.debug(f"Supabase 쿼리: {query}")
-            
             # 데이터 조회
             try:
                 response = query.execute()
                 chunk_data = response.data
-                logger.info(f"청크 데이터 개수: {len(chunk_data)}")
+                log_policy.count("chunks")
                 
                 # 데이터가 있으면 결과에 추가
                 if chunk_data:
@@ -527,7 +248,7 @@ class SalesService:
             # 다음 청크의 시작일 설정
             current_start = current_end + timedelta(days=1)
             
-        logger.info(f"전체 조회된 데이터 개수: {len(all_data)}")
+        logger.debug("전체 조회된 데이터 개수: %d", len(all_data))
         
         if not all_data:
             return []
@@ -541,80 +262,11 @@ class SalesService:
         df['actual_sales'] = df['actual_sales'].fillna(0)
         df['store_name'] = df['store_name'].fillna('전체')
         
-        # 매장별 및 제품별 집계 여부 결정
-        if store_name and len(store_name) == 1:
-            # 단일 매장 선택 시 해당 매장 데이터만 처리
-            selected_store = store_name[0]
-            df = df[df['store_name'] == selected_store]
-            
-            # 제품별 집계
-            product_sales = df.groupby(['product_name', 'product_code']).agg({
-                'quantity': 'sum',
-                'total_sales': 'sum',
-                'discount_amount': 'sum',
-                'actual_sales': 'sum'
-            }).reset_index()
-            
-            # 매장명 컬럼 추가
-            product_sales['store_name'] = selected_store
-        else:
-            # 매장별, 제품별로 집계
-            product_sales = df.groupby(['product_name', 'product_code', 'store_name']).agg({
-                'quantity': 'sum',
-                'total_sales': 'sum',
-                'discount_amount': 'sum',
-                'actual_sales': 'sum'
-            }).reset_index()
-        
-        # 총 매출 계산 (비율 계산용)
-        total_sales = df['total_sales'].sum()
-        
-        # 매출 비율 계산
-        product_sales['sales_percentage'] = product_sales.apply(
-            lambda row: row['total_sales'] / total_sales * 100 if total_sales > 0 else 0,
-            axis=1
-        )
-        
-        # 매출액 기준 내림차순 정렬 후 상위 n개 추출
-        product_sales = product_sales.sort_values('total_sales', ascending=False)
-        
-        # 매장별로 각각 limit 적용 또는 전체 중 상위 limit 개 선택
-        if store_name and len(store_name) == 1:
-            # 단일 매장은 상위 limit개 선택
-            product_sales = product_sales.head(limit)
-        else:
-            # 각 매장별로 top 제품 선택 또는 전체 중에서 상위 limit개
-            if 'store_name' in product_sales.columns and len(product_sales['store_name'].unique()) > 1:
-                # 각 매장별로 가장 많이 팔린 제품 선택
-                top_products_by_store = []
-                for store, group in product_sales.groupby('store_name'):
-                    top_products_by_store.append(group.head(min(limit // 2, len(group))))
-                product_sales = pd.concat(top_products_by_store)
-                
-                # 전체 상위 제품 몇 개 더 추가
-                all_top_products = product_sales.sort_values('total_sales', ascending=False).head(limit)
-                product_sales = pd.concat([product_sales, all_top_products]).drop_duplicates()
-            else:
-                # 단일 매장 또는 매장 구분 없는 경우
-                product_sales = product_sales.head(limit)
-        
-        # 결과 변환
-        result = []
-        for _, row in product_sales.iterrows():
-            result.append(ProductSalesResponse(
-                product_name=str(row['product_name']),
-                product_code=str(row['product_code']) if pd.notna(row['product_code']) else None,
-                store_name=row['store_name'] if 'store_name' in row else '전체',
-                quantity=int(row['quantity']),
-                total_sales=int(row['total_sales']),
-                total_discount=int(row['discount_amount']),
-                actual_sales=int(row['actual_sales']),
-                sales_percentage=float(row['sales_percentage'])
-            ))
-                
-        return result
+        return SalesService.build_product_sales(df, store_name, limit)
 
     @staticmethod
+    @cached("sales.get_payment_type_sales", tables=(Tables.DAILY_SALES_SUMMARY,))
+    @offload(io_thread_pool)
     async def get_payment_type_sales(
         start_date: date,
         end_date: date,
@@ -631,16 +283,8 @@ class SalesService:
         Returns:
             결제 유형별 매출 데이터 리스트
         """
-        import logging
-        from datetime import timedelta
-        logger = logging.getLogger("sales_service")
-        logger.setLevel(logging.INFO)
-        
-        # 현재 로깅 레벨 가져오기
-        logging_level = logger.getEffectiveLevel()
-        
         # 로깅 - 요청 파라미터
-        logger.info(f"결제 유형별 매출 조회 요청: start_date={start_date}, end_date={end_date}, store_name={store_name}")
+        logger.debug("결제 유형별 매출 조회 요청: start_date=%s, end_date=%s, store_name=%s", start_date, end_date, store_name)
         
         # 페이지네이션 구현 - 7일 단위로 데이터 조회
         all_data = []
@@ -650,7 +294,6 @@ class SalesService:
         while current_start <= end_date:
             # 현재 청크의 종료일 계산
             current_end = min(current_start + timedelta(days=page_size-1), end_date)
-            logger.info(f"청크 조회: {current_start} ~ {current_end}")
             
             # 일별 매출 요약 데이터에서 결제 유형별 정보 조회
             query = get_table(Tables.DAILY_SALES_SUMMARY)\
@@ -662,15 +305,11 @@ class SalesService:
             if store_name:
                 query = query.in_("store_name", store_name)
             
-            # SQL 쿼리 로깅 (디버깅용)
-            if logging_level == logging.DEBUG:
-                logger.debug(f"Supabase 쿼리: {query}")
-            
             # 데이터 조회
             try:
                 response = query.execute()
                 chunk_data = response.data
-                logger.info(f"청크 데이터 개수: {len(chunk_data)}")
+                log_policy.count("chunks")
                 
                 # 데이터가 있으면 결과에 추가
                 if chunk_data:
@@ -684,7 +323,7 @@ class SalesService:
             # 다음 청크의 시작일 설정
             current_start = current_end + timedelta(days=1)
             
-        logger.info(f"전체 조회된 데이터 개수: {len(all_data)}")
+        logger.debug("전체 조회된 데이터 개수: %d", len(all_data))
         
         if not all_data:
             return []
@@ -701,28 +340,11 @@ class SalesService:
             'receipt_number': 'count'
         }).reset_index()
         
-        # 총 매출 계산 (비율 계산용)
-        total_sales = payment_sales['total_sales'].sum()
-        
-        # 매출 비율 계산
-        payment_sales['percentage'] = payment_sales['total_sales'] / total_sales * 100 if total_sales > 0 else 0
-        
-        # 매출액 기준 내림차순 정렬
-        payment_sales = payment_sales.sort_values('total_sales', ascending=False)
-        
-        # 결과 변환
-        result = []
-        for _, row in payment_sales.iterrows():
-            result.append(PaymentTypeSalesResponse(
-                payment_type=str(row['payment_type']),
-                transaction_count=int(row['receipt_number']),
-                total_sales=int(row['total_sales']),
-                percentage=float(row['percentage'])
-            ))
-                
-        return result
+        return SalesService.build_payment_type_sales(payment_sales)
 
     @staticmethod
+    @cached("sales.get_hourly_product_sales", tables=(Tables.RECEIPT_SALES_DETAIL,))
+    @offload(io_thread_pool)
     async def get_hourly_product_sales(
         start_date: date,
         end_date: date,
@@ -734,11 +356,6 @@ class SalesService:
         Returns:
             시간대별 제품별 판매 수량 리스트
         """
-        import logging
-        from datetime import timedelta
-        logger = logging.getLogger("sales_service")
-        logger.setLevel(logging.INFO)
-
         # 페이지네이션 구현 - 7일 단위로 데이터 조회
         all_data = []
         current_start = start_date
@@ -773,14 +390,384 @@ class SalesService:
             'quantity': 'sum'
         }).reset_index()
 
+        # 결과 변환 (행 단위 생성 대신 목록 전체를 한 번에 검증)
+        records = grouped.astype({
+            'hour': 'int64',
+            'product_name': 'str',
+            'quantity': 'int64'
+        }).to_dict('records')
+        return get_type_adapter(List[HourlyProductSalesResponse]).validate_python(records)
+
+    @staticmethod
+    def get_comparison_range(start_date: date, end_date: date, compare_with: ComparePeriod) -> Tuple[date, date]:
+        """
+        비교 기간 계산
+
+        Args:
+            compare_with: 비교 기준 (이전 기간, 전년 동기, 2년 전 동기)
+
+        Returns:
+            (비교 시작일, 비교 종료일) 튜플
+        """
+        if compare_with == ComparePeriod.PREVIOUS_YEAR:
+            return shift_years(start_date, -1), shift_years(end_date, -1)
+        if compare_with == ComparePeriod.TWO_YEARS_AGO:
+            return shift_years(start_date, -2), shift_years(end_date, -2)
+        period_length = (end_date - start_date).days + 1
+        prev_end_date = start_date - timedelta(days=1)
+        return prev_end_date - timedelta(days=period_length - 1), prev_end_date
+
+    @staticmethod
+    def _period_totals(daily_data: List[DailySalesResponse]) -> Dict[str, int]:
+        """기간의 매출·할인·거래 건수 합계"""
+        values = np.array(
+            [[getattr(item, field) for field in PERIOD_TOTAL_FIELDS] for item in daily_data],
+            dtype=np.int64
+        ).reshape(-1, len(PERIOD_TOTAL_FIELDS))
+        return dict(zip(PERIOD_TOTAL_FIELDS, (int(value) for value in values.sum(axis=0))))
+
+    @staticmethod
+    async def get_sales_comparison(
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]] = None,
+        periods: Optional[List[ComparePeriod]] = None
+    ) -> Dict[str, Any]:
+        """
+        현재 기간과 여러 비교 기간의 매출을 동시에 조회해 변화량을 계산합니다.
+
+        기간별 일별 매출 조회는 서로 독립적이므로 I/O 스레드 풀에서 동시에 실행하고,
+        변화량·변화율은 모든 비교 기간을 한 번에 배열 연산으로 계산합니다.
+
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            store_name: 매장 이름 필터 (None인 경우 모든 매장)
+            periods: 비교 기준 목록 (기본값: 이전 기간)
+
+        Returns:
+            current_period와 비교 기준 순서대로의 comparison_periods (각 기간의 합계, 일별 데이터, 변화량)
+        """
+        periods = periods or [ComparePeriod.PREVIOUS_PERIOD]
+        ranges = [SalesService.get_comparison_range(start_date, end_date, period) for period in periods]
+
+        current_data, *comparison_data = await asyncio.gather(
+            io_thread_pool.run_async(SalesService.get_daily_sales, start_date, end_date, store_name),
+            *(
+                io_thread_pool.run_async(SalesService.get_daily_sales, range_start, range_end, store_name)
+                for range_start, range_end in ranges
+            )
+        )
+
+        current_totals = SalesService._period_totals(current_data)
+        comparison_totals = [SalesService._period_totals(data) for data in comparison_data]
+
+        # 변화량·변화율 (비교 기간 × [실매출, 거래 건수], 비교 값이 0이면 변화율 0)
+        current = np.array([current_totals["actual_sales"], current_totals["transaction_count"]], dtype=np.int64)
+        comparison = np.array(
+            [[totals["actual_sales"], totals["transaction_count"]] for totals in comparison_totals],
+            dtype=np.int64
+        ).reshape(-1, 2)
+        change = current - comparison
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change_pct = change / comparison * 100
+
+        def _pct(row: int, column: int):
+            return round(float(change_pct[row, column]), 2) if comparison[row, column] else 0
+
+        return {
+            "current_period": {
+                "start_date": start_date,
+                "end_date": end_date,
+                **current_totals,
+                "daily_data": current_data
+            },
+            "comparison_periods": [
+                {
+                    "compare_with": period.value,
+                    "start_date": range_start,
+                    "end_date": range_end,
+                    **comparison_totals[i],
+                    "daily_data": comparison_data[i],
+                    "changes": {
+                        "sales_change": int(change[i, 0]),
+                        "sales_change_percentage": _pct(i, 0),
+                        "transaction_change": int(change[i, 1]),
+                        "transaction_change_percentage": _pct(i, 1)
+                    }
+                }
+                for i, (period, (range_start, range_end)) in enumerate(zip(periods, ranges))
+            ]
+        }
+
+    # ---- 집계 결과 변환 (개별 조회와 대시보드 묶음 조회가 공유) ----
+
+    @staticmethod
+    def build_daily_sales(
+        daily_partials: Dict[date, Dict[str, DailyPartial]],
+        store_name: Optional[List[str]] = None
+    ) -> List[DailySalesResponse]:
+        """
+        일자별·매장별 부분 집계로 일별 매출 목록을 만듭니다.
+        
+        Args:
+            daily_partials: {일자: {매장: 부분 집계}} (기간의 모든 일자 포함)
+            store_name: 매장 이름 필터 (None인 경우 모든 매장)
+            
+        Returns:
+            날짜순, 매장명순으로 정렬된 일별 매출 데이터 리스트
+        """
+        def to_response(single_date: date, store: str, partials: List[DailyPartial]) -> DailySalesResponse:
+            total_sales = sum(partial.total_sales for partial in partials)
+            actual_sales = sum(partial.actual_sales for partial in partials)
+            total_discount = sum(partial.total_discount for partial in partials)
+            # 거래 건수는 해당 일자의 레코드 수
+            transaction_count = sum(partial.row_count for partial in partials)
+            
+            # 평균 거래 금액 계산
+            avg_transaction_value = actual_sales / transaction_count if transaction_count > 0 else 0
+            
+            return DailySalesResponse(
+                date=single_date,
+                store_name=store,
+                total_sales=int(total_sales),
+                actual_sales=int(actual_sales),
+                total_discount=int(total_discount),
+                transaction_count=int(transaction_count),
+                avg_transaction_value=float(avg_transaction_value)
+            )
+        
+        result = []
+        
+        # 매장별, 날짜별로 데이터 집계
+        if store_name and len(store_name) == 1:
+            # 단일 매장 선택 시 해당 매장 데이터만 처리 (데이터가 없는 날짜는 0으로 채움)
+            selected_store = store_name[0]
+            for single_date, partials in daily_partials.items():
+                partial = partials.get(selected_store)
+                result.append(to_response(single_date, selected_store, [partial] if partial else []))
+        else:
+            # 기간 내 데이터가 있는 매장 목록 (매장 필터 적용)
+            selected_stores = set(store_name) if store_name else None
+            unique_stores = {
+                store
+                for partials in daily_partials.values()
+                for store in partials
+                if store != daily_aggregate_cache.UNKNOWN_STORE
+                and (selected_stores is None or store in selected_stores)
+            }
+            
+            # 여러 매장 선택 또는 모든 매장 - 개별 매장별 데이터와 전체 합계
+            for single_date, partials in daily_partials.items():
+                for store in unique_stores:
+                    partial = partials.get(store)
+                    result.append(to_response(single_date, store, [partial] if partial else []))
+                result.append(to_response(
+                    single_date,
+                    "전체",
+                    [
+                        partial for store, partial in partials.items()
+                        if selected_stores is None or store in selected_stores
+                    ]
+                ))
+        
+        # 날짜순, 매장명순 정렬
+        result.sort(key=lambda x: (x.date, x.store_name))
+        return result
+
+    @staticmethod
+    def empty_hourly_sales(store_name: Optional[List[str]] = None) -> List[HourlySalesResponse]:
+        """데이터가 없는 경우의 시간대별 매출 (24시간 모두 0값)"""
+        # 특정 매장만 선택된 경우 해당 매장만 반환, 모든 매장 또는 여러 매장 요청 시 기본값으로 '전체' 반환
+        selected_store = store_name[0] if store_name and len(store_name) == 1 else "전체"
+        return [
+            HourlySalesResponse(
+                hour=h,
+                store_name=selected_store,
+                total_sales=0,
+                transaction_count=0,
+                avg_transaction_value=0
+            ) for h in range(24)
+        ]
+    
+    @staticmethod
+    def build_hourly_sales(hourly_sales: pd.DataFrame, store_name: Optional[List[str]] = None) -> List[HourlySalesResponse]:
+        """
+        시간대·매장별 집계로 24시간을 모두 채운 시간대별 매출 목록을 만듭니다.
+        
+        Args:
+            hourly_sales: hour, store_name, total_sales, receipt_number(거래 건수) 컬럼의 집계
+            store_name: 매장 이름 필터 (단일 매장이면 해당 매장만 반환)
+            
+        Returns:
+            시간대순, 매장명순으로 정렬된 시간대별 매출 데이터 리스트
+        """
+        # 평균 거래 금액 계산
+        hourly_sales['avg_transaction_value'] = hourly_sales.apply(
+            lambda row: row['total_sales'] / row['receipt_number'] if row['receipt_number'] > 0 else 0,
+            axis=1
+        )
+        
+        # 결과 변환 (행 단위 생성 대신 목록 전체를 한 번에 검증)
+        records = hourly_sales.astype({
+            'hour': 'int64',
+            'total_sales': 'int64',
+            'receipt_number': 'int64',
+            'avg_transaction_value': 'float64'
+        }).rename(columns={'receipt_number': 'transaction_count'})[
+            ['hour', 'store_name', 'total_sales', 'transaction_count', 'avg_transaction_value']
+        ].to_dict('records')
+        result = get_type_adapter(List[HourlySalesResponse]).validate_python(records)
+        
+        # 누락된 시간대 채우기
+        # 모든 매장과 시간대 조합 만들기
+        complete_result = []
+        
+        # 사용 가능한 매장 목록 추출
+        stores = set()
+        for item in result:
+            stores.add(item.store_name)
+        
+        # 각 매장별로 모든 시간대 채우기
+        for store in stores:
+            # 해당 매장의 시간대 데이터 추출
+            store_items = {item.hour: item for item in result if item.store_name == store}
+            
+            # 모든 시간대 확인 및 누락 채우기
+            for h in range(24):
+                if h in store_items:
+                    complete_result.append(store_items[h])
+                else:
+                    # 누락된 시간대는 0값으로 채움
+                    complete_result.append(HourlySalesResponse(
+                        hour=h,
+                        store_name=store,
+                        total_sales=0,
+                        transaction_count=0,
+                        avg_transaction_value=0
+                    ))
+        
+        # 시간대순, 매장명순 정렬
+        complete_result.sort(key=lambda x: (x.hour, x.store_name))
+        
+        # 특정 매장만 필터링 (요청 시)
+        if store_name and len(store_name) == 1:
+            selected_store = store_name[0]
+            complete_result = [item for item in complete_result if item.store_name == selected_store]
+            
+        return complete_result
+
+    @staticmethod
+    def build_product_sales(df: pd.DataFrame, store_name: Optional[List[str]] = None, limit: int = 20) -> List[ProductSalesResponse]:
+        """
+        영수증 상세(또는 그 부분 합계) 행으로 상위 제품별 매출 목록을 만듭니다.
+        
+        Args:
+            df: product_name, product_code, store_name, quantity, total_sales, discount_amount,
+                actual_sales 컬럼 (null 값 처리 완료, 행은 원천 행이나 제품·매장별 부분 합계)
+            store_name: 매장 이름 필터 (단일 매장이면 해당 매장만 집계)
+            limit: 상위 제품 수 제한
+        """
+        # 매장별 및 제품별 집계 여부 결정
+        if store_name and len(store_name) == 1:
+            # 단일 매장 선택 시 해당 매장 데이터만 처리
+            selected_store = store_name[0]
+            df = df[df['store_name'] == selected_store]
+            
+            # 제품별 집계
+            product_sales = df.groupby(['product_name', 'product_code']).agg({
+                'quantity': 'sum',
+                'total_sales': 'sum',
+                'discount_amount': 'sum',
+                'actual_sales': 'sum'
+            }).reset_index()
+            
+            # 매장명 컬럼 추가
+            product_sales['store_name'] = selected_store
+        else:
+            # 매장별, 제품별로 집계
+            product_sales = df.groupby(['product_name', 'product_code', 'store_name']).agg({
+                'quantity': 'sum',
+                'total_sales': 'sum',
+                'discount_amount': 'sum',
+                'actual_sales': 'sum'
+            }).reset_index()
+        
+        # 총 매출 계산 (비율 계산용)
+        total_sales = df['total_sales'].sum()
+        
+        # 매출 비율 계산
+        product_sales['sales_percentage'] = product_sales.apply(
+            lambda row: row['total_sales'] / total_sales * 100 if total_sales > 0 else 0,
+            axis=1
+        )
+        
+        # 매출액 기준 내림차순 정렬 후 상위 n개 추출
+        product_sales = product_sales.sort_values('total_sales', ascending=False)
+        
+        # 매장별로 각각 limit 적용 또는 전체 중 상위 limit 개 선택
+        if store_name and len(store_name) == 1:
+            # 단일 매장은 상위 limit개 선택
+            product_sales = product_sales.head(limit)
+        else:
+            # 각 매장별로 top 제품 선택 또는 전체 중에서 상위 limit개
+            if 'store_name' in product_sales.columns and len(product_sales['store_name'].unique()) > 1:
+                # 각 매장별로 가장 많이 팔린 제품 선택
+                top_products_by_store = []
+                for store, group in product_sales.groupby('store_name'):
+                    top_products_by_store.append(group.head(min(limit // 2, len(group))))
+                product_sales = pd.concat(top_products_by_store)
+                
+                # 전체 상위 제품 몇 개 더 추가
+                all_top_products = product_sales.sort_values('total_sales', ascending=False).head(limit)
+                product_sales = pd.concat([product_sales, all_top_products]).drop_duplicates()
+            else:
+                # 단일 매장 또는 매장 구분 없는 경우
+                product_sales = product_sales.head(limit)
+        
         # 결과 변환
         result = []
-        for _, row in grouped.iterrows():
-            result.append(HourlyProductSalesResponse(
-                hour=int(row['hour']),
+        for _, row in product_sales.iterrows():
+            result.append(ProductSalesResponse(
                 product_name=str(row['product_name']),
-                quantity=int(row['quantity'])
+                product_code=str(row['product_code']) if pd.notna(row['product_code']) else None,
+                store_name=row['store_name'] if 'store_name' in row else '전체',
+                quantity=int(row['quantity']),
+                total_sales=int(row['total_sales']),
+                total_discount=int(row['discount_amount']),
+                actual_sales=int(row['actual_sales']),
+                sales_percentage=float(row['sales_percentage'])
             ))
+                
+        return result
+
+    @staticmethod
+    def build_payment_type_sales(payment_sales: pd.DataFrame) -> List[PaymentTypeSalesResponse]:
+        """
+        결제 유형별 집계로 매출 비율을 포함한 결제 유형별 매출 목록을 만듭니다.
+        
+        Args:
+            payment_sales: payment_type, total_sales, receipt_number(거래 건수) 컬럼의 집계
+        """
+        # 총 매출 계산 (비율 계산용)
+        total_sales = payment_sales['total_sales'].sum()
+        
+        # 매출 비율 계산
+        payment_sales['percentage'] = payment_sales['total_sales'] / total_sales * 100 if total_sales > 0 else 0
+        
+        # 매출액 기준 내림차순 정렬
+        payment_sales = payment_sales.sort_values('total_sales', ascending=False)
+        
+        # 결과 변환
+        result = []
+        for _, row in payment_sales.iterrows():
+            result.append(PaymentTypeSalesResponse(
+                payment_type=str(row['payment_type']),
+                transaction_count=int(row['receipt_number']),
+                total_sales=int(row['total_sales']),
+                percentage=float(row['percentage'])
+            ))
+                
         return result
 
 # 서비스 인스턴스 생성 (의존성 주입용)
@@ -0,0 +1,89 @@
+## scheduled_jobs.py
+
+"""
+서버 스케줄러 기본 작업
+
+- rollup_refresh: 최근 ROLLUP_REFRESH_DAYS일의 매장·일자별 부분 집계를 미리 조회 (데이터 변경으로 제거된 일자 재조회)
+- forecast_precompute: 배치 예측과 시계열 분해를 다시 계산해 저장 (run_forecast_batch.py, run_seasonal_decomposition.py와 동일)
+- cache_warmup: 기본 조회 기간의 결과 캐시 예열 (오전 접속 전)
+- cache_eviction: 다른 프로세스의 데이터 변경 확인 후 만료된 결과 캐시 항목 제거
+- shared_cache_eviction: 만료·무효 공유 캐시 항목 제거 (공유 캐시 사용 시)
+
+DB에 결과를 저장하는 작업(forecast_precompute)과 공유 디렉터리를 정리하는 작업은 회차마다 워커 하나만 실행하고,
+프로세스 안의 캐시를 채우는 작업은 워커마다 실행합니다. (single_run=False)
+
+DB 조회가 포함된 작업은 I/O 스레드 풀에서 실행해 요청 처리 이벤트 루프를 막지 않습니다.
+"""
+
+from typing import Any, Awaitable, Callable, List, Tuple
+import logging
+
+from app.core.cache import result_cache
+from app.core.config import settings
+from app.core.data_version import data_version_bus
+from app.core.executors import io_thread_pool
+from app.core.scheduler import JobScheduler
+from app.core.shared_cache import shared_cache
+from app.services.cache_warmup import CacheWarmupService
+from app.services.daily_aggregates import daily_aggregate_cache
+from app.services.forecast_batch import ForecastBatchService
+from app.services.seasonal_decomposition import SeasonalDecompositionService
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledJobs:
+    """스케줄러 작업 모음"""
+
+    @staticmethod
+    async def refresh_rollups() -> None:
+        """매장·일자별 부분 집계 갱신"""
+        data_version_bus.poll()
+        fetched = await io_thread_pool.run_async(daily_aggregate_cache.refresh, settings.ROLLUP_REFRESH_DAYS)
+        logger.info(f"일자별 집계 갱신: 최근 {settings.ROLLUP_REFRESH_DAYS}일 중 {fetched}일 조회")
+
+    @staticmethod
+    async def precompute_forecasts() -> None:
+        """배치 예측·시계열 분해 재계산 (완료 시 데이터 버전을 올려 관련 캐시 무효화)"""
+        await io_thread_pool.run_async(ForecastBatchService.run)
+        await io_thread_pool.run_async(SeasonalDecompositionService.run)
+
+    @staticmethod
+    async def warm_caches() -> None:
+        """기본 조회 기간 결과 캐시 예열"""
+        await CacheWarmupService.run()
+
+    @staticmethod
+    async def evict_stale_caches() -> None:
+        """데이터 변경 확인 및 만료 캐시 항목 제거"""
+        data_version_bus.poll(force=True)
+        removed = result_cache.evict_expired()
+        if removed:
+            logger.info(f"만료된 결과 캐시 {removed}건 제거")
+
+    @staticmethod
+    async def evict_shared_cache() -> None:
+        """만료·무효 공유 캐시 항목 제거"""
+        data_version_bus.poll(force=True)
+        removed = await io_thread_pool.run(shared_cache.evict)
+        if removed:
+            logger.info(f"만료·무효 공유 캐시 {removed}건 제거")
+
+
+def default_jobs() -> List[Tuple[str, str, Callable[[], Awaitable[Any]], bool]]:
+    """(이름, cron 식, 작업, 단일 실행 여부) 목록 - cron 식이 빈 문자열인 작업은 제외"""
+    jobs = [
+        ("rollup_refresh", settings.SCHEDULE_ROLLUP_REFRESH, ScheduledJobs.refresh_rollups, False),
+        ("forecast_precompute", settings.SCHEDULE_FORECAST_PRECOMPUTE, ScheduledJobs.precompute_forecasts, True),
+        ("cache_warmup", settings.SCHEDULE_CACHE_WARMUP, ScheduledJobs.warm_caches, False),
+        ("cache_eviction", settings.SCHEDULE_CACHE_EVICTION, ScheduledJobs.evict_stale_caches, False),
+    ]
+    if settings.SHARED_CACHE_ENABLED:
+        jobs.append(("shared_cache_eviction", settings.SCHEDULE_CACHE_EVICTION, ScheduledJobs.evict_shared_cache, True))
+    return [job for job in jobs if job[1].strip()]
+
+
+def register_default_jobs(scheduler: JobScheduler) -> None:
+    """기본 작업을 스케줄러에 등록 (같은 이름은 교체)"""
+    for name, schedule, func, single_run in default_jobs():
+        scheduler.add_job(name, schedule, func, single_run=single_run)
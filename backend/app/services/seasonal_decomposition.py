@@ -0,0 +1,366 @@
+## seasonal_decomposition.py
+
+"""
+시계열 분해 저장소
+
+매장('전체' 포함) × 지표별 일별 시계열을 STL/MSTL로 분해해 추세·주간·연간·잔차 성분을
+seasonal_components 테이블에 저장합니다. /trends/seasonality 와 /trends/decomposition 은
+저장된 성분을 날짜 범위로 읽기만 하므로 장기간 조회도 원천 테이블을 스캔하지 않습니다.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import delete, insert
+
+from app.core.data_version import data_version_bus
+from app.core.database import SessionLocal, engine, SeasonalComponent, run_query
+from app.core.executors import analytics_thread_pool, offload
+from app.core.process_pool import ManagedProcessPool, process_pool
+from app.models.trends import DecompositionPoint, DecompositionResponse
+from app.services.forecast_batch import ForecastBatchService
+from app.utils.date_utils import get_date_range
+from app.utils.time_series_models import (
+    WEEKLY_PERIOD,
+    YEARLY_PERIOD,
+    decompose_series,
+    seasonal_strength
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SeasonalDecompositionService:
+    """시계열 분해 작업 및 조회 서비스"""
+
+    METRICS = ForecastBatchService.METRICS
+    ALL_STORES = ForecastBatchService.ALL_STORES
+    MAX_HISTORY_DAYS = 3 * YEARLY_PERIOD  # 분해에 사용할 최대 기간 (최근 3년)
+
+    _table_ready = False
+
+    @staticmethod
+    def _ensure_table() -> bool:
+        """seasonal_components 테이블 생성 (없는 경우)"""
+        if not SeasonalDecompositionService._table_ready and engine is not None:
+            SeasonalComponent.__table__.create(bind=engine, checkfirst=True)
+            SeasonalDecompositionService._table_ready = True
+        return SeasonalDecompositionService._table_ready
+
+    @staticmethod
+    def _normalize_metric(metric: str) -> str:
+        return metric if metric in SeasonalDecompositionService.METRICS else "total_sales"
+
+    @staticmethod
+    def _store_key(store_name: Optional[List[str]]) -> Optional[str]:
+        """단일 매장 또는 전체 매장이면 저장 키, 여러 매장 조합이면 None"""
+        if not store_name:
+            return SeasonalDecompositionService.ALL_STORES
+        stores = set(store_name)
+        return stores.pop() if len(stores) == 1 else None
+
+    @staticmethod
+    async def run(
+        end_date: Optional[date] = None,
+        metrics: Optional[List[str]] = None,
+        pool: Optional[ManagedProcessPool] = None
+    ) -> Dict[str, Any]:
+        """
+        모든 매장·지표의 시계열 분해를 계산해 저장합니다. (CLI 및 스케줄러 진입점)
+
+        Args:
+            end_date: 분해 기간 종료일 (기본값: 데이터의 마지막 날짜)
+            metrics: 분해할 지표 목록 (기본값: 전체 지표)
+            pool: 분해에 사용할 프로세스 풀 (None이면 전역 풀)
+
+        Returns:
+            실행 요약 정보
+        """
+        started = time.perf_counter()
+        pool = pool or process_pool
+        metrics = metrics or SeasonalDecompositionService.METRICS
+
+        rows = await run_query("SELECT MIN(date) AS first_date, MAX(date) AS last_date FROM daily_sales_summary")
+        if not rows or not rows[0]["last_date"]:
+            return {"series_count": 0, "rows_written": 0, "error": "데이터가 없습니다."}
+
+        first_date = date.fromisoformat(str(rows[0]["first_date"])[:10])
+        end_date = end_date or date.fromisoformat(str(rows[0]["last_date"])[:10])
+        start_date = max(first_date, end_date - timedelta(days=SeasonalDecompositionService.MAX_HISTORY_DAYS - 1))
+
+        SeasonalDecompositionService._ensure_table()
+        daily = await ForecastBatchService.fetch_daily_series(start_date, end_date)
+        series = ForecastBatchService.build_series(daily, start_date, end_date, metrics)
+        keys = list(series.keys())
+
+        # 동시에 분해하는 시계열은 워커 수까지 (나머지를 한꺼번에 제출하면 온디맨드 요청이 배치 뒤에서 대기)
+        limit = asyncio.Semaphore(max(1, pool.max_workers))
+
+        async def decompose_limited(values: np.ndarray):
+            async with limit:
+                return await pool.run(decompose_series, values)
+
+        results = await asyncio.gather(
+            *(decompose_limited(series[key]) for key in keys),
+            return_exceptions=True
+        )
+
+        dates = [d.isoformat() for d in get_date_range(start_date, end_date)]
+        generated_at = datetime.now()
+        insert_rows = []
+        failed = []
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                logger.warning(f"시계열 분해 실패 ({key[0]}/{key[1]}): {result}")
+                failed.append(key)
+                continue
+            store, metric = key
+            yearly = result["yearly"] if result["yearly"] is not None else [None] * len(dates)
+            for i, day in enumerate(dates):
+                insert_rows.append({
+                    "store_name": store,
+                    "metric": metric,
+                    "date": day,
+                    "observed": float(series[key][i]),
+                    "trend": float(result["trend"][i]),
+                    "weekly": float(result["weekly"][i]),
+                    "yearly": None if yearly[i] is None else float(yearly[i]),
+                    "residual": float(result["residual"][i]),
+                    "generated_at": generated_at
+                })
+
+        written_keys = [key for key in keys if key not in failed]
+        db = SessionLocal()
+        try:
+            table = SeasonalComponent.__table__
+            for store, metric in written_keys:
+                db.execute(delete(table).where(table.c.store_name == store, table.c.metric == metric))
+            if insert_rows:
+                db.execute(insert(table), insert_rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        # 시계열 분해 결과 변경 기록 - 이전 계절성 응답 캐시와 ETag 무효화 (다른 프로세스 포함)
+        data_version_bus.bump((SeasonalComponent.__tablename__,), source="seasonal_decomposition")
+
+        summary = {
+            "series_start": start_date.isoformat(),
+            "series_end": end_date.isoformat(),
+            "periods": [WEEKLY_PERIOD, YEARLY_PERIOD] if len(dates) >= 2 * YEARLY_PERIOD else [WEEKLY_PERIOD],
+            "series_count": len(written_keys),
+            "failed_count": len(failed),
+            "rows_written": len(insert_rows),
+            "elapsed_seconds": round(time.perf_counter() - started, 2)
+        }
+        logger.info(f"시계열 분해 완료: {summary}")
+        return summary
+
+    @staticmethod
+    async def _load_components(
+        store_key: str,
+        metric: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """
+        저장된 분해 성분 조회
+
+        요청 기간의 모든 날짜가 저장되어 있을 때만 반환합니다. 분해 작업 이후의 날짜나
+        분해 기간 이전의 날짜가 포함되면 None (호출 측에서 원천 데이터로 계산)
+        """
+        try:
+            SeasonalDecompositionService._ensure_table()
+            rows = await run_query(
+                "SELECT date, observed, trend, weekly, yearly, residual, generated_at "
+                "FROM seasonal_components "
+                "WHERE store_name = :store_name AND metric = :metric "
+                "AND date >= :start_date AND date <= :end_date "
+                "ORDER BY date",
+                {
+                    "store_name": store_key,
+                    "metric": metric,
+                    "start_date": start_date.isoformat(),
+                    "end_date": end_date.isoformat()
+                }
+            )
+        except Exception as e:
+            logger.warning(f"시계열 분해 성분 조회 실패: {e}")
+            return None
+
+        if not rows:
+            return None
+        df = pd.DataFrame(rows)
+        df['date'] = pd.to_datetime(df['date']).dt.date
+        expected_days = (end_date - start_date).days + 1
+        if len(df) != expected_days or df['date'].iloc[0] != start_date or df['date'].iloc[-1] != end_date:
+            logger.debug(
+                "저장된 분해 성분이 요청 기간을 모두 포함하지 않음 (%s/%s, %d/%d일)",
+                store_key, metric, len(df), expected_days
+            )
+            return None
+        return df
+
+    @staticmethod
+    async def _fetch_series(
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]],
+        metric: str
+    ) -> Tuple[List[date], np.ndarray]:
+        """매장 조합의 일별 지표 시계열 조회 (저장된 성분이 없는 경우)"""
+        params: Dict[str, Any] = {"start_date": start_date.isoformat(), "end_date": end_date.isoformat()}
+        store_filter = ""
+        if store_name:
+            placeholders = ", ".join(f":store_{i}" for i in range(len(store_name)))
+            store_filter = f" AND store_name IN ({placeholders})"
+            params.update({f"store_{i}": name for i, name in enumerate(store_name)})
+
+        rows = await run_query(
+            "SELECT date, SUM(total_sales) AS total_sales, SUM(actual_sales) AS actual_sales, "
+            "COUNT(DISTINCT receipt_number) AS transactions "
+            "FROM daily_sales_summary "
+            f"WHERE date >= :start_date AND date <= :end_date{store_filter} "
+            "GROUP BY date",
+            params
+        )
+
+        dates = get_date_range(start_date, end_date)
+        if not rows:
+            return dates, np.zeros(0)
+        df = pd.DataFrame(rows)
+        df['date'] = pd.to_datetime(df['date']).dt.date
+        df['avg_transaction'] = df['total_sales'] / df['transactions'].replace(0, np.nan)
+        values = df.set_index('date').reindex(dates)[metric].fillna(0).to_numpy(dtype=float)
+        return dates, values
+
+    @staticmethod
+    async def get_seasonal_ratios(
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]],
+        metric: str,
+        period_type: str
+    ) -> Optional[pd.Series]:
+        """
+        저장된 성분으로 요일별/월별 상대 계절성(평균 대비 편차 비율)을 계산합니다.
+
+        Returns:
+            weekly: 요일(0=월요일) 인덱스, monthly: 월(1~12) 인덱스 시리즈.
+            저장된 성분이 없거나 기간이 짧으면 None (호출 측에서 원천 데이터로 계산)
+        """
+        store_key = SeasonalDecompositionService._store_key(store_name)
+        if store_key is None or period_type not in ("weekly", "monthly"):
+            return None
+
+        metric = SeasonalDecompositionService._normalize_metric(metric)
+        df = await SeasonalDecompositionService._load_components(store_key, metric, start_date, end_date)
+        min_days = 2 * WEEKLY_PERIOD if period_type == "weekly" else 60  # 주간 2주, 월간 2개월
+        if df is None or len(df) < min_days:
+            return None
+
+        level = df['observed'].mean()
+        if not level:
+            return None
+
+        dates = pd.to_datetime(df['date'])
+        if period_type == "weekly":
+            # 요일별 주간 성분 평균 / 전체 평균
+            return df.groupby(dates.dt.weekday.values)['weekly'].mean() / level
+
+        if df['yearly'].notna().all():
+            # 연간 성분이 있으면 월별 연간 성분 평균 / 전체 평균
+            return df.groupby(dates.dt.month.values)['yearly'].mean() / level
+
+        # 2년 미만 데이터는 저장된 관측값으로 월평균 비교 (원천 테이블 재조회 없음)
+        monthly_avg = df.groupby(dates.dt.month.values)['observed'].mean()
+        return monthly_avg / monthly_avg.mean() - 1
+
+    @staticmethod
+    @offload(analytics_thread_pool)
+    async def get_decomposition(
+        start_date: date,
+        end_date: date,
+        store_name: Optional[List[str]] = None,
+        metric: str = "total_sales"
+    ) -> DecompositionResponse:
+        """
+        시계열 분해 결과를 조회합니다.
+
+        단일 매장·전체 매장은 저장된 성분을 반환하고, 저장된 성분이 없거나
+        여러 매장 조합이면 요청 기간으로 즉시 분해합니다. (프로세스 풀에서 실행)
+
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            store_name: 매장 이름 필터 (None인 경우 모든 매장)
+            metric: 분해할 지표
+
+        Returns:
+            시계열 분해 응답
+        """
+        metric = SeasonalDecompositionService._normalize_metric(metric)
+        store_key = SeasonalDecompositionService._store_key(store_name)
+        store_label = store_key or ", ".join(sorted(set(store_name)))
+
+        df = None
+        if store_key is not None:
+            df = await SeasonalDecompositionService._load_components(store_key, metric, start_date, end_date)
+
+        source = "precomputed"
+        generated_at = None
+        if df is not None:
+            generated_at = pd.to_datetime(df['generated_at'].iloc[0]).to_pydatetime()
+        else:
+            source = "live"
+            dates, values = await SeasonalDecompositionService._fetch_series(start_date, end_date, store_name, metric)
+            if len(values) < 2 * WEEKLY_PERIOD or not values.any():
+                return DecompositionResponse(store_name=store_label, metric=metric, periods=[], data=[], source=source)
+            components = await process_pool.run(decompose_series, values)
+            df = pd.DataFrame({
+                'date': dates,
+                'observed': values,
+                'trend': components['trend'],
+                'weekly': components['weekly'],
+                'yearly': components['yearly'] if components['yearly'] is not None else np.nan,
+                'residual': components['residual']
+            })
+
+        has_yearly = df['yearly'].notna().all()
+        points = [
+            DecompositionPoint(
+                date=row['date'],
+                observed=float(row['observed']),
+                trend=float(row['trend']),
+                weekly=float(row['weekly']),
+                yearly=float(row['yearly']) if has_yearly else None,
+                residual=float(row['residual'])
+            )
+            for row in df.to_dict('records')
+        ]
+
+        return DecompositionResponse(
+            store_name=store_label,
+            metric=metric,
+            periods=[WEEKLY_PERIOD, YEARLY_PERIOD] if has_yearly else [WEEKLY_PERIOD],
+            data=points,
+            weekly_strength=seasonal_strength(df['weekly'].to_numpy(), df['residual'].to_numpy()),
+            yearly_strength=(
+                seasonal_strength(df['yearly'].to_numpy(dtype=float), df['residual'].to_numpy())
+                if has_yearly else None
+            ),
+            source=source,
+            generated_at=generated_at
+        )
+
+
+# 서비스 인스턴스
+seasonal_decomposition_service = SeasonalDecompositionService()
@@ -24,7 +24,7 @@ class StoreService:
             List[StoreListResponse]: 고유한 매장 목록
         """
         try:
-            logger.info("매장 목록 조회 시작")
+            logger.debug("매장 목록 조회 시작")
             
             # SQLite 데이터베이스에서 고유한 매장명 추출
             db = SessionLocal()
@@ -38,7 +38,7 @@ class StoreService:
                 
                 stores = [StoreListResponse(name=store_name) for store_name in store_names]
                 
-                logger.info(f"{len(stores)}개의 매장 정보 조회 완료: {[store.name for store in stores]}")
+                logger.debug("%d개의 매장 정보 조회 완료", len(stores))
                 return stores
                 
             finally:
@@ -60,7 +60,7 @@ class StoreService:
             StoreDetailResponse: 매장 상세 정보
         """
         try:
-            logger.info(f"매장 상세 정보 조회 시작: {store_id}")
+            logger.debug("매장 상세 정보 조회 시작: %s", store_id)
             
             # 매장 기본 정보 (현재는 더미 데이터)
             store_detail = StoreDetailResponse(
@@ -78,7 +78,7 @@ class StoreService:
                 parkingSpaces=10
             )
             
-            logger.info(f"매장 상세 정보 조회 완료: {store_id}")
+            logger.debug("매장 상세 정보 조회 완료: %s", store_id)
             return store_detail
             
         except Exception as e:
@@ -104,7 +104,7 @@ class StoreService:
             Dict[str, Any]: 벤치마크 데이터
         """
         try:
-            logger.info(f"매장 벤치마크 조회 시작: {store_id}, {start_date} ~ {end_date}")
+            logger.debug("매장 벤치마크 조회 시작: %s, %s ~ %s", store_id, start_date, end_date)
             
             # 더미 데이터 반환 (실제로는 DB에서 조회)
             benchmark_data = {
@@ -124,7 +124,7 @@ class StoreService:
                 }
             }
             
-            logger.info(f"매장 벤치마크 조회 완료: {store_id}")
+            logger.debug("매장 벤치마크 조회 완료: %s", store_id)
             return benchmark_data
             
         except Exception as e:
@@ -0,0 +1,329 @@
+## anomaly_detection.py
+
+import warnings
+from datetime import date, timedelta
+from typing import List, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# MAD를 정규분포 표준편차 척도로 맞추기 위한 상수 (0.6745 = Φ^-1(0.75))
+MAD_SCALE = 0.6745
+
+
+def _nan_median(values: np.ndarray, axis: int = -1) -> np.ndarray:
+    """전체가 NaN인 구간 경고 없이 nanmedian을 계산합니다."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return np.nanmedian(values, axis=axis)
+
+
+def _window_baseline(windows: np.ndarray, min_periods: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    마지막 축이 윈도우인 배열에서 median과 MAD를 계산합니다.
+
+    Args:
+        windows: (..., window) 형태의 과거 관측값 (결측은 NaN)
+        min_periods: 기준선 계산에 필요한 최소 관측 수
+
+    Returns:
+        (median, mad) 튜플 - 관측 수가 부족한 위치는 NaN
+    """
+    median = _nan_median(windows)
+    mad = _nan_median(np.abs(windows - median[..., None]))
+
+    observed = np.sum(~np.isnan(windows), axis=-1)
+    insufficient = observed < min_periods
+    median[insufficient] = np.nan
+    mad[insufficient] = np.nan
+    return median, mad
+
+
+def weekday_rolling_baseline(values: np.ndarray,
+                             weekdays: np.ndarray,
+                             window: int = 8,
+                             min_periods: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    요일별 롤링 기준선(median, MAD)을 계산합니다.
+
+    각 날짜의 기준선은 같은 요일의 직전 window개 관측값으로만 계산하며
+    당일 값은 포함하지 않습니다. 모든 시계열을 한 번에 처리합니다.
+
+    Args:
+        values: (시계열 수, 일수) 형태의 값 배열 (결측은 NaN)
+        weekdays: 각 열의 요일 (0=월요일, 6=일요일)
+        window: 요일별로 참고할 과거 주 수
+        min_periods: 기준선 계산에 필요한 최소 관측 수
+
+    Returns:
+        values와 같은 형태의 (median, mad) 배열 튜플
+    """
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    weekdays = np.asarray(weekdays)
+    n_series = values.shape[0]
+
+    median = np.full(values.shape, np.nan)
+    mad = np.full(values.shape, np.nan)
+
+    for weekday in range(7):
+        columns = np.flatnonzero(weekdays == weekday)
+        if columns.size == 0:
+            continue
+
+        # 같은 요일 값만 모아 앞쪽을 NaN으로 채운 뒤 직전 window개씩 묶음
+        same_day = values[:, columns]
+        padded = np.concatenate([np.full((n_series, window), np.nan), same_day], axis=1)
+        windows = sliding_window_view(padded, window, axis=1)[:, :columns.size, :]
+
+        day_median, day_mad = _window_baseline(windows, min_periods)
+        median[:, columns] = day_median
+        mad[:, columns] = day_mad
+
+    return median, mad
+
+
+def robust_zscore(values: np.ndarray,
+                  median: np.ndarray,
+                  mad: np.ndarray,
+                  mad_floor_ratio: float = 0.01) -> np.ndarray:
+    """
+    median/MAD 기반 robust z-score를 계산합니다.
+
+    MAD가 0에 가까운 경우(값이 매주 같은 경우) 무한대 점수를 피하기 위해
+    기준값의 mad_floor_ratio 비율을 최소 MAD로 사용합니다.
+    """
+    floor = np.abs(median) * mad_floor_ratio
+    scale = np.fmax(mad, floor)
+    scale = np.where(scale > 0, scale, np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return MAD_SCALE * (values - median) / scale
+
+
+def _pivot_series(frame: pd.DataFrame,
+                  value_columns: Sequence[str],
+                  date_column: str,
+                  group_columns: Sequence[str],
+                  dates: pd.DatetimeIndex) -> Tuple[List[Tuple], np.ndarray]:
+    """
+    (그룹, 지표)별 시계열을 (시계열 수, 일수) 배열로 변환합니다.
+
+    Returns:
+        (시계열 키 리스트, 값 배열) 튜플 - 키는 (그룹 값..., 지표) 형태
+    """
+    frame = frame.copy()
+    frame[date_column] = pd.to_datetime(frame[date_column])
+    group_columns = list(group_columns)
+
+    if group_columns:
+        indexed = frame.set_index(group_columns + [date_column])[list(value_columns)]
+        # 그룹별 열, 날짜별 행으로 펼친 후 전체 날짜로 재색인
+        wide = indexed.unstack(group_columns).reindex(dates)
+    else:
+        wide = frame.set_index(date_column)[list(value_columns)].reindex(dates)
+
+    keys = []
+    for column in wide.columns:
+        column = column if isinstance(column, tuple) else (column,)
+        metric, groups = column[0], column[1:]
+        keys.append(tuple(groups) + (metric,))
+
+    return keys, wide.to_numpy(dtype=float).T
+
+
+def detect_seasonal_anomalies(frame: pd.DataFrame,
+                              value_columns: Sequence[str],
+                              date_column: str = 'date',
+                              group_columns: Sequence[str] = ('store_name',),
+                              window: int = 8,
+                              min_periods: int = 3,
+                              threshold: float = 3.5,
+                              output_start: Optional[date] = None) -> pd.DataFrame:
+    """
+    요일별 롤링 median/MAD 기준선으로 이상치를 일괄 감지합니다.
+
+    모든 그룹(매장 등)과 지표를 하나의 배열로 묶어 벡터 연산으로 처리합니다.
+    전역 평균 대신 같은 요일의 최근 값과 비교하므로 주말 매출 증가가
+    이상치로 잡히지 않습니다.
+
+    Args:
+        frame: 날짜, 그룹, 지표 컬럼을 가진 일별 집계 데이터
+        value_columns: 이상치를 감지할 지표 컬럼 목록
+        date_column: 날짜 컬럼명
+        group_columns: 시계열을 구분할 컬럼 목록 (예: 매장명)
+        window: 요일별로 참고할 과거 주 수
+        min_periods: 기준선 계산에 필요한 최소 관측 수
+        threshold: 이상치 판단 robust z-score 임계값
+        output_start: 이 날짜 이전 결과는 제외 (기준선 계산용 과거 데이터 구간)
+
+    Returns:
+        그룹 컬럼, metric, date, value, expected_value, mad, z_score, is_anomaly
+        컬럼을 가진 long 형식 데이터프레임
+    """
+    group_columns = list(group_columns)
+    columns = group_columns + ['metric', 'date', 'value', 'expected_value', 'mad', 'z_score', 'is_anomaly']
+    if frame is None or frame.empty:
+        return pd.DataFrame(columns=columns)
+
+    parsed_dates = pd.to_datetime(frame[date_column])
+    dates = pd.date_range(parsed_dates.min(), parsed_dates.max(), freq='D')
+
+    keys, values = _pivot_series(frame, value_columns, date_column, group_columns, dates)
+    median, mad = weekday_rolling_baseline(values, dates.weekday.to_numpy(), window, min_periods)
+    z_scores = robust_zscore(values, median, mad)
+    is_anomaly = np.abs(np.nan_to_num(z_scores, nan=0.0)) > threshold
+
+    # 출력 구간 선택 (관측값이 없는 날짜는 제외)
+    day_mask = np.ones(len(dates), dtype=bool)
+    if output_start is not None:
+        day_mask = dates >= pd.Timestamp(output_start)
+
+    n_series, n_days = values.shape
+    series_index, day_index = np.nonzero(~np.isnan(values) & day_mask[None, :])
+
+    key_array = np.array(keys, dtype=object).reshape(n_series, -1)
+    result = pd.DataFrame(key_array[series_index], columns=group_columns + ['metric'])
+    result['date'] = dates[day_index].date
+    result['value'] = values[series_index, day_index]
+    result['expected_value'] = median[series_index, day_index]
+    result['mad'] = mad[series_index, day_index]
+    result['z_score'] = z_scores[series_index, day_index]
+    result['is_anomaly'] = is_anomaly[series_index, day_index]
+    return result[columns]
+
+
+class SeasonalAnomalyDetector:
+    """
+    요일별 median/MAD 기준선을 유지하는 증분형 이상치 감지기
+
+    fit()으로 과거 이력을 한 번 적재한 뒤 새 날짜가 들어올 때마다
+    update()로 해당 날짜만 점수화합니다. 상태는 (시계열, 요일, window)
+    배열 하나이므로 과거 이력을 다시 계산하지 않습니다.
+    """
+
+    def __init__(self,
+                 value_columns: Sequence[str],
+                 group_columns: Sequence[str] = ('store_name',),
+                 date_column: str = 'date',
+                 window: int = 8,
+                 min_periods: int = 3,
+                 threshold: float = 3.5):
+        self.value_columns = list(value_columns)
+        self.group_columns = list(group_columns)
+        self.date_column = date_column
+        self.window = window
+        self.min_periods = min_periods
+        self.threshold = threshold
+
+        self.keys: List[Tuple] = []
+        self._key_index: Dict[Tuple, int] = {}
+        self._history = np.full((0, 7, window), np.nan)
+        self.last_date: Optional[date] = None
+        self.last_result: Optional[pd.DataFrame] = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.last_date is not None
+
+    def _ensure_keys(self, keys: Sequence[Tuple]) -> np.ndarray:
+        """새 시계열 키를 상태 배열에 추가하고 키별 행 번호를 반환합니다."""
+        new_keys = [key for key in keys if key not in self._key_index]
+        if new_keys:
+            for key in new_keys:
+                self._key_index[key] = len(self.keys)
+                self.keys.append(key)
+            padding = np.full((len(new_keys), 7, self.window), np.nan)
+            self._history = np.concatenate([self._history, padding], axis=0)
+        return np.array([self._key_index[key] for key in keys], dtype=int)
+
+    def _push(self, rows: np.ndarray, weekday: int, values: np.ndarray) -> None:
+        """해당 요일 이력을 한 칸 밀고 최신 값을 추가합니다."""
+        history = self._history[:, weekday, :]
+        history[:, :-1] = history[:, 1:]
+        history[:, -1] = np.nan
+        history[rows, -1] = values
+
+    def fit(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        과거 이력 전체를 일괄 점수화하고 증분 상태를 초기화합니다.
+
+        Args:
+            frame: 날짜, 그룹, 지표 컬럼을 가진 일별 집계 데이터
+
+        Returns:
+            detect_seasonal_anomalies()와 같은 형식의 점수 데이터프레임
+        """
+        result = detect_seasonal_anomalies(
+            frame, self.value_columns, self.date_column, self.group_columns,
+            self.window, self.min_periods, self.threshold
+        )
+        if frame is None or frame.empty:
+            return result
+
+        parsed_dates = pd.to_datetime(frame[self.date_column])
+        dates = pd.date_range(parsed_dates.min(), parsed_dates.max(), freq='D')
+        keys, values = _pivot_series(frame, self.value_columns, self.date_column, self.group_columns, dates)
+
+        rows = self._ensure_keys(keys)
+        weekdays = dates.weekday.to_numpy()
+        for weekday in range(7):
+            columns = np.flatnonzero(weekdays == weekday)[-self.window:]
+            if columns.size:
+                self._history[rows, weekday, -columns.size:] = values[:, columns]
+
+        self.last_date = dates[-1].date()
+        self.last_result = result[result['date'] == self.last_date].reset_index(drop=True)
+        return result
+
+    def update(self, day: date, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        새로 적재된 하루치 데이터를 점수화하고 상태를 갱신합니다.
+
+        Args:
+            day: 새 데이터의 날짜 (마지막 처리일 이후여야 함)
+            frame: 해당 날짜의 그룹별 지표 데이터
+
+        Returns:
+            해당 날짜의 점수 데이터프레임
+        """
+        if self.last_date is not None and day <= self.last_date:
+            raise ValueError(f"이미 처리된 날짜입니다: {day} (마지막 처리일 {self.last_date})")
+
+        # 누락된 날짜는 결측으로 밀어 넣어 요일별 윈도우 위치를 맞춤
+        if self.last_date is not None:
+            gap_day = self.last_date + timedelta(days=1)
+            while gap_day < day:
+                self._push(np.array([], dtype=int), gap_day.weekday(), np.array([]))
+                gap_day += timedelta(days=1)
+
+        group_columns = self.group_columns
+        keys: List[Tuple] = []
+        values: List[float] = []
+        if frame is not None and not frame.empty:
+            day_frame = frame[pd.to_datetime(frame[self.date_column]).dt.date == day]
+            for metric in self.value_columns:
+                group_values = day_frame[group_columns].itertuples(index=False, name=None) if group_columns else [()] * len(day_frame)
+                keys.extend(tuple(groups) + (metric,) for groups in group_values)
+                values.extend(day_frame[metric].astype(float).tolist())
+
+        rows = self._ensure_keys(keys)
+        observed = np.asarray(values, dtype=float)
+        weekday = day.weekday()
+
+        median, mad = _window_baseline(self._history[rows, weekday, :], self.min_periods)
+        z_scores = robust_zscore(observed, median, mad)
+        is_anomaly = np.abs(np.nan_to_num(z_scores, nan=0.0)) > self.threshold
+
+        self._push(rows, weekday, observed)
+        self.last_date = day
+
+        result = pd.DataFrame(keys, columns=group_columns + ['metric'])
+        result['date'] = day
+        result['value'] = observed
+        result['expected_value'] = median
+        result['mad'] = mad
+        result['z_score'] = z_scores
+        result['is_anomaly'] = is_anomaly
+        result = result[~np.isnan(observed)].reset_index(drop=True)
+        self.last_result = result
+        return result
@@ -5,6 +5,13 @@ import numpy as np
 from typing import List, Dict, Any, Union, Optional, Tuple
 from datetime import date, datetime, timedelta
 
+# pandas 2.2부터 월말 빈도 표기가 'M'에서 'ME'로 변경됨
+try:
+    pd.tseries.frequencies.to_offset('ME')
+    _MONTH_END_FREQ = 'ME'
+except ValueError:
+    _MONTH_END_FREQ = 'M'
+
 def calculate_basic_stats(data: List[Dict[str, Any]]) -> Dict[str, float]:
     """
     데이터 집합의 기본 통계값을 계산합니다.
@@ -31,20 +38,44 @@ def calculate_basic_stats(data: List[Dict[str, Any]]) -> Dict[str, float]:
     numeric_df = df.select_dtypes(include=['number'])
     
     # 각 숫자 컬럼별 통계 계산
-    stats = {}
-    for col in numeric_df.columns:
-        col_stats = {
-            "count": len(numeric_df[col]),
-            "sum": float(numeric_df[col].sum()),
-            "mean": float(numeric_df[col].mean()),
-            "median": float(numeric_df[col].median()),
-            "min": float(numeric_df[col].min()),
-            "max": float(numeric_df[col].max()),
-            "std": float(numeric_df[col].std())
-        }
-        stats[col] = col_stats
+    return {col: basic_stats_array(numeric_df[col].to_numpy()) for col in numeric_df.columns}
+
+def basic_stats_array(values: np.ndarray, ddof: int = 1) -> Dict[str, float]:
+    """
+    1차원 숫자 배열의 기본 통계값을 계산합니다. (배열 입력 버전)
+    
+    NaN은 통계 계산에서 제외하지만 count에는 포함합니다 (pandas 동작과 동일).
+    
+    Args:
+        values: 숫자 배열 또는 pandas 컬럼
+        ddof: 표준편차 자유도 (기본값 1 = 표본 표준편차)
         
-    return stats
+    Returns:
+        기본 통계값 딕셔너리
+    """
+    values = np.asarray(values, dtype=float)
+    valid = values[~np.isnan(values)]
+    
+    if valid.size == 0:
+        return {
+            "count": int(values.size),
+            "sum": 0.0,
+            "mean": float("nan"),
+            "median": float("nan"),
+            "min": float("nan"),
+            "max": float("nan"),
+            "std": float("nan")
+        }
+    
+    return {
+        "count": int(values.size),
+        "sum": float(valid.sum()),
+        "mean": float(valid.mean()),
+        "median": float(np.median(valid)),
+        "min": float(valid.min()),
+        "max": float(valid.max()),
+        "std": float(valid.std(ddof=ddof)) if valid.size > ddof else float("nan")
+    }
 
 def detect_anomalies_zscore(data: List[Dict[str, Any]], 
                            value_field: str, 
@@ -65,32 +96,47 @@ def detect_anomalies_zscore(data: List[Dict[str, Any]],
     if not data:
         return []
     
-    df = pd.DataFrame(data)
-    
     # 값 필드 추출
-    values = df[value_field].values
-    
-    # Z-score 계산
-    mean = np.mean(values)
-    std = np.std(values)
+    values = np.fromiter((item[value_field] for item in data), dtype=float, count=len(data))
     
-    # 0으로 나누기 방지
-    if std == 0:
-        std = 1
-        
-    z_scores = [(x - mean) / std for x in values]
+    mean, z_scores, is_anomaly = zscore_anomalies_array(values, threshold)
     
     # 결과에 Z-score와 이상치 여부 추가
-    result = []
-    for i, item in enumerate(data):
-        result.append({
+    return [
+        {
             **item,
             "expected_value": mean,
-            "z_score": z_scores[i],
-            "is_anomaly": abs(z_scores[i]) > threshold
-        })
+            "z_score": z,
+            "is_anomaly": flag
+        }
+        for item, z, flag in zip(data, z_scores.tolist(), is_anomaly.tolist())
+    ]
+
+def zscore_anomalies_array(values: np.ndarray,
+                           threshold: float = 3.0) -> Tuple[float, np.ndarray, np.ndarray]:
+    """
+    Z-score 방식으로 이상치를 감지합니다. (배열 입력 버전)
+    
+    Args:
+        values: 값 배열 또는 pandas 컬럼
+        threshold: 이상치 판단 임계값
+        
+    Returns:
+        (평균값, z-score 배열, 이상치 여부 배열) 튜플
+    """
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return 0.0, np.empty(0), np.empty(0, dtype=bool)
+    
+    mean = float(values.mean())
+    std = float(values.std())
     
-    return result
+    # 0으로 나누기 방지
+    if std == 0:
+        std = 1.0
+        
+    z_scores = (values - mean) / std
+    return mean, z_scores, np.abs(z_scores) > threshold
 
 def detect_anomalies_iqr(data: List[Dict[str, Any]], 
                         value_field: str,
@@ -109,36 +155,49 @@ def detect_anomalies_iqr(data: List[Dict[str, Any]],
     if not data:
         return []
     
-    df = pd.DataFrame(data)
-    
     # 값 필드 추출
-    values = df[value_field].values
-    
-    # 사분위수 계산
-    q1 = np.percentile(values, 25)
-    q3 = np.percentile(values, 75)
-    iqr = q3 - q1
+    values = np.fromiter((item[value_field] for item in data), dtype=float, count=len(data))
     
-    # 이상치 하한/상한 계산
-    lower_bound = q1 - threshold * iqr
-    upper_bound = q3 + threshold * iqr
+    expected_value, lower_bound, upper_bound, is_anomaly = iqr_anomalies_array(values, threshold)
     
     # 결과에 IQR 정보와 이상치 여부 추가
-    result = []
-    for i, item in enumerate(data):
-        value = item[value_field]
-        is_anomaly = value < lower_bound or value > upper_bound
-        expected_value = (q1 + q3) / 2  # 중앙값 근사치
-        
-        result.append({
+    return [
+        {
             **item,
             "expected_value": expected_value,
             "lower_bound": lower_bound,
             "upper_bound": upper_bound,
-            "is_anomaly": is_anomaly
-        })
+            "is_anomaly": flag
+        }
+        for item, flag in zip(data, is_anomaly.tolist())
+    ]
+
+def iqr_anomalies_array(values: np.ndarray,
+                        threshold: float = 1.5) -> Tuple[float, float, float, np.ndarray]:
+    """
+    IQR 방식으로 이상치를 감지합니다. (배열 입력 버전)
+    
+    Args:
+        values: 값 배열 또는 pandas 컬럼
+        threshold: IQR 배수 임계값
+        
+    Returns:
+        (기대값, 하한, 상한, 이상치 여부 배열) 튜플
+    """
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return 0.0, 0.0, 0.0, np.empty(0, dtype=bool)
     
-    return result
+    # 사분위수 계산 (한 번의 정렬로 두 분위수 계산)
+    q1, q3 = np.percentile(values, [25, 75])
+    iqr = q3 - q1
+    
+    # 이상치 하한/상한 계산
+    lower_bound = float(q1 - threshold * iqr)
+    upper_bound = float(q3 + threshold * iqr)
+    expected_value = float((q1 + q3) / 2)  # 중앙값 근사치
+    
+    return expected_value, lower_bound, upper_bound, (values < lower_bound) | (values > upper_bound)
 
 def calculate_correlation(data1: List[float], 
                          data2: List[float], 
@@ -154,31 +213,50 @@ def calculate_correlation(data1: List[float],
     Returns:
         (상관계수, p-value) 튜플
     """
-    if len(data1) != len(data2):
+    return correlation_array(np.asarray(data1, dtype=float), np.asarray(data2, dtype=float), method)
+
+def correlation_array(x: np.ndarray,
+                      y: np.ndarray,
+                      method: str = 'pearson') -> Tuple[float, float]:
+    """
+    두 배열 간의 상관계수와 p-value를 계산합니다. (배열 입력 버전)
+    
+    Args:
+        x: 첫 번째 배열 또는 pandas 컬럼
+        y: 두 번째 배열 또는 pandas 컬럼
+        method: 상관계수 계산 방법 ('pearson', 'spearman', 'kendall')
+        
+    Returns:
+        (상관계수, p-value) 튜플
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    
+    if x.shape != y.shape:
         raise ValueError("두 데이터의 길이가 같아야 합니다.")
         
-    if len(data1) < 2:
+    if x.size < 2:
         return 0.0, 1.0
     
     # 결측치 제거 (둘 다 nan이 아닌 경우만 추출)
-    valid_data = [(x, y) for x, y in zip(data1, data2) if not (np.isnan(x) or np.isnan(y))]
-    if not valid_data:
+    valid = ~(np.isnan(x) | np.isnan(y))
+    if not valid.any():
         return 0.0, 1.0
-        
-    data1_clean = [x for x, _ in valid_data]
-    data2_clean = [y for _, y in valid_data]
+    x, y = x[valid], y[valid]
     
     # scipy 임포트 지연 (필요할 때만 로드)
     from scipy import stats
     
     if method == 'pearson':
-        return stats.pearsonr(data1_clean, data2_clean)
+        result = stats.pearsonr(x, y)
     elif method == 'spearman':
-        return stats.spearmanr(data1_clean, data2_clean)
+        result = stats.spearmanr(x, y)
     elif method == 'kendall':
-        return stats.kendalltau(data1_clean, data2_clean)
+        result = stats.kendalltau(x, y)
     else:
         raise ValueError(f"지원하지 않는 상관계수 계산 방법: {method}")
+    
+    return float(result[0]), float(result[1])
 
 def process_time_series(data: List[Dict[str, Any]], 
                        date_field: str,
@@ -206,23 +284,41 @@ def process_time_series(data: List[Dict[str, Any]],
     if df[date_field].dtype == 'object':
         df[date_field] = pd.to_datetime(df[date_field])
     
-    # 시계열 인덱스로 설정
-    df = df.set_index(date_field)
+    # 리샘플링 (필요시)
+    if freq:
+        dates, values = resample_time_series_array(df[date_field].to_numpy(), df[value_field].to_numpy(), freq)
+        return pd.DataFrame({date_field: dates, value_field: values})
     
     # 시간순 정렬
-    df = df.sort_index()
+    return df.sort_values(date_field, kind='stable').reset_index(drop=True)
+
+def resample_time_series_array(dates: np.ndarray,
+                               values: np.ndarray,
+                               freq: str = 'D') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    시계열을 지정 빈도로 리샘플링합니다. (배열 입력 버전)
     
-    # 리샘플링 (필요시)
-    if freq:
-        # 빈도별 리샘플링
-        resampled = df[value_field].resample(freq).mean()
-        
-        # 결측치 처리 (선형 보간)
-        resampled = resampled.interpolate(method='linear')
+    구간별 평균을 계산한 뒤 빈 구간은 선형 보간합니다.
+    
+    Args:
+        dates: 날짜 배열 (datetime64 또는 파싱 가능한 값)
+        values: 값 배열
+        freq: 시계열 빈도 ('D'=일별, 'W'=주별, 'M'=월별)
         
-        return resampled.reset_index()
+    Returns:
+        (구간 날짜 배열, 구간 값 배열) 튜플
+    """
+    if len(dates) == 0:
+        return np.empty(0, dtype='datetime64[ns]'), np.empty(0)
+    
+    series = pd.Series(np.asarray(values, dtype=float), index=pd.DatetimeIndex(pd.to_datetime(dates)))
+    
+    # 월별 빈도는 pandas 버전에 맞는 월말 표기로 변환
+    if freq == 'M':
+        freq = _MONTH_END_FREQ
+    resampled = series.sort_index().resample(freq).mean().interpolate(method='linear')
     
-    return df.reset_index()
+    return resampled.index.to_numpy(), resampled.to_numpy()
 
 def aggregate_by_category(data: List[Dict[str, Any]],
                          category_field: str,
@@ -241,29 +337,73 @@ def aggregate_by_category(data: List[Dict[str, Any]],
     if not data:
         return []
     
-    # DataFrame 변환
-    df = pd.DataFrame(data)
-    
-    # 카테고리별 집계
-    grouped = df.groupby(category_field)[value_field].agg(['sum', 'mean', 'count'])
+    categories = [item[category_field] for item in data]
+    values = np.fromiter((item[value_field] for item in data), dtype=float, count=len(data))
     
-    # 전체 합계 계산 (비율 계산용)
-    total_sum = grouped['sum'].sum()
+    columns = aggregate_by_category_array(categories, values)
     
     # 결과 변환
-    result = []
-    for category, row in grouped.iterrows():
-        percentage = (row['sum'] / total_sum * 100) if total_sum else 0
-        
-        result.append({
+    return [
+        {
             "category": category,
-            "total": float(row['sum']),
-            "average": float(row['mean']),
-            "count": int(row['count']),
-            "percentage": float(percentage)
-        })
+            "total": total,
+            "average": average,
+            "count": count,
+            "percentage": percentage
+        }
+        for category, total, average, count, percentage in zip(
+            columns["category"].tolist(),
+            columns["total"].tolist(),
+            columns["average"].tolist(),
+            columns["count"].tolist(),
+            columns["percentage"].tolist()
+        )
+    ]
+
+def aggregate_by_category_array(categories: np.ndarray,
+                                values: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    카테고리별로 값을 집계합니다. (배열 입력 버전)
     
-    # 합계 기준 내림차순 정렬
-    result.sort(key=lambda x: x["total"], reverse=True)
+    np.unique + bincount로 한 번에 집계하며 NaN 값은 합계/평균/건수에서 제외합니다.
     
-    return result
+    Args:
+        categories: 카테고리 배열 또는 pandas 컬럼
+        values: 집계할 값 배열 또는 pandas 컬럼
+        
+    Returns:
+        category, total, average, count, percentage 컬럼 배열 딕셔너리 (합계 기준 내림차순)
+    """
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return {
+            "category": np.empty(0, dtype=object),
+            "total": np.empty(0),
+            "average": np.empty(0),
+            "count": np.empty(0, dtype=int),
+            "percentage": np.empty(0)
+        }
+    
+    # 카테고리 코드화 (pandas factorize는 object 배열도 해시 기반으로 처리)
+    codes, uniques = pd.factorize(np.asarray(categories, dtype=object), sort=True)
+    valid = ~np.isnan(values) & (codes >= 0)
+    n_categories = len(uniques)
+    
+    totals = np.bincount(codes[valid], weights=values[valid], minlength=n_categories)
+    counts = np.bincount(codes[valid], minlength=n_categories)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        averages = totals / counts
+    
+    # 전체 합계 계산 (비율 계산용)
+    total_sum = totals.sum()
+    percentages = totals / total_sum * 100 if total_sum else np.zeros(n_categories)
+    
+    # 합계 기준 내림차순 정렬 (동률은 카테고리 순서 유지)
+    order = np.argsort(-totals, kind='stable')
+    return {
+        "category": np.asarray(uniques, dtype=object)[order],
+        "total": totals[order],
+        "average": averages[order],
+        "count": counts[order],
+        "percentage": percentages[order]
+    }
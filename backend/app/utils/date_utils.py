@@ -103,6 +103,22 @@ def get_recent_periods(end_date: date = None,
     
     return start_date, end_date
 
+def shift_years(dt: date, years: int) -> date:
+    """
+    n년 전후의 같은 날짜를 반환합니다. (윤년 2월 29일은 해당 연도의 2월 28일)
+    
+    Args:
+        dt: 기준 날짜
+        years: 이동할 연수 (음수면 과거)
+        
+    Returns:
+        이동한 날짜
+    """
+    try:
+        return dt.replace(year=dt.year + years)
+    except ValueError:
+        return dt.replace(year=dt.year + years, day=28)
+
 def parse_date_string(date_str: str) -> Optional[date]:
     """
     문자열을 date 객체로 변환합니다.
@@ -0,0 +1,235 @@
+## time_series_models.py
+
+"""
+시계열 모델 계산 함수
+
+DB·서비스 모듈에 의존하지 않는 순수 계산 함수만 모아 둡니다.
+프로세스 풀 워커에서 가볍게 임포트되도록 numpy/statsmodels 외 의존성을 두지 않습니다.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+import warnings
+
+import numpy as np
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.seasonal import MSTL, STL, seasonal_decompose
+
+# 일별 매출용 기본 차수 (주간 자기회귀 7, 1차 차분, 이동평균 1)
+ARIMA_ORDER: Tuple[int, int, int] = (7, 1, 1)
+
+# 시계열 분해 주기 (일 단위)
+WEEKLY_PERIOD = 7
+YEARLY_PERIOD = 365
+
+
+def fit_arima_params(
+    values: np.ndarray,
+    order: Tuple[int, int, int] = ARIMA_ORDER,
+    start_params: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    ARIMA 모델을 학습하고 파라미터 벡터를 반환합니다.
+
+    Args:
+        values: 일별 시계열 값
+        order: ARIMA 차수
+        start_params: 최적화 초기값 (이전 학습 결과, 없으면 기본 초기값)
+
+    Returns:
+        학습된 파라미터 벡터
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore")
+        model = ARIMA(np.asarray(values, dtype=float), order=order)
+        result = model.fit(start_params=start_params)
+    return np.asarray(result.params, dtype=float)
+
+
+def forecast_with_params(
+    values: np.ndarray,
+    params: np.ndarray,
+    steps: int,
+    order: Tuple[int, int, int] = ARIMA_ORDER
+) -> np.ndarray:
+    """
+    학습된 파라미터로 칼만 필터만 적용해 예측합니다. (최적화 없음)
+
+    Args:
+        values: 일별 시계열 값
+        params: 학습된 파라미터 벡터
+        steps: 예측할 일수
+        order: ARIMA 차수
+
+    Returns:
+        예측값 배열
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore")
+        model = ARIMA(np.asarray(values, dtype=float), order=order)
+        result = model.filter(params)
+        return np.asarray(result.forecast(steps=steps), dtype=float)
+
+
+def fit_and_forecast(
+    values: np.ndarray,
+    steps: int,
+    order: Tuple[int, int, int] = ARIMA_ORDER,
+    start_params: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """
+    ARIMA 학습 후 예측까지 한 번에 수행합니다. (프로세스 풀 작업 단위)
+
+    이전 파라미터로 시작한 학습이 실패하면 기본 초기값으로 다시 학습합니다.
+
+    Returns:
+        (파라미터 벡터, 예측값 배열, warm start 사용 여부)
+    """
+    warm = start_params is not None
+    try:
+        params = fit_arima_params(values, order, start_params)
+    except Exception:
+        if not warm:
+            raise
+        warm = False
+        params = fit_arima_params(values, order)
+    return params, forecast_with_params(values, params, steps, order), warm
+
+
+def linear_trend_forecast(values: np.ndarray, steps: int) -> np.ndarray:
+    """
+    선형 추세로 예측합니다. (ARIMA 실패 시 대체, 음수 예측값은 0으로 보정)
+
+    Args:
+        values: 일별 시계열 값
+        steps: 예측할 일수
+
+    Returns:
+        예측값 배열
+    """
+    values = np.asarray(values, dtype=float)
+    x = np.arange(len(values))
+    slope, intercept = np.polyfit(x, values, 1)
+    forecast_x = np.arange(len(values), len(values) + steps)
+    return np.maximum(intercept + slope * forecast_x, 0)
+
+
+def decompose_series(values: np.ndarray) -> Dict[str, Optional[np.ndarray]]:
+    """
+    STL 계열 분해로 추세·주간·연간·잔차 성분을 구합니다.
+
+    2년 이상 데이터가 있으면 MSTL(7일, 365일 주기), 그보다 짧으면 STL(7일 주기)을 사용하며
+    이 경우 연간 성분은 None입니다.
+
+    Args:
+        values: 날짜순 일별 시계열 값 (최소 2주)
+
+    Returns:
+        trend, weekly, yearly, residual 성분 배열
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) < 2 * WEEKLY_PERIOD:
+        raise ValueError("시계열 분해를 위한 데이터가 충분하지 않습니다.")
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore")
+        if len(values) >= 2 * YEARLY_PERIOD:
+            result = MSTL(values, periods=(WEEKLY_PERIOD, YEARLY_PERIOD)).fit()
+            seasonal = np.asarray(result.seasonal)
+            weekly, yearly = seasonal[:, 0], seasonal[:, 1]
+        else:
+            result = STL(values, period=WEEKLY_PERIOD, robust=True).fit()
+            weekly, yearly = np.asarray(result.seasonal), None
+
+    return {
+        "trend": np.asarray(result.trend),
+        "weekly": weekly,
+        "yearly": yearly,
+        "residual": np.asarray(result.resid)
+    }
+
+
+def seasonal_strength(seasonal: np.ndarray, residual: np.ndarray) -> float:
+    """계절성 강도 (0~1) = max(0, 1 - Var(잔차) / Var(계절 + 잔차))"""
+    total_var = np.var(np.asarray(seasonal) + np.asarray(residual))
+    if total_var == 0:
+        return 0.0
+    return float(max(0.0, 1 - np.var(residual) / total_var))
+
+
+def analyze_trend_values(time_series: np.ndarray) -> Tuple[str, Dict[str, Any]]:
+    """
+    시계열 값의 선형 추세와 주간 계절성을 분석합니다.
+
+    Args:
+        time_series: 날짜순 시계열 값
+
+    Returns:
+        (트렌드 유형, 트렌드 정보) 튜플
+    """
+    time_series = np.asarray(time_series, dtype=float)
+    if len(time_series) < 7:
+        return "unknown", {"error": "트렌드 분석을 위한 데이터가 충분하지 않습니다."}
+
+    try:
+        # 선형 추세 계산
+        x = np.arange(len(time_series))
+        slope, intercept = np.polyfit(x, time_series, 1)
+
+        # 선형 트렌드 값 계산
+        trend_values = intercept + slope * x
+
+        # 트렌드 유형 결정
+        # 시작과 끝의 값 차이로 전체적인 방향 확인
+        start_val = trend_values[0]
+        end_val = trend_values[-1]
+
+        if abs(end_val - start_val) < 0.1 * np.mean(time_series):
+            trend_type = "flat"  # 평탄한 추세
+        elif end_val > start_val:
+            trend_type = "increasing"  # 증가 추세
+        else:
+            trend_type = "decreasing"  # 감소 추세
+
+        # 계절성 체크 (충분한 데이터가 있는 경우)
+        seasonality_info = {}
+        if len(time_series) >= 14:  # 최소 2주 이상 데이터가 필요
+            try:
+                # 주별 계절성 확인
+                with warnings.catch_warnings():
+                    warnings.filterwarnings("ignore")
+                    decomposition = seasonal_decompose(
+                        time_series,
+                        model='additive',
+                        period=7  # 7일 주기
+                    )
+                seasonal = decomposition.seasonal
+                seasonality_strength = np.std(seasonal) / np.std(time_series - np.mean(time_series))
+
+                if seasonality_strength > 0.2:
+                    trend_type = "seasonal"  # 계절성 추세
+                    seasonality_info = {
+                        "seasonality_strength": float(seasonality_strength),
+                        "period": 7,
+                        "period_type": "weekly"
+                    }
+            except Exception:
+                # 계절성 분석 실패 시 무시
+                pass
+
+        # 결과 정보
+        trend_info = {
+            "slope": float(slope),
+            "intercept": float(intercept),
+            "start_value": float(start_val),
+            "end_value": float(end_val),
+            "change_percent": float((end_val - start_val) / start_val * 100) if start_val != 0 else 0.0
+        }
+
+        # 계절성 정보 추가
+        if seasonality_info:
+            trend_info["seasonality"] = seasonality_info
+
+        return trend_type, trend_info
+
+    except Exception as e:
+        return "error", {"error": f"트렌드 분석 중 오류가 발생했습니다: {str(e)}"}
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+응답 압축 벤치마크
+
+대용량 응답 본문을 압축 없이 보낼 때와 ResponseCompressionMiddleware로 압축할 때를 비교합니다.
+- 인코딩별 압축 후 크기, 압축 시간, 압축 결과 캐시 적중 시 시간
+- 미들웨어를 거친 ASGI 응답 시간 (네트워크 제외)
+- 주어진 대역폭에서의 예상 전송 시간 (서버 처리 + 전송)
+
+사용법 (backend 디렉토리에서 실행):
+    python -m benchmarks.bench_compression            # 기본 규모, 20Mbps
+    python -m benchmarks.bench_compression 2 100      # 규모 배수, 대역폭(Mbps)
+"""
+
+import asyncio
+import gzip
+import sys
+from typing import List, Optional
+
+import numpy as np
+from starlette.responses import Response
+
+from app.core import compression
+from app.core.config import settings
+from app.core.responses import get_type_adapter
+from app.models.kpi import KPITrendPoint
+from app.models.sales import HourlyProductSalesResponse, HourlySalesResponse
+from benchmarks.bench_serialization import _best_of, _hourly_product_rows, _hourly_rows, _trend_rows
+
+
+def _asgi_time(body: bytes, accept_encoding: Optional[str], etag: bool, repeat: int) -> float:
+    """미들웨어를 거쳐 응답 하나를 보내는 시간(초)"""
+    headers = {"ETag": 'W/"bench"'} if etag else None
+
+    async def endpoint(scope, receive, send):
+        await Response(body, media_type="application/json", headers=headers)(scope, receive, send)
+
+    app = compression.ResponseCompressionMiddleware(endpoint)
+    request_headers = [(b"accept-encoding", accept_encoding.encode("latin-1"))] if accept_encoding else []
+    scope = {"type": "http", "method": "GET", "path": "/api/bench", "headers": request_headers}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    loop = asyncio.new_event_loop()
+    try:
+        return _best_of(lambda: loop.run_until_complete(app(scope, receive, send)), repeat)
+    finally:
+        loop.close()
+
+
+def run(scale: int, mbps: float) -> None:
+    rng = np.random.default_rng(42)
+    stores, products, days = 50 * scale, 300 * scale, 365
+    payloads = [
+        ("/sales/hourly", get_type_adapter(List[HourlySalesResponse]).dump_json(
+            get_type_adapter(List[HourlySalesResponse]).validate_python(_hourly_rows(rng, stores)))),
+        ("/sales/products/hourly", get_type_adapter(List[HourlyProductSalesResponse]).dump_json(
+            get_type_adapter(List[HourlyProductSalesResponse]).validate_python(_hourly_product_rows(rng, products)))),
+        ("/kpi/trends", get_type_adapter(List[KPITrendPoint]).dump_json(
+            get_type_adapter(List[KPITrendPoint]).validate_python(_trend_rows(rng, days, stores // 5)))),
+    ]
+
+    encodings: list = [("identity", None)]
+    for level in (1, settings.COMPRESSION_GZIP_LEVEL, 9):
+        encodings.append((f"gzip-{level}", lambda body, level=level: gzip.compress(body, compresslevel=level, mtime=0)))
+    if compression.brotli is not None:
+        for quality in (settings.COMPRESSION_BROTLI_QUALITY, 11):
+            encodings.append((f"br-{quality}", lambda body, quality=quality: compression.brotli.compress(body, quality=quality)))
+    else:
+        print("brotli: 미설치 (gzip만 비교)")
+
+    bytes_per_ms = mbps * 1e6 / 8 / 1e3
+    print(f"대역폭 {mbps:g}Mbps 기준 전송 시간 포함")
+    print(f"{'endpoint':<24}{'encoding':<10}{'bytes':>10}{'ratio':>8}{'compress ms':>13}{'transfer ms':>13}{'total ms':>10}")
+    print("-" * 88)
+    for name, body in payloads:
+        for label, compress in encodings:
+            compressed = compress(body) if compress else body
+            compress_time = _best_of(lambda: compress(body), 5) if compress else 0.0
+            transfer = len(compressed) / bytes_per_ms
+            print(f"{name:<24}{label:<10}{len(compressed):>10}{len(compressed) / len(body):>8.3f}"
+                  f"{compress_time * 1e3:>13.2f}{transfer:>13.2f}{compress_time * 1e3 + transfer:>10.2f}")
+        print()
+
+    # 미들웨어 경유 응답 시간 (기본 설정의 인코딩, 압축 결과 캐시 사용·미사용)
+    encoding = compression.SUPPORTED_ENCODINGS[0]
+    print(f"미들웨어 경유 응답 시간 (ms, {encoding}, 네트워크 제외)")
+    print(f"{'endpoint':<24}{'identity':>10}{'compress':>10}{'cached':>10}")
+    print("-" * 54)
+    for name, body in payloads:
+        compression.compressed_body_cache.clear()
+        identity = _asgi_time(body, None, etag=False, repeat=20)
+        uncached = _asgi_time(body, encoding, etag=False, repeat=20)
+        cached = _asgi_time(body, encoding, etag=True, repeat=20)
+        print(f"{name:<24}{identity * 1e3:>10.2f}{uncached * 1e3:>10.2f}{cached * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+    )
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+data_processing 커널 마이크로 벤치마크
+
+기존 구현(70999f2의 data_processing, 아래 _legacy_* 사본)과 현재 List[Dict] 입력 함수,
+NumPy 배열 입력 함수의 실행 시간을 비교합니다. 배수는 기존 구현 대비입니다.
+- before: 기존 구현 (행 단위 Python 루프, DataFrame 변환 포함)
+- list[dict]: 현재 API (DataFrame 변환 후 배열 커널 호출)
+- array: 배열 커널 직접 호출
+
+사용법 (backend 디렉토리에서 실행):
+    python -m benchmarks.bench_data_processing            # 1k, 100k, 1M
+    python -m benchmarks.bench_data_processing 1000 10000 # 크기 지정
+"""
+
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.utils import data_processing as dp
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+
+
+# 기존 구현 사본 (70999f2 app/utils/data_processing.py, 비교 기준)
+
+def _legacy_calculate_basic_stats(data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if not data:
+        return {"count": 0, "sum": 0, "mean": 0, "median": 0, "min": 0, "max": 0, "std": 0}
+    df = pd.DataFrame(data)
+    numeric_df = df.select_dtypes(include=['number'])
+    stats = {}
+    for col in numeric_df.columns:
+        stats[col] = {
+            "count": len(numeric_df[col]),
+            "sum": float(numeric_df[col].sum()),
+            "mean": float(numeric_df[col].mean()),
+            "median": float(numeric_df[col].median()),
+            "min": float(numeric_df[col].min()),
+            "max": float(numeric_df[col].max()),
+            "std": float(numeric_df[col].std())
+        }
+    return stats
+
+
+def _legacy_detect_anomalies_zscore(data: List[Dict[str, Any]], value_field: str,
+                                    date_field: str = 'date', threshold: float = 3.0) -> List[Dict[str, Any]]:
+    if not data:
+        return []
+    df = pd.DataFrame(data)
+    values = df[value_field].values
+    mean = np.mean(values)
+    std = np.std(values)
+    if std == 0:
+        std = 1
+    z_scores = [(x - mean) / std for x in values]
+    result = []
+    for i, item in enumerate(data):
+        result.append({
+            **item,
+            "expected_value": mean,
+            "z_score": z_scores[i],
+            "is_anomaly": abs(z_scores[i]) > threshold
+        })
+    return result
+
+
+def _legacy_detect_anomalies_iqr(data: List[Dict[str, Any]], value_field: str,
+                                 threshold: float = 1.5) -> List[Dict[str, Any]]:
+    if not data:
+        return []
+    df = pd.DataFrame(data)
+    values = df[value_field].values
+    q1 = np.percentile(values, 25)
+    q3 = np.percentile(values, 75)
+    iqr = q3 - q1
+    lower_bound = q1 - threshold * iqr
+    upper_bound = q3 + threshold * iqr
+    result = []
+    for item in data:
+        value = item[value_field]
+        is_anomaly = value < lower_bound or value > upper_bound
+        expected_value = (q1 + q3) / 2
+        result.append({
+            **item,
+            "expected_value": expected_value,
+            "lower_bound": lower_bound,
+            "upper_bound": upper_bound,
+            "is_anomaly": is_anomaly
+        })
+    return result
+
+
+def _legacy_calculate_correlation(data1: List[float], data2: List[float], method: str = 'pearson') -> Tuple[float, float]:
+    if len(data1) != len(data2):
+        raise ValueError("두 데이터의 길이가 같아야 합니다.")
+    if len(data1) < 2:
+        return 0.0, 1.0
+    valid_data = [(x, y) for x, y in zip(data1, data2) if not (np.isnan(x) or np.isnan(y))]
+    if not valid_data:
+        return 0.0, 1.0
+    data1_clean = [x for x, _ in valid_data]
+    data2_clean = [y for _, y in valid_data]
+    from scipy import stats
+    if method == 'pearson':
+        return stats.pearsonr(data1_clean, data2_clean)
+    elif method == 'spearman':
+        return stats.spearmanr(data1_clean, data2_clean)
+    elif method == 'kendall':
+        return stats.kendalltau(data1_clean, data2_clean)
+    raise ValueError(f"지원하지 않는 상관계수 계산 방법: {method}")
+
+
+def _legacy_process_time_series(data: List[Dict[str, Any]], date_field: str, value_field: str,
+                                freq: str = 'D') -> pd.DataFrame:
+    if not data:
+        return pd.DataFrame(columns=[date_field, value_field])
+    df = pd.DataFrame(data)
+    if df[date_field].dtype == 'object':
+        df[date_field] = pd.to_datetime(df[date_field])
+    df = df.set_index(date_field)
+    df = df.sort_index()
+    if freq:
+        resampled = df[value_field].resample(freq).mean()
+        resampled = resampled.interpolate(method='linear')
+        return resampled.reset_index()
+    return df.reset_index()
+
+
+def _legacy_aggregate_by_category(data: List[Dict[str, Any]], category_field: str,
+                                  value_field: str) -> List[Dict[str, Any]]:
+    if not data:
+        return []
+    df = pd.DataFrame(data)
+    grouped = df.groupby(category_field)[value_field].agg(['sum', 'mean', 'count'])
+    total_sum = grouped['sum'].sum()
+    result = []
+    for category, row in grouped.iterrows():
+        percentage = (row['sum'] / total_sum * 100) if total_sum else 0
+        result.append({
+            "category": category,
+            "total": float(row['sum']),
+            "average": float(row['mean']),
+            "count": int(row['count']),
+            "percentage": float(percentage)
+        })
+    result.sort(key=lambda x: x["total"], reverse=True)
+    return result
+
+
+def _best_of(func: Callable[[], object], repeat: int) -> float:
+    """repeat회 실행 중 최소 시간(초)을 반환합니다."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes: List[int]) -> None:
+    rng = np.random.default_rng(42)
+    categories = np.array(["빵", "케이크", "음료", "샌드위치", "쿠키", "기타"], dtype=object)
+
+    print(f"{'kernel':<24}{'n':>10}{'before ms':>12}{'list[dict] ms':>16}{'array ms':>12}"
+          f"{'list 배수':>11}{'array 배수':>12}")
+    print("-" * 97)
+
+    for n in sizes:
+        repeat = 5 if n <= 100_000 else 2
+        values = rng.normal(1_000_000, 150_000, n)
+        other = values * 0.8 + rng.normal(0, 50_000, n)
+        cats = categories[rng.integers(0, len(categories), n)]
+        dates = pd.date_range("2020-01-01", periods=n, freq="min").to_numpy()
+
+        # 기존 API 입력 형태 (행 단위 딕셔너리)
+        records = [
+            {"date": d, "value": v, "category": c}
+            for d, v, c in zip(dates.tolist(), values.tolist(), cats.tolist())
+        ]
+        value_list, other_list = values.tolist(), other.tolist()
+
+        cases = [
+            ("basic_stats",
+             lambda: _legacy_calculate_basic_stats(records),
+             lambda: dp.calculate_basic_stats(records),
+             lambda: dp.basic_stats_array(values)),
+            ("anomalies_zscore",
+             lambda: _legacy_detect_anomalies_zscore(records, "value"),
+             lambda: dp.detect_anomalies_zscore(records, "value"),
+             lambda: dp.zscore_anomalies_array(values)),
+            ("anomalies_iqr",
+             lambda: _legacy_detect_anomalies_iqr(records, "value"),
+             lambda: dp.detect_anomalies_iqr(records, "value"),
+             lambda: dp.iqr_anomalies_array(values)),
+            ("correlation",
+             lambda: _legacy_calculate_correlation(value_list, other_list),
+             lambda: dp.calculate_correlation(value_list, other_list),
+             lambda: dp.correlation_array(values, other)),
+            ("time_series (D)",
+             lambda: _legacy_process_time_series(records, "date", "value", "D"),
+             lambda: dp.process_time_series(records, "date", "value", "D"),
+             lambda: dp.resample_time_series_array(dates, values, "D")),
+            ("aggregate_by_category",
+             lambda: _legacy_aggregate_by_category(records, "category", "value"),
+             lambda: dp.aggregate_by_category(records, "category", "value"),
+             lambda: dp.aggregate_by_category_array(cats, values)),
+        ]
+
+        for name, legacy_func, list_func, array_func in cases:
+            legacy_time = _best_of(legacy_func, repeat)
+            list_time = _best_of(list_func, repeat)
+            array_time = _best_of(array_func, repeat)
+            print(
+                f"{name:<24}{n:>10,}{legacy_time * 1000:>12.2f}{list_time * 1000:>16.2f}{array_time * 1000:>12.2f}"
+                f"{legacy_time / list_time:>10.1f}x{legacy_time / array_time:>11.1f}x"
+            )
+
+        del records
+        print()
+
+
+if __name__ == "__main__":
+    requested = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    run(requested)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+이벤트 루프 지연 벤치마크
+
+실제 앱(app.main.app)을 httpx.ASGITransport로 같은 이벤트 루프에서 호출해
+무거운 조회가 실행되는 동안 헬스체크(`/`) 응답 지연을 측정합니다.
+- inline: 스레드 풀·프로세스 풀 워커 수 0 (서비스 메서드를 이벤트 루프에서 직접 실행)
+- offload: 설정된 워커 수 (IO_THREAD_POOL_WORKERS, ANALYTICS_THREAD_POOL_WORKERS, PROCESS_POOL_WORKERS)
+- 부하: /api/analytics/correlations, /api/kpi/categories, /api/sales/products/hourly 를
+  번갈아 동시에 요청합니다. 결과 캐시와 single-flight는 꺼서 요청마다 실제로 계산합니다.
+- 헬스체크는 일정 간격으로 실행하며 예약 시각부터 응답까지의 지연을 기록합니다.
+
+사용법 (backend 디렉토리에서 실행):
+    python -m benchmarks.bench_event_loop_latency            # 데이터 마지막 90일, 동시 요청 8건
+    python -m benchmarks.bench_event_loop_latency 30 16      # 조회 일수, 동시 요청 건수
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Sequence, Tuple
+
+import httpx
+import numpy as np
+
+from app.core.config import settings
+from app.core.database import run_query
+from app.core.executors import analytics_thread_pool, io_thread_pool
+from app.core.process_pool import process_pool
+from app.main import app
+
+# 헬스체크 간격(초)
+PROBE_INTERVAL = 0.01
+
+# 부하 요청 경로 (분석 스레드 풀, IO 스레드 풀 경로)
+LOAD_PATHS = (
+    "/api/analytics/correlations",
+    "/api/kpi/categories",
+    "/api/sales/products/hourly",
+)
+
+# 방식별 워커 수를 바꾸는 풀 (io, analytics, process 순서)
+POOLS = (io_thread_pool, analytics_thread_pool, process_pool)
+
+
+async def _default_range(days: int) -> Tuple[date, date]:
+    rows = await run_query("SELECT MAX(date) AS max_date FROM daily_sales_summary")
+    if not rows or not rows[0]["max_date"]:
+        raise SystemExit("daily_sales_summary 테이블에 데이터가 없습니다.")
+    end_date = date.fromisoformat(str(rows[0]["max_date"])[:10])
+    return end_date - timedelta(days=days - 1), end_date
+
+
+async def _probe(client: httpx.AsyncClient, stop: asyncio.Event, latencies: List[float]) -> None:
+    """
+    PROBE_INTERVAL마다 헬스체크 요청, 예약 시각 대비 응답 지연(ms) 기록
+
+    응답이 간격보다 늦으면 다음 예약 시각을 응답 시점으로 옮겨 지연이 누적되지 않게 합니다.
+    """
+    loop = asyncio.get_running_loop()
+    scheduled = loop.time()
+    while not stop.is_set():
+        scheduled += PROBE_INTERVAL
+        await asyncio.sleep(max(0.0, scheduled - loop.time()))
+        response = await client.get("/")
+        response.raise_for_status()
+        now = loop.time()
+        latencies.append((now - scheduled) * 1000)
+        scheduled = max(scheduled, now)
+
+
+async def _request(client: httpx.AsyncClient, path: str, params: Dict[str, str]) -> None:
+    response = await client.get(path, params=params)
+    response.raise_for_status()
+
+
+async def _run_case(workers: Sequence[int], params: Dict[str, str], requests: int) -> Dict[str, float]:
+    """풀 워커 수를 지정하고 앱을 기동해 부하 요청 중 헬스체크 지연 측정"""
+    for pool, count in zip(POOLS, workers):
+        pool.max_workers = count
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            # 워밍업 (풀 기동, 일자별 집계 캐시 적재)
+            for path in LOAD_PATHS:
+                await _request(client, path, params)
+
+            latencies: List[float] = []
+            stop = asyncio.Event()
+            probe = asyncio.create_task(_probe(client, stop, latencies))
+            # 기준 지연을 위해 부하 시작 전 잠시 대기
+            await asyncio.sleep(PROBE_INTERVAL * 5)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(
+                _request(client, LOAD_PATHS[i % len(LOAD_PATHS)], params) for i in range(requests)
+            ))
+            elapsed = time.perf_counter() - started
+
+            stop.set()
+            await probe
+
+    values = np.array(latencies) if latencies else np.zeros(1)
+    return {
+        "elapsed": elapsed,
+        "probes": len(latencies),
+        "p50": float(np.percentile(values, 50)),
+        "p99": float(np.percentile(values, 99)),
+        "max": float(values.max()),
+    }
+
+
+def main() -> None:
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 90
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    # 요청마다 실제로 계산하도록 결과 캐시·single-flight, 백그라운드 작업은 끔 (요청 로그도 생략)
+    settings.RESULT_CACHE_ENABLED = False
+    settings.SINGLE_FLIGHT_ENABLED = False
+    settings.CACHE_WARMUP_ENABLED = False
+    settings.SCHEDULER_ENABLED = False
+    logging.disable(logging.INFO)
+
+    start_date, end_date = asyncio.run(_default_range(days))
+    params = {"start_date": start_date.isoformat(), "end_date": end_date.isoformat()}
+    offload_workers = tuple(pool.max_workers for pool in POOLS)
+
+    print(f"기간: {start_date} ~ {end_date}  동시 요청: {requests}건  헬스체크 간격: {PROBE_INTERVAL * 1000:.0f}ms")
+    print("워커 수: io/analytics/process 순서")
+    print(f"{'방식':<24}{'요청 완료(s)':>14}{'헬스체크 수':>12}{'p50(ms)':>10}{'p99(ms)':>10}{'max(ms)':>10}")
+
+    cases = [
+        ("inline", (0, 0, 0)),
+        ("offload {}/{}/{}".format(*offload_workers), offload_workers),
+    ]
+    for name, workers in cases:
+        result = asyncio.run(_run_case(workers, params, requests))
+        print(
+            f"{name:<24}{result['elapsed']:>14.2f}{result['probes']:>12}"
+            f"{result['p50']:>10.1f}{result['p99']:>10.1f}{result['max']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+내보내기 형식별 처리 시간·크기 비교 및 왕복 검증
+
+DB의 내보내기 대상(/export/{table})마다 arrow, parquet, ndjson, csv 스트림을 생성해
+시간과 전송 크기를 비교합니다.
+- Arrow IPC 스트림은 pyarrow.ipc.open_stream, Parquet은 pyarrow.parquet.read_table로 다시 읽어
+  두 테이블이 같은지와 NDJSON 출력(원천 값)과 행·값이 같은지 확인합니다. (다르면 AssertionError)
+- 배치 결과 테이블(forecast_results, seasonal_components)은 배치 실행 전이면 건너뜁니다.
+
+사용법 (backend 디렉토리에서 실행):
+    python -m benchmarks.bench_export                          # 데이터 마지막 31일
+    python -m benchmarks.bench_export 2025-03-01 2025-03-31    # 시작일, 종료일
+"""
+
+import asyncio
+import json
+import sys
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, List, Tuple
+
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet as pq
+
+from app.core.database import run_query
+from app.services.export_service import EXPORT_SOURCES, ExportFormat, ExportSource, export_service
+
+
+def _collect(source: ExportSource, start_date: date, end_date: date, file_format: ExportFormat) -> Tuple[bytes, float]:
+    started = time.perf_counter()
+    body = b"".join(export_service.stream(source, start_date, end_date, None, file_format))
+    return body, time.perf_counter() - started
+
+
+def _expected(value: Any, kind: str) -> Any:
+    """NDJSON 값(SQLite 원천 값)을 Arrow에서 읽은 값과 비교할 형태로 변환"""
+    if value is None:
+        return None
+    if kind == "date":
+        return str(value)[:10]
+    if kind == "timestamp":
+        return str(value).replace("T", " ")
+    return value
+
+
+def _actual(value: Any, kind: str) -> Any:
+    if value is None:
+        return None
+    if kind == "date":
+        return value.isoformat()
+    if kind == "timestamp":
+        return value.isoformat(sep=" ", timespec="microseconds" if value.microsecond else "seconds")
+    return value
+
+
+def _verify(source: ExportSource, arrow_body: bytes, parquet_body: bytes, ndjson_body: bytes) -> int:
+    """Arrow·Parquet을 다시 읽어 서로 같고 NDJSON 원천 값과 같은지 확인, 행 수 반환"""
+    arrow_table = pyarrow.ipc.open_stream(arrow_body).read_all()
+    parquet_table = pq.read_table(pa.BufferReader(parquet_body))
+    assert arrow_table.schema.equals(export_service.arrow_schema(source)), f"{source.name}: Arrow 스키마 불일치"
+    assert arrow_table.equals(parquet_table), f"{source.name}: Arrow와 Parquet 결과 불일치"
+
+    rows: List[Dict[str, Any]] = [json.loads(line) for line in ndjson_body.splitlines() if line]
+    assert arrow_table.num_rows == len(rows), f"{source.name}: 행 수 불일치 ({arrow_table.num_rows} != {len(rows)})"
+    for name, kind in source.columns:
+        actual = [_actual(value, kind) for value in arrow_table.column(name).to_pylist()]
+        expected = [_expected(row[name], kind) for row in rows]
+        if kind == "timestamp":
+            # 초 단위까지 비교 (원천 문자열의 소수점 자릿수가 일정하지 않음)
+            actual = [value[:19] if value else value for value in actual]
+            expected = [value[:19] if value else value for value in expected]
+        assert actual == expected, f"{source.name}.{name}: 값 불일치"
+    return len(rows)
+
+
+async def _default_range() -> Tuple[date, date]:
+    rows = await run_query("SELECT MAX(date) AS max_date FROM daily_sales_summary")
+    if not rows or not rows[0]["max_date"]:
+        raise SystemExit("daily_sales_summary 테이블에 데이터가 없습니다.")
+    end_date = date.fromisoformat(str(rows[0]["max_date"])[:10])
+    return end_date - timedelta(days=30), end_date
+
+
+def main() -> None:
+    if len(sys.argv) > 2:
+        start_date, end_date = date.fromisoformat(sys.argv[1]), date.fromisoformat(sys.argv[2])
+    else:
+        start_date, end_date = asyncio.run(_default_range())
+
+    formats = [ExportFormat.ARROW, ExportFormat.PARQUET, ExportFormat.NDJSON, ExportFormat.CSV]
+    print(f"기간: {start_date} ~ {end_date}  pyarrow {pa.__version__}")
+    print(f"{'테이블':<24}{'행 수':>10}" + "".join(f"{fmt.value + '(ms)':>14}{fmt.value + '(KB)':>14}" for fmt in formats))
+
+    for source in EXPORT_SOURCES.values():
+        if not export_service.source_ready(source):
+            print(f"{source.name:<24}{'(테이블 없음, 건너뜀)':>10}")
+            continue
+        outputs = {fmt: _collect(source, start_date, end_date, fmt) for fmt in formats}
+        rows = _verify(
+            source,
+            outputs[ExportFormat.ARROW][0],
+            outputs[ExportFormat.PARQUET][0],
+            outputs[ExportFormat.NDJSON][0]
+        )
+        print(f"{source.name:<24}{rows:>10,}" + "".join(
+            f"{seconds * 1000:>14.1f}{len(body) / 1024:>14.1f}" for body, seconds in outputs.values()
+        ))
+    print("Arrow IPC·Parquet 왕복 검증 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+예측 방법 정확도·속도 비교 (rolling origin)
+
+DB의 매장('전체' 포함) × 지표 일별 시계열로 예측 기준일을 한 주씩 옮겨 가며
+경량 예측 엔진(seasonal_naive, holt_winters, linear_weekday)과 ARIMA(7,1,1)의
+MAPE와 학습 시간을 비교합니다.
+
+사용법 (backend 디렉토리에서 실행):
+    python -m benchmarks.bench_forecast_accuracy
+    python -m benchmarks.bench_forecast_accuracy --origins 4 --horizon 7 --history-days 60
+    python -m benchmarks.bench_forecast_accuracy --skip-arima
+"""
+
+import argparse
+import asyncio
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List
+
+import numpy as np
+
+from app.core.database import run_query
+from app.services.fast_forecast import FAST_FORECAST_METHODS, fast_forecast
+from app.services.forecast_batch import ForecastBatchService
+from app.utils.time_series_models import fit_and_forecast, linear_trend_forecast
+
+
+def _mape(forecast: np.ndarray, actual: np.ndarray) -> float:
+    """실제값이 0인 날(휴무일)은 제외한 MAPE(%)"""
+    mask = actual != 0
+    if not mask.any():
+        return float("nan")
+    return float(np.mean(np.abs(forecast[mask] - actual[mask]) / np.abs(actual[mask])) * 100)
+
+
+async def _load_series(history_days: int, horizon: int, origins: int):
+    rows = await run_query("SELECT MAX(date) AS max_date FROM daily_sales_summary")
+    if not rows or not rows[0]["max_date"]:
+        raise SystemExit("daily_sales_summary 테이블에 데이터가 없습니다.")
+
+    last_date = date.fromisoformat(str(rows[0]["max_date"])[:10])
+    first_date = last_date - timedelta(days=history_days + horizon + 7 * (origins - 1) - 1)
+    daily = await ForecastBatchService.fetch_daily_series(first_date, last_date)
+    series = ForecastBatchService.build_series(daily, first_date, last_date, ForecastBatchService.METRICS)
+    return first_date, series
+
+
+def run(history_days: int, horizon: int, origins: int, skip_arima: bool) -> None:
+    first_date, series = asyncio.run(_load_series(history_days, horizon, origins))
+    keys = list(series.keys())
+    matrix = np.vstack([series[key] for key in keys])
+    n_series, n_days = matrix.shape
+    print(f"시계열 {n_series}개 (매장 {len({store for store, _ in keys})}개 × 지표), "
+          f"학습 {history_days}일, 예측 {horizon}일, 기준일 {origins}개")
+
+    methods = list(FAST_FORECAST_METHODS) + ([] if skip_arima else ["arima"])
+    errors: Dict[str, List[float]] = defaultdict(list)
+    seconds: Dict[str, float] = defaultdict(float)
+    fallbacks = 0
+
+    for k in range(origins):
+        # 가장 최근 기준일부터 한 주씩 과거로 이동
+        origin = n_days - horizon - 7 * k
+        train = matrix[:, origin - history_days:origin]
+        actual = matrix[:, origin:origin + horizon]
+        train_start = first_date + timedelta(days=origin - history_days)
+
+        for method in methods:
+            started = time.perf_counter()
+            if method == "arima":
+                forecast = np.empty_like(actual)
+                for i, values in enumerate(train):
+                    try:
+                        _, forecast[i], _ = fit_and_forecast(values, horizon)
+                    except Exception:
+                        forecast[i] = linear_trend_forecast(values, horizon)
+                        fallbacks += 1
+            else:
+                forecast, _ = fast_forecast(train, horizon, method, train_start)
+            seconds[method] += time.perf_counter() - started
+            errors[method].extend(_mape(forecast[i], actual[i]) for i in range(n_series))
+
+    fits = n_series * origins
+    print(f"\n{'method':<18}{'MAPE %':>10}{'median %':>10}{'total s':>10}{'ms/series':>12}")
+    print("-" * 60)
+    for method in methods:
+        values = np.array(errors[method])
+        print(f"{method:<18}{np.nanmean(values):>10.2f}{np.nanmedian(values):>10.2f}"
+              f"{seconds[method]:>10.3f}{seconds[method] / fits * 1000:>12.3f}")
+    if fallbacks:
+        print(f"\nARIMA 학습 실패로 선형 회귀 대체: {fallbacks}건")
+
+    # 지표별 MAPE
+    print(f"\n{'metric':<18}" + "".join(f"{method:>16}" for method in methods))
+    metric_index = np.array([metric for _, metric in keys] * origins)
+    for metric in ForecastBatchService.METRICS:
+        row = f"{metric:<18}"
+        for method in methods:
+            row += f"{np.nanmean(np.array(errors[method])[metric_index == metric]):>16.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="예측 방법 rolling-origin 비교")
+    parser.add_argument("--history-days", type=int, default=90)
+    parser.add_argument("--horizon", type=int, default=14)
+    parser.add_argument("--origins", type=int, default=8)
+    parser.add_argument("--skip-arima", action="store_true")
+    args = parser.parse_args()
+    run(args.history_days, args.horizon, args.origins, args.skip_arima)
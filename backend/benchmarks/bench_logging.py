@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+조회 경로 로깅 비용 벤치마크
+
+요청 하나가 남기는 로그를 기존 방식과 로그 정책 방식으로 재현해 초당 처리 가능한 요청 수를 비교합니다.
+- before: 호출마다 logger.setLevel, 청크·쿼리마다 f-string INFO 로그 4줄
+          (청크 조회, 테이블 접근, Query executed, 청크 데이터 개수) + 응답 샘플 직렬화
+- after:  세부 로그는 %-스타일 DEBUG (INFO 수준에서는 메시지를 만들지 않음),
+          청크·쿼리는 log_policy.count()로 카운터만 올리고 요청 요약 한 줄 기록
+- after+DEBUG: LOG_LEVEL=DEBUG에서 세부 로그를 샘플링·속도 제한 정책(LOG_POLICIES)으로 기록
+- 핸들러는 main.py와 같은 포맷으로 os.devnull에 기록합니다. (포맷·출력 비용 포함, 디스크 I/O 제외)
+
+/sales/hourly 는 1일 단위 청크로 조회하므로 90일 요청이면 청크 90개입니다.
+
+사용법 (backend 디렉토리에서 실행):
+    python -m benchmarks.bench_logging            # 청크 90개, 요청 300회
+    python -m benchmarks.bench_logging 30 1000    # 요청당 청크 수, 요청 수
+"""
+
+import logging
+import os
+import sys
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List
+
+from app.core import log_policy
+from app.core.log_policy import LogPolicy, PolicyFilter
+
+_ROW = {"date": "2025-03-01", "store_name": "명동점", "total_sales": 1_234_000, "actual_sales": 1_200_000,
+        "total_discount": 34_000, "transaction_count": 210, "avg_transaction": 5714.3}
+
+
+def _setup_handler() -> logging.Handler:
+    """main.py와 같은 포맷의 핸들러를 os.devnull에 연결"""
+    handler = logging.StreamHandler(open(os.devnull, "w", encoding="utf-8"))
+    handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s", "%Y-%m-%d %H:%M:%S"))
+    root = logging.getLogger()
+    root.handlers = [handler]
+    return handler
+
+
+def _request_before(chunks: int, rows: List[Dict]) -> None:
+    """기존 방식: 호출마다 setLevel, 청크·쿼리마다 eager f-string INFO"""
+    logger = logging.getLogger("bench.before.sales_service")
+    logger.setLevel(logging.INFO)
+    db_logger = logging.getLogger("bench.before.database")
+    start_date = date(2025, 1, 1)
+    end_date = start_date + timedelta(days=chunks - 1)
+    logger.info(f"시간대별 매출 조회 요청: start_date={start_date}, end_date={end_date}, store_name={None}")
+    current = start_date
+    total = 0
+    while current <= end_date:
+        logger.info(f"청크 조회: {current} ~ {current}")
+        db_logger.info(f"테이블 접근: {'receipt_sales_detail'}")
+        db_logger.info(f"Query executed: {'receipt_sales_detail'}, returned {len(rows)} rows")
+        logger.info(f"청크 데이터 개수: {len(rows)}")
+        total += len(rows)
+        current += timedelta(days=1)
+    logger.info(f"전체 조회된 데이터 개수: {total}")
+    logger.info(f"API 응답 샘플: {[dict(row) for row in rows[:2]]}")
+
+
+def _request_after(chunks: int, rows: List[Dict]) -> None:
+    """로그 정책 방식: %-스타일 DEBUG, 카운터 합산 후 요약 한 줄"""
+    logger = logging.getLogger("bench.after.sales_service")
+    db_logger = logging.getLogger("bench.after.database")
+    counters: Dict[str, int] = {}
+    token = log_policy._current_counters.set(counters)
+    started = time.perf_counter()
+    try:
+        start_date = date(2025, 1, 1)
+        end_date = start_date + timedelta(days=chunks - 1)
+        logger.debug("시간대별 매출 조회 요청: start_date=%s, end_date=%s, store_name=%s", start_date, end_date, None)
+        current = start_date
+        total = 0
+        while current <= end_date:
+            db_logger.debug("테이블 접근: %s", "receipt_sales_detail")
+            log_policy.count("queries")
+            log_policy.count("rows", len(rows))
+            db_logger.debug("Query executed: %s, returned %d rows", "receipt_sales_detail", len(rows))
+            log_policy.count("chunks")
+            total += len(rows)
+            current += timedelta(days=1)
+        logger.debug("전체 조회된 데이터 개수: %d", total)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("API 응답 샘플: %s", [dict(row) for row in rows[:2]])
+    finally:
+        log_policy._current_counters.reset(token)
+    log_policy.request_logger.info(
+        "method=%s path=%s status=%d duration_ms=%.1f%s", "GET", "/api/sales/hourly", 200,
+        (time.perf_counter() - started) * 1000, "".join(f" {key}={value}" for key, value in counters.items())
+    )
+
+
+def _throughput(func: Callable[[], None], requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        func()
+    return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    chunks = int(sys.argv[1]) if len(sys.argv) > 1 else 90
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    rows = [dict(_ROW) for _ in range(200)]
+    _setup_handler()
+
+    # 로그 정책 필터 (LOG_POLICIES와 같은 기본값)
+    for name in ("bench.after.sales_service", "bench.after.database"):
+        logging.getLogger(name).addFilter(PolicyFilter(LogPolicy(0.1, 20.0)))
+
+    print(f"요청당 청크: {chunks}  요청 수: {requests}")
+    print(f"{'방식':<16}{'로그 수준':>10}{'요청/초':>12}{'배수':>8}")
+
+    logging.getLogger().setLevel(logging.INFO)
+    before = _throughput(lambda: _request_before(chunks, rows), requests)
+    after = _throughput(lambda: _request_after(chunks, rows), requests)
+    logging.getLogger().setLevel(logging.DEBUG)
+    for name in ("bench.after.sales_service", "bench.after.database"):
+        logging.getLogger(name).setLevel(logging.DEBUG)
+    after_debug = _throughput(lambda: _request_after(chunks, rows), requests)
+
+    print(f"{'before':<16}{'INFO':>10}{before:>12.0f}{1.0:>8.1f}")
+    print(f"{'after':<16}{'INFO':>10}{after:>12.0f}{after / before:>8.1f}")
+    print(f"{'after':<16}{'DEBUG':>10}{after_debug:>12.0f}{after_debug / before:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
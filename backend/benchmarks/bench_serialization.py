@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+응답 직렬화 벤치마크
+
+대용량 응답 엔드포인트의 결과 생성·직렬화 시간을 비교합니다.
+- before: 행마다 검증 생성(Model(**row)) → FastAPI 응답 재검증(validate_python)
+          → dict 변환(dump_python) → json.dumps
+- after:  dict 목록 일괄 검증(TypeAdapter.validate_python) → TypeAdapter.dump_json
+          (app.core.responses.model_response)
+- 참고로 model_construct 생성 시간도 함께 표시합니다. (pydantic v2에서는 검증 생성보다 느림)
+- dict 응답(/sales/comparison)은 jsonable_encoder + json.dumps와 ORJSONResponse를 비교합니다.
+
+사용법 (backend 디렉토리에서 실행):
+    python -m benchmarks.bench_serialization          # 기본 규모 (매장 50, 제품 300, 365일)
+    python -m benchmarks.bench_serialization 2        # 규모 배수
+"""
+
+import json
+import sys
+import time
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+
+from app.core.responses import ORJSONResponse, get_type_adapter, orjson
+from app.models.kpi import KPITrend, KPITrendPoint
+from app.models.sales import DailySalesResponse, HourlyProductSalesResponse, HourlySalesResponse
+
+
+def _best_of(func: Callable[[], object], repeat: int) -> float:
+    """repeat회 실행 중 최소 시간(초)을 반환합니다."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _legacy_dumps(content: Any, response_type: Any) -> bytes:
+    """기존 FastAPI 경로: 응답 재검증 → dict 변환 → Starlette JSONResponse(json.dumps)"""
+    adapter = get_type_adapter(response_type)
+    validated = adapter.validate_python(content, from_attributes=True)
+    data = adapter.dump_python(validated, mode="json")
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def _hourly_rows(rng: np.random.Generator, stores: int) -> List[Dict[str, Any]]:
+    rows = []
+    for hour in range(24):
+        for store in range(stores):
+            total = int(rng.integers(0, 2_000_000))
+            count = int(rng.integers(1, 200))
+            rows.append({
+                "hour": hour,
+                "store_name": f"매장{store:03d}",
+                "total_sales": total,
+                "transaction_count": count,
+                "avg_transaction_value": total / count
+            })
+    return rows
+
+
+def _hourly_product_rows(rng: np.random.Generator, products: int) -> List[Dict[str, Any]]:
+    return [
+        {"hour": hour, "product_name": f"제품{product:04d}", "quantity": int(rng.integers(0, 500))}
+        for hour in range(24)
+        for product in range(products)
+    ]
+
+
+def _trend_rows(rng: np.random.Generator, days: int, stores: int) -> List[Dict[str, Any]]:
+    start = date(2024, 1, 1)
+    return [
+        {"date": start + timedelta(days=day), "store_name": f"매장{store:03d}", "value": float(rng.normal(1e6, 2e5))}
+        for store in range(stores)
+        for day in range(days)
+    ]
+
+
+def run(scale: int) -> None:
+    rng = np.random.default_rng(42)
+    stores, products, days = 50 * scale, 300 * scale, 365
+    trend_info = {"trend": "up", "growth_rate": 1.5, "slope": 10.0, "mean": 1e6, "std": 2e5, "min": 0.0, "max": 2e6}
+
+    hourly = _hourly_rows(rng, stores)
+    hourly_product = _hourly_product_rows(rng, products)
+    trend = _trend_rows(rng, days, stores // 5)
+
+    point_adapter = get_type_adapter(List[KPITrendPoint])
+    cases = [
+        (
+            "/sales/hourly", len(hourly), List[HourlySalesResponse],
+            lambda: [HourlySalesResponse(**row) for row in hourly],
+            lambda: get_type_adapter(List[HourlySalesResponse]).validate_python(hourly),
+            lambda: [HourlySalesResponse.model_construct(**row) for row in hourly],
+        ),
+        (
+            "/sales/products/hourly", len(hourly_product), List[HourlyProductSalesResponse],
+            lambda: [HourlyProductSalesResponse(**row) for row in hourly_product],
+            lambda: get_type_adapter(List[HourlyProductSalesResponse]).validate_python(hourly_product),
+            lambda: [HourlyProductSalesResponse.model_construct(**row) for row in hourly_product],
+        ),
+        (
+            "/kpi/trends", len(trend), KPITrend,
+            lambda: KPITrend(metric="total_sales", data=[KPITrendPoint(**row) for row in trend], trend_info=trend_info),
+            lambda: KPITrend(metric="total_sales", data=point_adapter.validate_python(trend), trend_info=trend_info),
+            lambda: KPITrend.model_construct(
+                metric="total_sales",
+                data=[KPITrendPoint.model_construct(**row) for row in trend],
+                trend_info=trend_info
+            ),
+        ),
+    ]
+
+    print(f"orjson: {'사용' if orjson is not None else '미설치 (표준 json)'}")
+    print(f"{'endpoint':<26}{'rows':>7}{'build ms':>18}{'construct':>11}{'serialize ms':>18}{'total ms':>18}{'speedup':>9}")
+    print(f"{'':<33}{'before / after':>18}{'ms':>11}{'before / after':>18}{'before / after':>18}")
+    print("-" * 107)
+
+    for name, rows, response_type, build_before, build_after, build_construct in cases:
+        before_content, after_content = build_before(), build_after()
+        adapter = get_type_adapter(response_type)
+        # 두 경로의 출력이 같은 JSON인지 확인
+        assert json.loads(_legacy_dumps(before_content, response_type)) == json.loads(adapter.dump_json(after_content))
+
+        build_old = _best_of(build_before, 5)
+        build_new = _best_of(build_after, 5)
+        build_construct_time = _best_of(build_construct, 5)
+        ser_old = _best_of(lambda: _legacy_dumps(before_content, response_type), 5)
+        ser_new = _best_of(lambda: adapter.dump_json(after_content), 5)
+        total_old, total_new = build_old + ser_old, build_new + ser_new
+        print(f"{name:<26}{rows:>7}"
+              f"{build_old * 1e3:>10.2f} /{build_new * 1e3:>6.2f}"
+              f"{build_construct_time * 1e3:>11.2f}"
+              f"{ser_old * 1e3:>10.2f} /{ser_new * 1e3:>6.2f}"
+              f"{total_old * 1e3:>10.2f} /{total_new * 1e3:>6.2f}"
+              f"{total_old / total_new:>8.1f}x")
+
+    # dict 응답 (일별 매출 목록을 포함한 기간 비교)
+    daily = [
+        DailySalesResponse.model_construct(
+            date=date(2024, 1, 1) + timedelta(days=day),
+            store_name=f"매장{store:03d}",
+            total_sales=int(rng.integers(0, 5_000_000)),
+            actual_sales=int(rng.integers(0, 5_000_000)),
+            total_discount=int(rng.integers(0, 100_000)),
+            transaction_count=int(rng.integers(0, 500)),
+            avg_transaction_value=float(rng.normal(20_000, 3_000))
+        )
+        for store in range(stores)
+        for day in range(90)
+    ]
+    comparison = {
+        "current_period": {"start_date": date(2024, 1, 1), "daily_data": daily},
+        "comparison_period": {"start_date": date(2023, 10, 3), "daily_data": daily},
+        "changes": {"sales_change": 1000, "sales_change_percentage": 1.5},
+    }
+    ser_old = _best_of(
+        lambda: json.dumps(jsonable_encoder(comparison), ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 5
+    )
+    ser_new = _best_of(lambda: ORJSONResponse(comparison), 5)
+    print(f"{'/sales/comparison (dict)':<26}{len(daily) * 2:>7}"
+          f"{'-':>18}{'-':>11}{ser_old * 1e3:>10.2f} /{ser_new * 1e3:>6.2f}"
+          f"{ser_old * 1e3:>10.2f} /{ser_new * 1e3:>6.2f}{ser_old / ser_new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1)
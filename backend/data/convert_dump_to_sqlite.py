@@ -6,8 +6,12 @@ SQL 덤프 파일을 SQLite 데이터베이스로 변환
 import sqlite3
 import os
 import re
+import sys
 import logging
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.core.data_version import SALES_TABLES, record_data_change, table_date_range, union_date_range
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -170,6 +174,10 @@ def convert_sql_dump_to_sqlite():
         
         conn.commit()
         
+        # 6. 데이터 버전 기록 (실행 중인 서버의 캐시 무효화)
+        start_date, end_date = union_date_range(*(table_date_range(conn, table) for table in SALES_TABLES))
+        record_data_change(conn, SALES_TABLES, start_date, end_date, source="convert_dump_to_sqlite")
+        
     except Exception as e:
         logger.error(f"오류 발생: {e}")
         conn.rollback()
@@ -7,8 +7,12 @@ SQLite 데이터베이스의 receipt_sales_detail 테이블을 다시 임포트
 import sqlite3
 import pandas as pd
 import os
+import sys
 import logging
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.core.data_version import record_data_change, table_date_range, union_date_range
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -34,6 +38,7 @@ def reimport_receipt_sales_detail():
         cursor.execute("SELECT COUNT(*) FROM receipt_sales_detail")
         old_count = cursor.fetchone()[0]
         logger.info(f"기존 레코드 수: {old_count}")
+        old_range = table_date_range(conn, 'receipt_sales_detail')
         
         # 기존 데이터 삭제
         logger.info("기존 receipt_sales_detail 데이터 삭제 중...")
@@ -68,6 +73,10 @@ def reimport_receipt_sales_detail():
         
         conn.commit()
         
+        # 데이터 버전 기록 - 교체 전후 날짜 범위 (실행 중인 서버의 캐시 무효화)
+        start_date, end_date = union_date_range(old_range, table_date_range(conn, 'receipt_sales_detail'))
+        record_data_change(conn, ['receipt_sales_detail'], start_date, end_date, source="reimport_receipt_sales")
+        
         # 결과 확인
         cursor.execute("SELECT COUNT(*) FROM receipt_sales_detail")
         new_count = cursor.fetchone()[0]
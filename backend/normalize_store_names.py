@@ -1,6 +1,8 @@
 import sqlite3
 import unicodedata
 
+from app.core.data_version import record_data_change
+
 # 데이터베이스 연결
 db_path = "/Users/youngouk/Desktop/LePain/DashBoard4/backend/data/LePain.db"
 conn = sqlite3.connect(db_path)
@@ -14,6 +16,7 @@ cursor.execute("SELECT DISTINCT store_name FROM receipt_sales_detail")
 stores = cursor.fetchall()
 print(f"Found {len(stores)} unique store names")
 
+changed_stores = set()
 for store in stores:
     old_name = store[0]
     # NFC로 정규화
@@ -23,12 +26,17 @@ for store in stores:
     if old_name != new_name:
         print(f"Converting: {repr(old_name)} -> {repr(new_name)}")
         cursor.execute("UPDATE receipt_sales_detail SET store_name = ? WHERE store_name = ?", (new_name, old_name))
+        changed_stores.update([old_name, new_name])
     else:
         print(f"Already normalized: {repr(old_name)}")
 
 # 변경사항 저장
 conn.commit()
 
+# 데이터 버전 기록 - 이름이 바뀐 매장의 전체 기간 (실행 중인 서버의 캐시 무효화)
+if changed_stores:
+    record_data_change(conn, ['receipt_sales_detail'], store_names=changed_stores, source="normalize_store_names")
+
 # 정규화 후 확인
 print("\nAfter normalization:")
 cursor.execute("SELECT DISTINCT store_name, HEX(store_name), LENGTH(store_name) FROM receipt_sales_detail")
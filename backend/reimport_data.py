@@ -2,6 +2,8 @@ import pandas as pd
 import sqlite3
 from datetime import datetime
 
+from app.core.data_version import record_data_change, table_date_range, union_date_range
+
 # CSV 파일 읽기
 csv_path = "/Users/youngouk/Desktop/LePain/DashBoard3/backend/data/receipt_sales_detail.csv"
 df = pd.read_csv(csv_path, encoding='utf-8-sig')
@@ -11,6 +13,9 @@ db_path = "/Users/youngouk/Desktop/LePain/DashBoard4/backend/data/LePain.db"
 conn = sqlite3.connect(db_path)
 cursor = conn.cursor()
 
+# 기존 데이터 범위 (데이터 버전 기록용)
+old_range = table_date_range(conn, 'receipt_sales_detail')
+
 # 기존 데이터 삭제
 print("기존 데이터 삭제 중...")
 cursor.execute("DELETE FROM receipt_sales_detail")
@@ -20,6 +25,10 @@ conn.commit()
 print("새 데이터 임포트 중...")
 df.to_sql('receipt_sales_detail', conn, if_exists='append', index=False)
 
+# 데이터 버전 기록 - 교체 전후 날짜 범위 (실행 중인 서버의 캐시 무효화)
+start_date, end_date = union_date_range(old_range, table_date_range(conn, 'receipt_sales_detail'))
+record_data_change(conn, ['receipt_sales_detail'], start_date, end_date, source="reimport_data")
+
 # 데이터 확인
 cursor.execute("SELECT COUNT(*) FROM receipt_sales_detail")
 total_count = cursor.fetchone()[0]
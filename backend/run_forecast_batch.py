@@ -0,0 +1,61 @@
+"""
+배치 예측 실행 스크립트
+
+모든 매장('전체' 포함) × 지표의 예측을 계산해 forecast_results 테이블에 저장합니다.
+매일 야간 실행을 권장합니다.
+
+사용법:
+    python run_forecast_batch.py [--end-date YYYY-MM-DD] [--history-days 90] [--horizon 60] [--workers N]
+
+cron 예시 (매일 03:00):
+    0 3 * * * cd /app/backend && python run_forecast_batch.py
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from datetime import date
+
+from app.core.config import settings
+from app.core.process_pool import ManagedProcessPool
+from app.services.forecast_batch import ForecastBatchService
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="매장·지표별 배치 예측")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=None,
+                        help="학습 기간 종료일 (기본값: 오늘)")
+    parser.add_argument("--history-days", type=int, default=settings.FORECAST_BATCH_HISTORY_DAYS,
+                        help="학습 기간 일수")
+    parser.add_argument("--horizon", type=int, default=settings.FORECAST_BATCH_HORIZON,
+                        help="저장할 예측 일수")
+    parser.add_argument("--metrics", nargs="+", default=None, choices=ForecastBatchService.METRICS,
+                        help="예측할 지표 (기본값: 전체)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="모델 학습 프로세스 수 (기본값: CPU 코어 수)")
+    return parser.parse_args()
+
+
+async def main(args):
+    # 배치 전용 풀 - 코어 수만큼 병렬 학습, 시계열 하나당 제한 시간은 서버 설정과 동일
+    pool = ManagedProcessPool(
+        max_workers=args.workers,
+        timeout=settings.PROCESS_POOL_TIMEOUT,
+        preload=("app.utils.time_series_models",)
+    )
+    try:
+        summary = await ForecastBatchService.run(
+            end_date=args.end_date,
+            history_days=args.history_days,
+            horizon=args.horizon,
+            metrics=args.metrics,
+            pool=pool
+        )
+    finally:
+        pool.shutdown()
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,54 @@
+"""
+시계열 분해 실행 스크립트
+
+모든 매장('전체' 포함) × 지표의 일별 시계열을 STL/MSTL로 분해해
+seasonal_components 테이블에 저장합니다. 매일 야간 실행을 권장합니다.
+
+사용법:
+    python run_seasonal_decomposition.py [--end-date YYYY-MM-DD] [--workers N]
+
+cron 예시 (매일 03:30):
+    30 3 * * * cd /app/backend && python run_seasonal_decomposition.py
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from datetime import date
+
+from app.core.config import settings
+from app.core.process_pool import ManagedProcessPool
+from app.services.seasonal_decomposition import SeasonalDecompositionService
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="매장·지표별 시계열 분해")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=None,
+                        help="분해 기간 종료일 (기본값: 데이터의 마지막 날짜)")
+    parser.add_argument("--metrics", nargs="+", default=None, choices=SeasonalDecompositionService.METRICS,
+                        help="분해할 지표 (기본값: 전체)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="분해 프로세스 수 (기본값: CPU 코어 수)")
+    return parser.parse_args()
+
+
+async def main(args):
+    pool = ManagedProcessPool(
+        max_workers=args.workers,
+        timeout=settings.PROCESS_POOL_TIMEOUT,
+        preload=("app.utils.time_series_models",)
+    )
+    try:
+        summary = await SeasonalDecompositionService.run(
+            end_date=args.end_date,
+            metrics=args.metrics,
+            pool=pool
+        )
+    finally:
+        pool.shutdown()
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))